@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark glossary term extraction
+Compares the shallow definition extractor with a full ast.walk over the
+Python files of a directory (the standard library by default)
+"""
+
+import argparse
+import ast
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.glossary import (  # noqa: E402
+    NO_DEFINITION,
+    iter_source_files,
+    may_define,
+    terms_from_tree,
+)
+
+
+def walk_terms(tree):
+    """The original extractor: visit every node of the tree"""
+    terms = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            doc = (ast.get_docstring(node) or "").strip()
+            terms.append((node.name, doc.splitlines()[0] if doc else NO_DEFINITION))
+    return terms
+
+
+def load_sources(directory, limit):
+    """Read up to limit parseable files as (path, bytes, source, tree)"""
+    sources = []
+    for path in iter_source_files(directory, use_gitignore=False):
+        if len(sources) >= limit:
+            break
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            source = data.decode('utf-8')
+            sources.append((path, data, source, ast.parse(source, path)))
+        except (OSError, ValueError, SyntaxError):
+            continue
+    return sources
+
+
+def best_time(func, repeat):
+    """Return the fastest of several runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--directory", default=os.path.dirname(os.__file__),
+                        help="directory to scan (default: the standard library)")
+    parser.add_argument("--limit", type=int, default=1000,
+                        help="maximum number of files (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measurement (default: 3)")
+    args = parser.parse_args()
+
+    sources = load_sources(args.directory, args.limit)
+    mismatches = [path for path, _, _, tree in sources
+                  if terms_from_tree(tree) != walk_terms(tree)]
+    if mismatches:
+        sys.exit(f"Extractors disagree on {len(mismatches)} files, "
+                 f"e.g. {mismatches[0]}")
+
+    trees = [tree for _, _, _, tree in sources]
+    walk_time = best_time(lambda: [walk_terms(tree) for tree in trees],
+                          args.repeat)
+    shallow_time = best_time(lambda: [terms_from_tree(tree) for tree in trees],
+                             args.repeat)
+    parse_time = best_time(lambda: [ast.parse(source) for _, _, source, _ in sources],
+                           args.repeat)
+    skipped = sum(not may_define(data) for _, data, _, _ in sources)
+
+    print(f"Files:               {len(sources):,} ({skipped:,} skipped by pre-filter)")
+    print(f"Parse:               {parse_time * 1000:,.1f} ms")
+    print(f"ast.walk extraction: {walk_time * 1000:,.1f} ms")
+    print(f"Shallow extraction:  {shallow_time * 1000:,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading large README structures
+Compares opening a .readmeproj project file with importing the same
+document from markdown
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.project_file import load_project, save_project  # noqa: E402
+from readme_editor.structured_template import (  # noqa: E402
+    create_readme_template,
+    export_markdown,
+    import_markdown,
+)
+
+
+def generate_markdown(sections):
+    """Generate a README with the given number of nested sections"""
+    lines = ["# Benchmark Project\n\nGenerated for benchmarking.\n"]
+    for i in range(sections):
+        level = 2 + i % 3
+        lines.append(f"\n{'#' * level} Section {i}\n\n")
+        lines.append(f"Content of section {i}.\n\n```python\nprint({i})\n```\n")
+    return "".join(lines)
+
+
+def best_time(func, repeat):
+    """Return the fastest of several runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=20000,
+                        help="number of sections to generate (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measurement (default: 3)")
+    args = parser.parse_args()
+
+    markdown = generate_markdown(args.sections)
+    root = create_readme_template()
+    import_markdown(markdown, root)
+    assert export_markdown(root) == markdown
+
+    with tempfile.TemporaryDirectory() as directory:
+        project_path = os.path.join(directory, "benchmark.readmeproj")
+        save_project(project_path, root)
+        assert export_markdown(load_project(project_path)) == markdown
+
+        def parse_markdown():
+            import_markdown(markdown, create_readme_template())
+
+        markdown_time = best_time(parse_markdown, args.repeat)
+        project_time = best_time(lambda: load_project(project_path), args.repeat)
+        save_time = best_time(lambda: save_project(project_path, root), args.repeat)
+        project_size = os.path.getsize(project_path)
+
+    print(f"Sections:            {args.sections:,}")
+    print(f"Markdown size:       {len(markdown.encode('utf-8')) / 1024:,.0f} KB")
+    print(f"Project file size:   {project_size / 1024:,.0f} KB")
+    print(f"Import markdown:     {markdown_time * 1000:,.1f} ms")
+    print(f"Load project file:   {project_time * 1000:,.1f} ms")
+    print(f"Save project file:   {save_time * 1000:,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ Package entry point for README Editor.
 Run with: python -m readme_editor
 """
 
+import multiprocessing
+
 try:
     # When executed as package: python -m readme_editor
     from readme_editor import ReadmeEditorApp  # type: ignore
@@ -13,6 +15,8 @@ except Exception:
 
 
 def main() -> None:
+    # Glossary generation parses files in worker processes
+    multiprocessing.freeze_support()
     app = ReadmeEditorApp()
     app.MainLoop()
 
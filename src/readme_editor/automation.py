@@ -0,0 +1,100 @@
+"""
+Automation Pipeline
+Runs the section generators concurrently for "Generate All"
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, List, NamedTuple, Optional
+
+try:
+    from .file_io import call_now  # type: ignore
+except ImportError:
+    from file_io import call_now  # type: ignore
+
+
+class PipelineStage(NamedTuple):
+    """A generator; run(cancelled) returns its result and may stop early
+    once the cancelled event is set"""
+    name: str
+    run: Callable[[threading.Event], Any]
+
+
+class StageResult(NamedTuple):
+    """What a stage produced (or the exception it raised) and its duration"""
+    name: str
+    value: Any
+    error: Optional[Exception]
+    seconds: float
+
+
+class AutomationPipeline:
+    """Run stages concurrently, each on its own worker thread.
+
+    Stages only compute results; applying them is left to on_done, so the
+    caller can update the document once for all of them. Callbacks are
+    passed through post like FileLoader's:
+        on_progress(stages_finished, total_stages, stage_result)
+        on_done(stage_results) - in the order the stages were given
+    Nothing is reported after cancel() has been called.
+    """
+
+    def __init__(self, stages: List[PipelineStage],
+                 on_done: Callable[[List[StageResult]], None],
+                 on_progress: Optional[Callable[[int, int, StageResult], None]] = None,
+                 post: Callable[..., None] = call_now):
+        self.stages = list(stages)
+        self._on_done = on_done
+        self._on_progress = on_progress
+        self._post = post
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start running the stages in the background"""
+        self._thread.start()
+
+    def cancel(self):
+        """Ask the stages to stop; the callbacks will not be called again"""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """Check if the pipeline was cancelled"""
+        return self._cancelled.is_set()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the pipeline thread to finish"""
+        self._thread.join(timeout)
+
+    def _report(self, callback, *args):
+        """Forward a result to the UI thread unless cancelled"""
+        if callback is not None and not self._cancelled.is_set():
+            self._post(self._deliver, callback, *args)
+
+    def _deliver(self, callback, *args):
+        """Run a callback on the UI thread, re-checking for cancellation"""
+        if not self._cancelled.is_set():
+            callback(*args)
+
+    def _run_stage(self, stage: PipelineStage) -> StageResult:
+        """Run one stage, timing it and capturing any failure"""
+        start = time.perf_counter()
+        try:
+            value, error = stage.run(self._cancelled), None
+        except Exception as exception:  # One failed stage spoils no others
+            value, error = None, exception
+        return StageResult(stage.name, value, error, time.perf_counter() - start)
+
+    def _run(self):
+        """Pipeline thread body"""
+        results: List[Optional[StageResult]] = [None] * len(self.stages)
+        with ThreadPoolExecutor(max_workers=max(len(self.stages), 1),
+                                thread_name_prefix="automation") as executor:
+            futures = {executor.submit(self._run_stage, stage): index
+                       for index, stage in enumerate(self.stages)}
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+                self._report(self._on_progress, done, len(self.stages), result)
+        self._report(self._on_done, results)
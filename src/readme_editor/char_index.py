@@ -0,0 +1,65 @@
+"""
+Character Index
+Maps the character offsets the editor works in to the UTF-8 byte
+positions of a Scintilla document
+"""
+
+from bisect import bisect_right
+from typing import List
+
+
+class CharacterIndex:
+    """Translate between character offsets and byte positions.
+
+    document is a StyledTextCtrl, or anything with its GetLineCount,
+    PositionFromLine, LineFromPosition, CountCharacters, PositionRelative
+    and GetLength methods. The character offset of each line start is
+    cached the first time a lookup passes it, so a lookup counts characters
+    within one line only; invalidate() forgets the lines after an edit.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self._chars: List[int] = [0]  # Character offsets of cached line starts
+        self._bytes: List[int] = [0]  # Byte positions of the same line starts
+
+    def invalidate(self, line: int):
+        """Forget the line starts after line, where an edit began"""
+        del self._chars[line + 1:]
+        del self._bytes[line + 1:]
+
+    def _index_next_line(self) -> bool:
+        """Cache the next line start; False once all lines are cached"""
+        line = len(self._bytes)
+        if line >= self.document.GetLineCount():
+            return False
+        start = self.document.PositionFromLine(line)
+        self._chars.append(self._chars[-1]
+                           + self.document.CountCharacters(self._bytes[-1], start))
+        self._bytes.append(start)
+        return True
+
+    def to_bytes(self, offset: int) -> int:
+        """Return the byte position of a character offset, clamped to the end"""
+        if offset <= 0:
+            return 0
+        while self._chars[-1] <= offset and self._index_next_line():
+            pass
+        line = bisect_right(self._chars, offset) - 1
+        rest = offset - self._chars[line]
+        if rest == 0:
+            return self._bytes[line]
+        # PositionRelative returns 0 when it would pass the end
+        position = self.document.PositionRelative(self._bytes[line], rest)
+        return position or self.document.GetLength()
+
+    def to_chars(self, position: int) -> int:
+        """Return the character offset of a byte position"""
+        if position <= 0:
+            return 0
+        line = self.document.LineFromPosition(position)
+        while len(self._bytes) <= line and self._index_next_line():
+            pass
+        line = min(line, len(self._bytes) - 1)
+        return self._chars[line] + self.document.CountCharacters(
+            self._bytes[line], position)
@@ -0,0 +1,450 @@
+"""
+Project Dependencies
+Reads PEP 508 requirements from requirements files, pyproject.toml,
+setup.py, setup.cfg and Pipfile for the dependency sections
+"""
+
+import ast
+import configparser
+import os
+import re
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import tomllib  # Python 3.11+
+    TOML_AVAILABLE = True
+except ImportError:
+    try:
+        import tomli as tomllib  # type: ignore
+        TOML_AVAILABLE = True
+    except ImportError:
+        TOML_AVAILABLE = False
+
+# Requirements files, in the order they are read
+REQUIREMENTS_FILES = ("requirements.txt",)
+DEV_REQUIREMENTS_FILES = ("requirements-dev.txt", "requirements_dev.txt",
+                          "dev-requirements.txt")
+
+# Extras and dependency groups that hold developer tools
+DEV_GROUPS = frozenset({'dev', 'develop', 'development', 'test', 'tests',
+                        'testing', 'lint', 'docs', 'doc'})
+
+
+class Requirement(NamedTuple):
+    """One PEP 508 requirement"""
+    name: str
+    extras: Tuple[str, ...] = ()
+    specifier: str = ""  # e.g. ">=4.2.0,<5"
+    marker: str = ""     # e.g. 'python_version < "3.11"'
+    url: str = ""
+    source: str = ""     # File the requirement was read from
+
+
+class ProjectDependencies(NamedTuple):
+    """Runtime and developer requirements of a project"""
+    runtime: List[Requirement]
+    dev: List[Requirement]
+    install: str          # Command installing the runtime requirements
+    dev_install: str      # Command installing the developer requirements
+    sources: List[str]    # Files read, relative to the project
+
+
+_NAME = r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?"
+_REQUIREMENT = re.compile(rf"""
+    ^(?P<name>{_NAME})\s*
+    (?:\[(?P<extras>[^\]]*)\])?\s*
+    (?:@\s*(?P<url>[^\s;]+)\s*
+      |\(?(?P<spec>[^;()]*?)\)?\s*)
+    (?:;\s*(?P<marker>.*?))?\s*$
+""", re.X)
+_CLAUSE = re.compile(r"^(~=|===|==|!=|<=|>=|<|>)\s*([^\s,;]+)$")
+
+
+def canonical_name(name: str) -> str:
+    """Normalize a project name (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_requirement(text: str, source: str = "") -> Optional[Requirement]:
+    """Parse a PEP 508 requirement string (None if it is not one)"""
+    match = _REQUIREMENT.match(text.strip())
+    if match is None:
+        return None
+    clauses = []
+    for clause in filter(None, (part.strip() for part in
+                                (match.group('spec') or "").split(','))):
+        parsed = _CLAUSE.match(clause)
+        if parsed is None:
+            return None
+        clauses.append(parsed.group(1) + parsed.group(2))
+    extras = tuple(extra.strip() for extra in
+                   (match.group('extras') or "").split(',') if extra.strip())
+    return Requirement(match.group('name'), extras, ",".join(clauses),
+                       (match.group('marker') or "").strip(),
+                       match.group('url') or "", source)
+
+
+# Parsed files by path, reused while the file's mtime and size match
+_file_cache: Dict[Tuple[str, str], Tuple[int, int, object]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(path: str, parser: Callable[[str], object]):
+    """Parse a file, or return the result of parsing it unchanged.
+
+    Returns None if the file does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), parser.__name__)
+    with _cache_lock:
+        entry = _file_cache.get(key)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+    result = parser(path)
+    with _cache_lock:
+        _file_cache[key] = (stat.st_mtime_ns, stat.st_size, result)
+    return result
+
+
+def _read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        return file.read()
+
+
+# Parsed entries of requirements files and setup.py: requirements, or paths
+# of requirements files read in their place when the entries are used, so
+# a cached parse never holds stale contents of another file
+Entry = Union[Requirement, str]
+
+
+def _parse_requirements_txt(path: str) -> List[Entry]:
+    """Return a requirements file's requirements and -r includes, in order"""
+    requirements: List[Entry] = []
+    source = os.path.basename(path)
+    text = re.sub(r"\\\r?\n", " ", _read_text(path))  # Line continuations
+    for line in text.splitlines():
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if not line:
+            continue
+        option = re.match(r"^(-r|--requirement)(?:\s+|=)?(\S+)", line)
+        if option:
+            requirements.append(os.path.join(os.path.dirname(path), option.group(2)))
+            continue
+        editable = re.match(r"^(-e|--editable)(?:\s+|=)(\S+)", line)
+        if editable:
+            egg = re.search(r"[#&]egg=([^&\s]+)", editable.group(2))
+            if egg:
+                requirements.append(Requirement(egg.group(1), url=editable.group(2),
+                                                source=source))
+            continue
+        if line.startswith('-'):
+            continue  # Constraints, index URLs and other pip options
+        # Per-requirement options such as --hash follow the requirement
+        line = re.split(r"\s+--?[A-Za-z]", line, 1)[0]
+        requirement = parse_requirement(line, source)
+        if requirement is not None:
+            requirements.append(requirement)
+    return requirements
+
+
+def read_requirements_file(path: str, seen: Optional[set] = None) -> List[Requirement]:
+    """Read a requirements file, following -r includes in place"""
+    seen = set() if seen is None else seen
+    path = os.path.normpath(path)
+    if path in seen:
+        return []  # Included twice, or an include cycle
+    seen.add(path)
+    requirements: List[Requirement] = []
+    for entry in _cached(path, _parse_requirements_txt) or ():
+        if isinstance(entry, str):
+            requirements.extend(read_requirements_file(entry, seen))
+        else:
+            requirements.append(entry)
+    return requirements
+
+
+def _load_toml(path: str) -> dict:
+    with open(path, 'rb') as file:
+        return tomllib.load(file)
+
+
+def _parse_strings(strings, source: str) -> List[Requirement]:
+    """Parse a list of requirement strings, skipping invalid entries"""
+    if isinstance(strings, str):
+        strings = strings.splitlines()
+    requirements = []
+    for text in strings or ():
+        if isinstance(text, str):
+            requirement = parse_requirement(text, source)
+            if requirement is not None:
+                requirements.append(requirement)
+    return requirements
+
+
+def _table_requirements(table, source: str) -> List[Requirement]:
+    """Requirements from a Pipfile or Poetry {name: version} table"""
+    requirements = []
+    for name, value in (table or {}).items():
+        if name.lower() == 'python' or not re.fullmatch(_NAME, name):
+            continue
+        specifier, extras, marker = "", (), ""
+        if isinstance(value, dict):
+            extras = tuple(value.get('extras', ()))
+            marker = value.get('markers', "")
+            value = value.get('version', "*")
+        if isinstance(value, str) and value.strip() not in ("", "*"):
+            specifier = value.strip()
+            if specifier[0].isdigit():
+                specifier = "==" + specifier
+        requirements.append(Requirement(name, extras, specifier, marker,
+                                        source=source))
+    return requirements
+
+
+def _parse_pyproject(path: str) -> Tuple[List[Requirement], Dict[str, List[Requirement]]]:
+    """Return pyproject.toml's requirements and its optional groups"""
+    data = _load_toml(path)
+    source = os.path.basename(path)
+    project = data.get('project', {})
+    runtime = _parse_strings(project.get('dependencies'), source)
+    groups: Dict[str, List[Requirement]] = {}
+    for name, strings in project.get('optional-dependencies', {}).items():
+        groups[name] = _parse_strings(strings, source)
+    for name, strings in data.get('dependency-groups', {}).items():
+        groups.setdefault(name, []).extend(
+            _parse_strings([s for s in strings if isinstance(s, str)], source))
+
+    poetry = data.get('tool', {}).get('poetry', {})
+    runtime += _table_requirements(poetry.get('dependencies'), source)
+    if 'dev-dependencies' in poetry:
+        groups.setdefault('dev', []).extend(
+            _table_requirements(poetry['dev-dependencies'], source))
+    for name, group in poetry.get('group', {}).items():
+        groups.setdefault(name, []).extend(
+            _table_requirements(group.get('dependencies'), source))
+    return runtime, groups
+
+
+def _parse_pipfile(path: str) -> Tuple[List[Requirement], List[Requirement]]:
+    """Return a Pipfile's packages and dev-packages"""
+    data = _load_toml(path)
+    source = os.path.basename(path)
+    return (_table_requirements(data.get('packages'), source),
+            _table_requirements(data.get('dev-packages'), source))
+
+
+def _parse_setup_cfg(path: str) -> Tuple[List[Requirement], Dict[str, List[Requirement]]]:
+    """Return setup.cfg's install_requires and extras_require"""
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(path, encoding='utf-8')
+    source = os.path.basename(path)
+    runtime = _parse_strings(config.get('options', 'install_requires', fallback=""),
+                             source)
+    groups = {}
+    if config.has_section('options.extras_require'):
+        for name, strings in config.items('options.extras_require'):
+            groups[name] = _parse_strings(strings, source)
+    return runtime, groups
+
+
+def _parse_setup_py(path: str) -> Tuple[List[Entry], Dict[str, List[Entry]]]:
+    """Return setup.py's install_requires and extras_require.
+
+    The script is never run: literal lists are read from its syntax tree,
+    and a call with a requirements file name as its argument (such as
+    read_requirements("requirements.txt")) stands for that file.
+    """
+    tree = ast.parse(_read_text(path), filename=path)
+    source = os.path.basename(path)
+    base_dir = os.path.dirname(path)
+    assigned = {target.id: node.value for node in tree.body
+                if isinstance(node, ast.Assign)
+                for target in node.targets if isinstance(target, ast.Name)}
+
+    def requirements_of(node) -> List[Entry]:
+        if isinstance(node, ast.Name) and node.id in assigned:
+            node = assigned[node.id]
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return _parse_strings([item.value for item in node.elts
+                                   if isinstance(item, ast.Constant)], source)
+        if isinstance(node, ast.Call):
+            for arg in node.args:
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str) \
+                        and arg.value.endswith('.txt'):
+                    return [os.path.join(base_dir, arg.value)]
+        return []
+
+    runtime: List[Entry] = []
+    groups: Dict[str, List[Entry]] = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+        if name != 'setup':
+            continue
+        for keyword in node.keywords:
+            value = keyword.value
+            if keyword.arg == 'install_requires':
+                runtime += requirements_of(value)
+            elif keyword.arg == 'tests_require':
+                groups.setdefault('test', []).extend(requirements_of(value))
+            elif keyword.arg == 'extras_require':
+                if isinstance(value, ast.Name) and value.id in assigned:
+                    value = assigned[value.id]
+                if isinstance(value, ast.Dict):
+                    for key, group in zip(value.keys, value.values):
+                        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                            groups.setdefault(key.value, []).extend(
+                                requirements_of(group))
+    return runtime, groups
+
+
+def _add_unique(target: List[Requirement], requirements, seen: set):
+    """Append requirements whose project is not listed yet, reading the
+    requirements files named in setup.py entries"""
+    for requirement in requirements:
+        if isinstance(requirement, str):
+            _add_unique(target, read_requirements_file(requirement), seen)
+            continue
+        name = canonical_name(requirement.name)
+        if name not in seen:
+            seen.add(name)
+            target.append(requirement)
+
+
+def collect_dependencies(project_dir: str) -> ProjectDependencies:
+    """Read every dependency file of a project in one pass.
+
+    Runtime requirements come from requirements.txt, pyproject.toml,
+    setup.py, setup.cfg and Pipfile, in that order; developer requirements
+    from the dev requirements files, dev/test extras and groups, and
+    Pipfile dev-packages. Each project is listed once, from the first file
+    naming it, and not repeated among the developer requirements. Parsed
+    files are cached until their mtime changes.
+    """
+    def path(name):
+        return os.path.join(project_dir, name)
+
+    runtime: List[Requirement] = []
+    dev: List[Requirement] = []
+    groups: Dict[str, List[Requirement]] = {}
+    pipfile_dev: List[Requirement] = []
+    sources: List[str] = []
+    seen: set = set()
+    install = dev_install = ""
+
+    for name in REQUIREMENTS_FILES:
+        if os.path.isfile(path(name)):
+            _add_unique(runtime, read_requirements_file(path(name)), seen)
+            sources.append(name)
+            install = install or f"pip install -r {name}"
+
+    parsers = [('setup.py', _parse_setup_py), ('setup.cfg', _parse_setup_cfg)]
+    if TOML_AVAILABLE:
+        parsers.insert(0, ('pyproject.toml', _parse_pyproject))
+    for name, parser in parsers:
+        try:
+            parsed = _cached(path(name), parser)
+        except (OSError, ValueError, SyntaxError, configparser.Error):
+            continue  # Unreadable; the other files still count
+        if parsed is not None:
+            _add_unique(runtime, parsed[0], seen)
+            for group, requirements in parsed[1].items():
+                groups.setdefault(group, []).extend(requirements)
+            sources.append(name)
+            install = install or "pip install ."
+
+    if TOML_AVAILABLE:
+        try:
+            parsed = _cached(path('Pipfile'), _parse_pipfile)
+        except (OSError, ValueError):
+            parsed = None
+        if parsed is not None:
+            _add_unique(runtime, parsed[0], seen)
+            pipfile_dev = parsed[1]
+            sources.append('Pipfile')
+            install = install or "pipenv install"
+
+    for name in DEV_REQUIREMENTS_FILES:
+        if os.path.isfile(path(name)):
+            _add_unique(dev, read_requirements_file(path(name)), seen)
+            sources.append(name)
+            dev_install = dev_install or f"pip install -r {name}"
+    dev_groups = [group for group in groups if group.lower() in DEV_GROUPS]
+    for group in dev_groups:
+        _add_unique(dev, groups[group], seen)
+    if dev_groups and not dev_install:
+        dev_install = f'pip install -e ".[{dev_groups[0]}]"'
+    _add_unique(dev, pipfile_dev, seen)
+    if pipfile_dev and not dev_install:
+        dev_install = "pipenv install --dev"
+
+    return ProjectDependencies(runtime, dev, install, dev_install, sources)
+
+
+def format_requirement(requirement: Requirement, installed=None) -> str:
+    """Return the markdown list item for a requirement.
+
+    With installed (a mapping of canonical names to installed.py's
+    InstalledDistribution), the installed version, license and summary
+    are added.
+    """
+    name = requirement.name
+    if requirement.extras:
+        name += f"[{','.join(requirement.extras)}]"
+    item = f"- **{name}**"
+    clauses = [clause for clause in requirement.specifier.split(',') if clause]
+    if len(clauses) == 1 and clauses[0].startswith('==') \
+            and not clauses[0].startswith('==='):
+        item += f" (version {clauses[0][2:]})"
+    elif clauses:
+        item += " " + ", ".join(re.sub(r"^([~=!<>]+)", r"\1 ", clause)
+                                for clause in clauses)
+    elif requirement.url:
+        item += f" from `{requirement.url}`"
+    if requirement.marker:
+        item += f" (when `{requirement.marker}`)"
+    if installed is not None:
+        item += _installed_note(installed.get(canonical_name(requirement.name)))
+    return item
+
+
+def _installed_note(distribution) -> str:
+    """Return the installed version, license and summary of a requirement"""
+    if distribution is None:
+        return " — *not installed*"
+    note = f" — installed {distribution.version}"
+    if distribution.license:
+        note += f", {distribution.license}"
+    if distribution.summary:
+        note += f": {distribution.summary}"
+    return note
+
+
+def format_dependencies(dependencies: ProjectDependencies, is_dev: bool = False,
+                        installed=None) -> str:
+    """Return the markdown for the Dependency or Install Developer Tools
+    section, annotated from installed if given (see format_requirement)"""
+    if is_dev:
+        content = "### Development Dependencies\n\n"
+        content += "These packages are required for development and testing:\n\n"
+        requirements, command = dependencies.dev, dependencies.dev_install
+    else:
+        content = "### Required Dependencies\n\n"
+        content += "This project requires the following Python packages:\n\n"
+        requirements, command = dependencies.runtime, dependencies.install
+
+    if not requirements:
+        return content + "No dependencies found."
+    content += "\n".join(format_requirement(requirement, installed)
+                         for requirement in requirements)
+    content += "\n\n"
+    content += "#### Install Development Dependencies\n\n" if is_dev \
+        else "#### Install Dependencies\n\n"
+    content += f"```bash\n{command}\n```"
+    return content
@@ -0,0 +1,119 @@
+"""
+Directory Listing Cache
+Remembers directory listings across file structure scans, keyed by path
+and directory modification time
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+try:
+    from .file_io import write_atomic  # type: ignore
+except ImportError:
+    from file_io import write_atomic  # type: ignore
+
+# Version of the cache file; caches in any other format are discarded
+CACHE_FORMAT = 1
+
+# Directories remembered; the least recently used are dropped beyond this
+MAX_CACHED_DIRS = 50000
+
+# A directory modified this close to when it was listed may have changed
+# again within the same mtime tick, so its listing is not trusted
+RACY_NS = 2 * 1000 ** 3
+
+# Bits of a cached entry's flags
+FLAG_DIR = 1
+FLAG_SYMLINK = 2
+
+
+class CachedEntry(NamedTuple):
+    """Stands in for the os.DirEntry of a cached listing"""
+    name: str
+    path: str
+    flags: int
+
+    def is_dir(self) -> bool:
+        return bool(self.flags & FLAG_DIR)
+
+    def is_symlink(self) -> bool:
+        return bool(self.flags & FLAG_SYMLINK)
+
+
+class DirectoryCache:
+    """Directory listings reused while a directory's mtime is unchanged.
+
+    Adding, removing or renaming an entry updates its directory's mtime, so
+    an unchanged mtime means an unchanged listing; only directories whose
+    mtime moved are scanned again. Safe to use from several scan threads.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path  # Cache file; None keeps the cache in memory only
+        # directory -> [mtime_ns, listed_ns, [[name, flags], ...]], in
+        # least recently used order
+        self._listings: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self._loaded = path is None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        """Read the cache file on first use"""
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('format') == CACHE_FORMAT:
+            self._listings = data.get('listings', {})
+
+    def scan(self, directory: str) -> List:
+        """Return the entries of a directory, from the cache if unchanged.
+
+        Raises OSError like os.scandir() if the directory cannot be read.
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            record = self._listings.pop(directory, None)
+            if record is not None and record[0] == mtime_ns \
+                    and record[1] - mtime_ns > RACY_NS:
+                self._listings[directory] = record
+                self.hits += 1
+                return [CachedEntry(name, os.path.join(directory, name), flags)
+                        for name, flags in record[2]]
+
+        listed_ns = time.time_ns()
+        with os.scandir(directory) as scanned:
+            entries = list(scanned)
+        names = [[entry.name,
+                  (FLAG_DIR if entry.is_dir() else 0)
+                  | (FLAG_SYMLINK if entry.is_symlink() else 0)]
+                 for entry in entries]
+        with self._lock:
+            self._listings[directory] = [mtime_ns, listed_ns, names]
+            self._dirty = True
+            self.misses += 1
+        return entries
+
+    def save(self):
+        """Write the cache file if anything changed"""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            names = list(self._listings)
+            for directory in names[:max(len(names) - MAX_CACHED_DIRS, 0)]:
+                del self._listings[directory]
+            data = json.dumps({'format': CACHE_FORMAT,
+                               'listings': self._listings},
+                              ensure_ascii=False, separators=(',', ':'))
+            self._dirty = False
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        write_atomic(self.path, data.encode('utf-8'))
@@ -0,0 +1,143 @@
+"""
+README Document Model
+Single authoritative copy of the document, shared by the General and
+Structured editors
+"""
+
+import hashlib
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+try:
+    from .markdown_sections import (  # type: ignore
+        MarkdownBlock, changed_range, split_markdown_sections)
+except ImportError:
+    from markdown_sections import (  # type: ignore
+        MarkdownBlock, changed_range, split_markdown_sections)
+
+
+def content_hash(content: str) -> str:
+    """Return a stable digest of document content"""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class DocumentChange(NamedTuple):
+    """A single edit: text[start:end] of the old document became text"""
+    start: int
+    end: int
+    text: str
+    version: int
+    origin: object  # Editor that made the change (None for file operations)
+
+
+class ReadmeDocument:
+    """Text buffer plus a section index that editors observe.
+
+    Editors push their edits in as change events and apply changes made by
+    others. An editor with uncommitted keystrokes registers itself as
+    pending instead of copying its whole buffer on every key; the edit is
+    committed the next time anyone reads the text.
+    """
+
+    def __init__(self, text: str = ""):
+        self._text = text
+        self.version = 0
+        self._observers: List[Callable[[DocumentChange], None]] = []
+        self._pending: Optional[Tuple[object, Callable[[], None]]] = None
+        self._hash: Optional[Tuple[int, str]] = None
+        self._sections: Optional[Tuple[int, List[MarkdownBlock]]] = None
+
+    @property
+    def text(self) -> str:
+        """The current document text, including pending editor changes"""
+        self.flush()
+        return self._text
+
+    @property
+    def content_hash(self) -> str:
+        """Digest of the current text (cached per version)"""
+        text = self.text
+        if self._hash is None or self._hash[0] != self.version:
+            self._hash = (self.version, content_hash(text))
+        return self._hash[1]
+
+    @property
+    def sections(self) -> List[MarkdownBlock]:
+        """Heading-delimited blocks of the current text (cached per version)"""
+        text = self.text
+        if self._sections is None or self._sections[0] != self.version:
+            self._sections = (self.version, split_markdown_sections(text))
+        return self._sections[1]
+
+    def section_range(self, index: int) -> Tuple[int, int]:
+        """Return the (start, end) offsets of a section block"""
+        blocks = self.sections
+        block = blocks[index]
+        end = blocks[index + 1].start if index + 1 < len(blocks) \
+            else len(self._text)
+        return block.start, end
+
+    def add_observer(self, callback: Callable[[DocumentChange], None]):
+        """Call callback with a DocumentChange after every edit"""
+        self._observers.append(callback)
+
+    def remove_observer(self, callback: Callable[[DocumentChange], None]):
+        """Stop notifying callback"""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def set_pending(self, origin: object, commit: Callable[[], None]):
+        """Register an editor whose buffer has edits not yet committed"""
+        if self._pending is not None and self._pending[0] is not origin:
+            self.flush()
+        self._pending = (origin, commit)
+
+    def has_pending(self) -> bool:
+        """Check if an editor has uncommitted edits"""
+        return self._pending is not None
+
+    @property
+    def pending_origin(self) -> object:
+        """The editor with uncommitted edits, if any"""
+        return self._pending[0] if self._pending is not None else None
+
+    def flush(self):
+        """Commit pending editor edits into the document"""
+        if self._pending is not None:
+            _, commit = self._pending
+            self._pending = None
+            commit()
+
+    def set_text(self, text: str, origin: object = None):
+        """Replace the document text, reporting only the range that changed"""
+        self._settle_pending(origin)
+        start, old_end, new_end = changed_range(self._text, text)
+        if start == old_end == new_end:
+            return
+        self._apply(start, old_end, text[start:new_end], origin)
+
+    def replace(self, start: int, end: int, text: str, origin: object = None):
+        """Replace text[start:end] with text"""
+        self._settle_pending(origin)
+        self._apply(start, end, text, origin)
+
+    def load(self, text: str, origin: object = None):
+        """Replace the whole document (e.g. when a file is opened)"""
+        # Uncommitted edits belong to the document being replaced
+        self._pending = None
+        self._apply(0, len(self._text), text, origin)
+
+    def _settle_pending(self, origin: object):
+        """Commit other editors' edits before applying a new one"""
+        if self._pending is not None:
+            if self._pending[0] is origin:
+                self._pending = None  # The edit being applied supersedes it
+            else:
+                self.flush()
+
+    def _apply(self, start: int, end: int, text: str, origin: object):
+        """Apply an edit and notify observers"""
+        self._text = self._text[:start] + text + self._text[end:]
+        self.version += 1
+        change = DocumentChange(start, end, text, self.version, origin)
+        for callback in list(self._observers):
+            callback(change)
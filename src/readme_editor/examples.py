@@ -0,0 +1,191 @@
+"""
+Example Code Ingestion
+Builds the Example Code section from a project's examples/ directory,
+bounded in size and skipping binary files
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional
+
+try:
+    from .file_tree import SKIP_NAMES, is_skipped_name  # type: ignore
+except ImportError:
+    from file_tree import SKIP_NAMES, is_skipped_name  # type: ignore
+
+# Bytes shown per example file, and for all examples together
+MAX_FILE_BYTES = 64 * 1024
+MAX_TOTAL_BYTES = 512 * 1024
+
+# Files are read in blocks; the first block decides if a file is binary
+READ_BLOCK_SIZE = 8192
+
+# Example files read concurrently
+READ_WORKERS = 8
+
+# Code fence info strings by file extension (lower case) or file name
+FENCE_LANGUAGES: Dict[str, str] = {
+    '.py': 'python', '.pyw': 'python', '.pyi': 'python',
+    '.ipynb': 'json', '.json': 'json',
+    '.js': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript',
+    '.jsx': 'jsx', '.ts': 'typescript', '.tsx': 'tsx',
+    '.sh': 'bash', '.bash': 'bash', '.zsh': 'bash',
+    '.ps1': 'powershell', '.bat': 'batch', '.cmd': 'batch',
+    '.c': 'c', '.h': 'c', '.cc': 'cpp', '.cpp': 'cpp', '.hpp': 'cpp',
+    '.cs': 'csharp', '.java': 'java', '.kt': 'kotlin', '.go': 'go',
+    '.rs': 'rust', '.rb': 'ruby', '.php': 'php', '.swift': 'swift',
+    '.r': 'r', '.jl': 'julia', '.lua': 'lua', '.pl': 'perl',
+    '.sql': 'sql', '.html': 'html', '.htm': 'html', '.css': 'css',
+    '.xml': 'xml', '.yaml': 'yaml', '.yml': 'yaml', '.toml': 'toml',
+    '.ini': 'ini', '.cfg': 'ini', '.md': 'markdown', '.rst': 'rst',
+    '.txt': 'text', '.csv': 'csv',
+    'Makefile': 'makefile', 'Dockerfile': 'dockerfile',
+    'CMakeLists.txt': 'cmake',
+}
+
+
+class ExampleFile(NamedTuple):
+    """The part of an example file shown in the README"""
+    rel_path: str
+    size: int
+    text: Optional[str]  # None for binary files
+    truncated: bool
+
+
+def fence_language(path: str) -> str:
+    """Return the code fence info string for a file (may be empty)"""
+    name = os.path.basename(path)
+    if name in FENCE_LANGUAGES:
+        return FENCE_LANGUAGES[name]
+    return FENCE_LANGUAGES.get(os.path.splitext(name)[1].lower(), "")
+
+
+def is_binary(block: bytes) -> bool:
+    """Guess from a file's first block whether it is binary"""
+    if b'\0' in block:
+        return True
+    # Mostly control characters outside of text whitespace
+    control = sum(byte < 32 and byte not in (9, 10, 12, 13) for byte in block)
+    return control > len(block) // 10
+
+
+def _format_size(size: int) -> str:
+    """Return a byte count in KB or MB"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def _cut(data: bytes, max_bytes: int) -> bytes:
+    """Cut data to at most max_bytes, ending at the last complete line"""
+    data = data[:max_bytes]
+    cut = data.rfind(b'\n')
+    return data[:cut + 1] if cut > 0 else data
+
+
+def read_example(path: str, rel_path: str,
+                 max_bytes: int = MAX_FILE_BYTES) -> ExampleFile:
+    """Read at most max_bytes of a file, streaming in blocks.
+
+    Binary files are recognised from their first block and not read
+    further; text cut at the cap ends at the last complete line.
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        block = file.read(READ_BLOCK_SIZE)
+        if is_binary(block):
+            return ExampleFile(rel_path, size, None, False)
+        blocks = [block]
+        read = len(block)
+        while block and read <= max_bytes:
+            block = file.read(min(READ_BLOCK_SIZE, max_bytes + 1 - read))
+            blocks.append(block)
+            read += len(block)
+    data = b"".join(blocks)
+    truncated = len(data) > max_bytes
+    if truncated:
+        data = _cut(data, max_bytes)
+    return ExampleFile(rel_path, size, data.decode('utf-8', errors='ignore'),
+                       truncated)
+
+
+def iter_example_paths(examples_dir: str,
+                       skip_names: FrozenSet[str] = SKIP_NAMES
+                       ) -> Iterator[str]:
+    """Yield the files below examples_dir in sorted order"""
+    for root_dir, dirnames, filenames in os.walk(examples_dir):
+        dirnames[:] = sorted(name for name in dirnames
+                             if not is_skipped_name(name, skip_names))
+        for name in sorted(filenames):
+            if not name.startswith('.'):
+                yield os.path.join(root_dir, name)
+
+
+def _fence(text: str) -> str:
+    """Return a backtick fence longer than any backtick run in text"""
+    longest = run = 0
+    for char in text:
+        run = run + 1 if char == '`' else 0
+        longest = max(longest, run)
+    return '`' * max(3, longest + 1)
+
+
+def format_example(example: ExampleFile) -> str:
+    """Return the markdown for one example file"""
+    heading = f"### {example.rel_path}\n\n"
+    if example.text is None:
+        return heading + f"*Binary file ({_format_size(example.size)}) not shown.*\n"
+    code = example.text.rstrip('\n')
+    fence = _fence(code)
+    markdown = f"{heading}{fence}{fence_language(example.rel_path)}\n{code}\n{fence}\n"
+    if example.truncated:
+        shown = _format_size(len(example.text.encode('utf-8')))
+        markdown += f"\n*Truncated: showing the first {shown} of {_format_size(example.size)}.*\n"
+    return markdown
+
+
+def collect_examples(examples_dir: str, project_dir: str,
+                     max_file_bytes: int = MAX_FILE_BYTES,
+                     max_total_bytes: int = MAX_TOTAL_BYTES,
+                     workers: int = READ_WORKERS) -> str:
+    """Return the markdown listing of the example files.
+
+    Files are read on a thread pool a batch at a time, in sorted order;
+    once max_total_bytes have been shown the remaining files are only
+    counted, not read.
+    """
+    paths = list(iter_example_paths(examples_dir))
+    parts: List[str] = []
+    budget = max_total_bytes
+
+    def read(path, max_bytes):
+        rel_path = os.path.relpath(path, project_dir).replace(os.sep, '/')
+        try:
+            return read_example(path, rel_path, max_bytes)
+        except OSError:
+            return ExampleFile(rel_path, 0, "", False)
+
+    shown = 0
+    workers = max(workers, 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while shown < len(paths) and budget > 0:
+            batch = paths[shown:shown + workers * 4]
+            max_bytes = min(max_file_bytes, budget)
+            for example in executor.map(read, batch, [max_bytes] * len(batch)):
+                if budget <= 0:
+                    break
+                if example.text is not None:
+                    data = example.text.encode('utf-8')
+                    if len(data) > budget:
+                        # Whatever is left of the total goes to this file
+                        example = example._replace(
+                            text=_cut(data, budget).decode('utf-8', errors='ignore'),
+                            truncated=True)
+                markdown = format_example(example)
+                parts.append(markdown)
+                budget -= len(markdown.encode('utf-8'))
+                shown += 1
+
+    if shown < len(paths):
+        parts.append(f"*{len(paths) - shown} more example files not shown.*\n")
+    return "\n".join(parts).strip() or "No examples found."
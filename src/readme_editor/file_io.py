@@ -0,0 +1,257 @@
+"""
+README File I/O
+Chunked file reading and atomic file writing that can run off the UI thread
+"""
+
+import codecs
+import hashlib
+import io
+import os
+import secrets
+import shutil
+import threading
+from typing import Callable, Iterator, Optional, Tuple
+
+# Bytes read per chunk; large enough to keep per-chunk overhead low, small
+# enough that progress updates and cancellation stay responsive
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def call_now(func, *args):
+    """Run a callback immediately (the default way of posting results)"""
+    func(*args)
+
+
+def iter_text_chunks(path: str, encoding: str = 'utf-8',
+                     chunk_size: int = READ_CHUNK_SIZE
+                     ) -> Iterator[Tuple[str, int, int]]:
+    """Read a text file in chunks, yielding (text, bytes_read, total_bytes).
+
+    Decoding is incremental, so multi-byte characters split across chunk
+    boundaries are handled, and newlines are translated exactly as
+    open(path, 'r') would translate them.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True)
+    with open(path, 'rb') as file:
+        total = os.fstat(file.fileno()).st_size
+        done = 0
+        while True:
+            data = file.read(chunk_size)
+            done += len(data)
+            text = decoder.decode(data, final=not data)
+            if text or not data:
+                yield text, done, max(total, done)
+            if not data:
+                return
+
+
+class FileLoader:
+    """Read and decode a file on a worker thread.
+
+    Callbacks are passed through post (e.g. wx.CallAfter) so they run on
+    the thread that owns the UI:
+        on_progress(bytes_read, total_bytes)
+        on_done(content)
+        on_error(exception)
+    Nothing is reported after cancel() has been called.
+    """
+
+    def __init__(self, path: str,
+                 on_done: Callable[[str], None],
+                 on_error: Callable[[Exception], None],
+                 on_progress: Optional[Callable[[int, int], None]] = None,
+                 post: Callable[..., None] = call_now,
+                 encoding: str = 'utf-8',
+                 chunk_size: int = READ_CHUNK_SIZE):
+        self.path = path
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_progress = on_progress
+        self._post = post
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start reading in the background"""
+        self._thread.start()
+
+    def cancel(self):
+        """Stop reading; the loader's callbacks will not be called again"""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """Check if the load was cancelled"""
+        return self._cancelled.is_set()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the worker thread to finish"""
+        self._thread.join(timeout)
+
+    def _report(self, callback, *args):
+        """Forward a result to the UI thread unless cancelled"""
+        if callback is not None and not self._cancelled.is_set():
+            self._post(self._deliver, callback, *args)
+
+    def _deliver(self, callback, *args):
+        """Run a callback on the UI thread, re-checking for cancellation"""
+        if not self._cancelled.is_set():
+            callback(*args)
+
+    def _run(self):
+        """Worker thread body"""
+        parts = []
+        try:
+            for text, done, total in iter_text_chunks(
+                    self.path, self.encoding, self.chunk_size):
+                if self._cancelled.is_set():
+                    return
+                parts.append(text)
+                self._report(self._on_progress, done, total)
+            content = "".join(parts)
+        except (OSError, UnicodeDecodeError) as error:
+            self._report(self._on_error, error)
+            return
+        self._report(self._on_done, content)
+
+
+def encode_text(content: str, encoding: str = 'utf-8') -> bytes:
+    """Encode text the way open(path, 'w') would write it"""
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode(encoding)
+
+
+def file_matches(path: str, data: bytes) -> bool:
+    """Check if a file already holds exactly data"""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        digest = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError:
+        return False
+    return digest.digest() == hashlib.sha1(data).digest()
+
+
+def _create_temp(directory: str, name: str) -> Tuple[int, str]:
+    """Create a new temporary file next to name and open it for writing.
+
+    Unlike tempfile.mkstemp() (which always uses mode 0600) the file is
+    created with mode 0666, so the process umask applies as it would to
+    a newly created target file.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        temp_path = os.path.join(
+            directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+def write_atomic(path: str, data: bytes):
+    """Replace a file's contents so readers see either old or new bytes.
+
+    The data is written to a temporary file in the same directory, flushed
+    to disk and renamed over the target; a crash mid-write leaves the
+    original file untouched. A symbolic link is followed, so the file it
+    points to is replaced and the link is kept.
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    handle, temp_path = _create_temp(directory, os.path.basename(path))
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    # Make the rename itself durable (not supported on Windows)
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class FileSaver:
+    """Write a file atomically on a worker thread.
+
+    The save is skipped when the file already holds the same bytes.
+    Callbacks are passed through post like FileLoader's:
+        on_done(written) - written is False if the save was skipped
+        on_error(exception)
+    Call run() instead of start() to save on the calling thread. After
+    join(), report_now() delivers the result without waiting for the
+    posted callback; either way the callback runs once.
+    """
+
+    def __init__(self, path: str, content: str,
+                 on_done: Callable[[bool], None],
+                 on_error: Callable[[Exception], None],
+                 post: Callable[..., None] = call_now,
+                 encoding: str = 'utf-8'):
+        self.path = path
+        self.content = content
+        self.encoding = encoding
+        self._on_done = on_done
+        self._on_error = on_error
+        self._post = post
+        self._outcome = None  # (callback, argument) once finished
+        self._delivered = False
+        self._thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        """Start saving in the background"""
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for a background save to finish"""
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def run(self):
+        """Save and report the result"""
+        try:
+            data = encode_text(self.content, self.encoding)
+            if file_matches(self.path, data):
+                written = False
+            else:
+                write_atomic(self.path, data)
+                written = True
+        except (OSError, UnicodeEncodeError) as error:
+            self._finish(self._on_error, error)
+            return
+        self._finish(self._on_done, written)
+
+    def _finish(self, callback, argument):
+        """Record the result and post its delivery"""
+        self._outcome = (callback, argument)
+        self._post(self._deliver)
+
+    def _deliver(self):
+        """Run the result callback, unless it has already run"""
+        if self._outcome is not None and not self._delivered:
+            self._delivered = True
+            callback, argument = self._outcome
+            callback(argument)
+
+    def report_now(self):
+        """Run the callback of a finished save on the calling thread"""
+        self._deliver()
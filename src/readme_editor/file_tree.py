@@ -0,0 +1,204 @@
+"""
+Project File Tree
+Renders a project's directory structure for the README
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import FrozenSet, List, Optional, Tuple
+
+try:
+    from .directory_cache import DirectoryCache  # type: ignore
+    from .ignore_rules import IgnoreMatcher  # type: ignore
+except ImportError:
+    from directory_cache import DirectoryCache  # type: ignore
+    from ignore_rules import IgnoreMatcher  # type: ignore
+
+# Directories that are never useful in a README file tree (build outputs,
+# caches, virtual environments and VCS metadata)
+SKIP_NAMES: FrozenSet[str] = frozenset({
+    '__pycache__', 'node_modules', '.git', '.venv', 'venv', 'env',
+    '.pytest_cache', '.mypy_cache', '.tox', 'dist', 'build', 'target',
+})
+
+# Entries listed per directory before the rest are summarized
+MAX_ENTRIES_PER_DIR = 50
+
+# Top-level subtrees scanned concurrently; directory I/O releases the GIL,
+# so threads help most on slow or network filesystems
+SCAN_WORKERS = 8
+
+# Seconds before an unfinished scan is cut short
+SCAN_TIMEOUT = 60.0
+
+
+def is_skipped_name(name: str,
+                    skip_names: FrozenSet[str] = SKIP_NAMES) -> bool:
+    """Check if a name is hidden or an unwanted directory"""
+    return name.startswith('.') or name in skip_names \
+        or name.endswith('.egg-info')
+
+
+def _should_skip(entry: os.DirEntry, skip_names: FrozenSet[str]) -> bool:
+    """Check if an entry is hidden or an unwanted directory"""
+    return is_skipped_name(entry.name, skip_names)
+
+
+def list_entries(path: str, skip_names: FrozenSet[str] = SKIP_NAMES,
+                 ignore: Optional[IgnoreMatcher] = None, rel_dir: str = "",
+                 cache: Optional[DirectoryCache] = None
+                 ) -> Tuple[List[os.DirEntry], Optional[IgnoreMatcher]]:
+    """Return a directory's visible entries, sorted by name.
+
+    ignore holds the rules in effect for the directory; its own .gitignore
+    (if any) is added, ignored entries are left out, and the rules for the
+    directory's children are returned with the entries. With a cache, an
+    unchanged directory is not scanned again.
+    """
+    if cache is not None:
+        scanned = cache.scan(path)
+    else:
+        with os.scandir(path) as entries:
+            scanned = list(entries)
+    if ignore is not None and rel_dir \
+            and any(entry.name == '.gitignore' for entry in scanned):
+        ignore = ignore.for_directory(path, rel_dir)
+    prefix = rel_dir + '/' if rel_dir else ""
+    entries = [entry for entry in scanned
+               if not _should_skip(entry, skip_names)
+               and (ignore is None
+                    or not ignore.is_ignored(prefix + entry.name, entry.is_dir()))]
+    entries.sort(key=lambda entry: entry.name)
+    return entries, ignore
+
+
+def write_tree(out: io.StringIO, path: str, prefix: str = "",
+               max_depth: int = 3, max_entries: int = MAX_ENTRIES_PER_DIR,
+               skip_names: FrozenSet[str] = SKIP_NAMES, depth: int = 0,
+               ignore: Optional[IgnoreMatcher] = None, rel_dir: str = "",
+               deadline: Optional[float] = None,
+               cache: Optional[DirectoryCache] = None):
+    """Write the tree lines below path to out.
+
+    Entry types come from scandir, so no extra stat call is made per
+    entry. Symlinked directories are listed but not descended into, and
+    ignored directories are pruned before they are scanned. Subdirectories
+    reached after deadline (a time.monotonic() value) are marked as timed
+    out instead of scanned.
+    """
+    if depth and deadline is not None and time.monotonic() > deadline:
+        out.write(f"{prefix}└── [Scan timed out]\n")
+        return
+    try:
+        entries, ignore = list_entries(path, skip_names, ignore, rel_dir,
+                                       cache)
+    except PermissionError:
+        out.write(f"{prefix}├── [Permission Denied]\n")
+        return
+
+    hidden = max(len(entries) - max_entries, 0)
+    if hidden:
+        entries = entries[:max_entries]
+    for i, entry in enumerate(entries):
+        is_last = i == len(entries) - 1 and not hidden
+        out.write(f"{prefix}{'└── ' if is_last else '├── '}{entry.name}\n")
+        if depth < max_depth and entry.is_dir() and not entry.is_symlink():
+            write_tree(out, entry.path, prefix + ("    " if is_last else "│   "),
+                       max_depth, max_entries, skip_names, depth + 1, ignore,
+                       f"{rel_dir}/{entry.name}" if rel_dir else entry.name,
+                       deadline, cache)
+    if hidden:
+        out.write(f"{prefix}└── … {hidden} more\n")
+
+
+def _subtree_text(*args) -> str:
+    """Render one subtree with write_tree() (run on a worker thread)"""
+    out = io.StringIO()
+    write_tree(out, *args)
+    return out.getvalue()
+
+
+def write_tree_parallel(out: io.StringIO, path: str, max_depth: int = 3,
+                        max_entries: int = MAX_ENTRIES_PER_DIR,
+                        skip_names: FrozenSet[str] = SKIP_NAMES,
+                        ignore: Optional[IgnoreMatcher] = None,
+                        deadline: Optional[float] = None,
+                        workers: int = SCAN_WORKERS,
+                        cache: Optional[DirectoryCache] = None):
+    """Write the same lines as write_tree(), scanning each top-level
+    subdirectory on a thread pool.
+
+    Subtrees are written back in sorted order once they finish, so the
+    output does not depend on scheduling. Subtrees still running at the
+    deadline are marked as timed out and left to wind down on their own.
+    """
+    try:
+        entries, ignore = list_entries(path, skip_names, ignore, "", cache)
+    except PermissionError:
+        out.write("├── [Permission Denied]\n")
+        return
+
+    hidden = max(len(entries) - max_entries, 0)
+    if hidden:
+        entries = entries[:max_entries]
+    executor = ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix="file-tree")
+    try:
+        parts = []
+        for i, entry in enumerate(entries):
+            is_last = i == len(entries) - 1 and not hidden
+            parts.append(f"{'└── ' if is_last else '├── '}{entry.name}\n")
+            if max_depth > 0 and entry.is_dir() and not entry.is_symlink():
+                child_prefix = "    " if is_last else "│   "
+                parts.append((child_prefix, executor.submit(
+                    _subtree_text, entry.path, child_prefix, max_depth,
+                    max_entries, skip_names, 1, ignore, entry.name, deadline,
+                    cache)))
+
+        for part in parts:
+            if isinstance(part, str):
+                out.write(part)
+                continue
+            child_prefix, future = part
+            timeout = None if deadline is None \
+                else max(deadline - time.monotonic(), 0)
+            try:
+                out.write(future.result(timeout))
+            except FutureTimeoutError:
+                future.cancel()
+                out.write(f"{child_prefix}└── [Scan timed out]\n")
+    finally:
+        executor.shutdown(wait=False)
+    if hidden:
+        out.write(f"└── … {hidden} more\n")
+
+
+def generate_file_tree(directory: str, max_depth: int = 3,
+                       max_entries: int = MAX_ENTRIES_PER_DIR,
+                       skip_names: FrozenSet[str] = SKIP_NAMES,
+                       use_gitignore: bool = True,
+                       workers: int = SCAN_WORKERS,
+                       timeout: Optional[float] = SCAN_TIMEOUT,
+                       cache: Optional[DirectoryCache] = None) -> str:
+    """Return the tree of a directory, starting with its name.
+
+    With use_gitignore, entries matched by .git/info/exclude, the root
+    .gitignore or a nested .gitignore are left out. Top-level subtrees are
+    scanned on up to workers threads (1 scans serially), and the scan stops
+    after timeout seconds (None for no limit). A cache reuses the listings
+    of directories unchanged since an earlier scan.
+    """
+    ignore = IgnoreMatcher.for_project(directory) if use_gitignore else None
+    deadline = None if timeout is None else time.monotonic() + timeout
+    out = io.StringIO()
+    out.write(f"{os.path.basename(directory)}/\n")
+    if workers > 1:
+        write_tree_parallel(out, directory, max_depth, max_entries,
+                            skip_names, ignore, deadline, workers, cache)
+    else:
+        write_tree(out, directory, "", max_depth, max_entries, skip_names,
+                   ignore=ignore, deadline=deadline, cache=cache)
+    return out.getvalue()
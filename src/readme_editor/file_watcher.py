@@ -0,0 +1,117 @@
+"""
+README File Watcher
+Polls the open file for changes made by other programs
+"""
+
+import hashlib
+import os
+import time
+from typing import NamedTuple, Optional
+
+try:
+    from .file_io import READ_CHUNK_SIZE  # type: ignore
+except ImportError:
+    from file_io import READ_CHUNK_SIZE  # type: ignore
+
+# How often the open file is checked, in milliseconds
+POLL_INTERVAL_MS = 1000
+
+# A change is reported once the file has been stable this long (seconds),
+# so a generator writing in bursts triggers a single reload
+DEBOUNCE_SECONDS = 1.0
+
+
+class FileState(NamedTuple):
+    """What the watcher knows about a file on disk"""
+    mtime_ns: int
+    size: int
+    digest: Optional[str]  # sha1 of the contents (None until needed)
+
+
+def stat_file(path: str) -> Optional[FileState]:
+    """Return the file's modification time and size (None if missing)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return FileState(stat.st_mtime_ns, stat.st_size, None)
+
+
+def hash_file(path: str) -> Optional[str]:
+    """Return the sha1 of a file's contents (None if unreadable)"""
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class FileWatcher:
+    """Detect external changes to one file by polling.
+
+    Only mtime and size are checked on each poll; the contents are hashed
+    once a change has settled, so touching a file without changing it is
+    not reported.
+    """
+
+    def __init__(self, debounce: float = DEBOUNCE_SECONDS):
+        self.debounce = debounce
+        self.path: Optional[str] = None
+        self._baseline: Optional[FileState] = None
+        self._last_seen: Optional[FileState] = None
+        self._reported: Optional[FileState] = None
+        self._changed_at = 0.0
+
+    def watch(self, path: Optional[str]):
+        """Watch path (None to stop), taking its current state as unchanged"""
+        self.path = path
+        self._baseline = None
+        if path is not None:
+            state = stat_file(path)
+            if state is not None:
+                self._baseline = state._replace(digest=hash_file(path))
+        self._last_seen = self._baseline
+        self._reported = None
+
+    def accept(self, state: Optional[FileState]):
+        """Treat a reported state as the new unchanged state"""
+        self._baseline = self._last_seen = state
+        self._reported = None
+
+    def poll(self, now: Optional[float] = None) -> Optional[FileState]:
+        """Return the new state once an external change has settled.
+
+        Each change is reported once; call accept() after handling it.
+        """
+        if self.path is None:
+            return None
+        now = time.monotonic() if now is None else now
+        state = stat_file(self.path)
+        if state is None:
+            return None  # Deleted or being replaced; wait for it to return
+
+        if self._same_stat(state, self._last_seen):
+            if self._same_stat(state, self._baseline) \
+                    or self._same_stat(state, self._reported) \
+                    or now - self._changed_at < self.debounce:
+                return None
+        else:
+            # Still changing: restart the debounce period
+            self._last_seen = state
+            self._changed_at = now
+            return None
+
+        state = state._replace(digest=hash_file(self.path))
+        if self._baseline is not None and state.digest == self._baseline.digest:
+            self.accept(state)  # Rewritten with identical contents
+            return None
+        self._last_seen = self._reported = state
+        return state
+
+    @staticmethod
+    def _same_stat(state: FileState, other: Optional[FileState]) -> bool:
+        return other is not None and state.mtime_ns == other.mtime_ns \
+            and state.size == other.size
@@ -0,0 +1,410 @@
+"""
+Glossary Generation
+Collects documented functions and classes from a project's Python sources
+"""
+
+import ast
+import fnmatch
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import (Callable, Dict, FrozenSet, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple)
+
+try:
+    from .file_io import call_now  # type: ignore
+    from .file_tree import SKIP_NAMES, is_skipped_name  # type: ignore
+    from .ignore_rules import IgnoreMatcher  # type: ignore
+    from .symbol_index import FileSymbols, SymbolIndex  # type: ignore
+except ImportError:
+    from file_io import call_now  # type: ignore
+    from file_tree import SKIP_NAMES, is_skipped_name  # type: ignore
+    from ignore_rules import IgnoreMatcher  # type: ignore
+    from symbol_index import FileSymbols, SymbolIndex  # type: ignore
+
+# Files scanned for terms, and files or directories left out, as globs;
+# a glob containing '/' matches the path relative to the project root,
+# any other glob matches the name alone
+GLOSSARY_INCLUDE: Tuple[str, ...] = ('*.py',)
+GLOSSARY_EXCLUDE: Tuple[str, ...] = ()
+
+NO_DEFINITION = "Definition not available."
+
+# Files parsed per worker task: enough to amortize sending the task to a
+# process, few enough for smooth progress
+PARSE_CHUNK_SIZE = 64
+
+# Below this many files, parsing in-process beats starting worker processes
+MIN_PARALLEL_FILES = 256
+
+_DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Nodes whose bodies can hold definitions: compound statements, except
+# handlers and match cases; expressions never can
+_BLOCKS = tuple(getattr(ast, name) for name in (
+    'FunctionDef', 'AsyncFunctionDef', 'ClassDef', 'If', 'For', 'AsyncFor',
+    'While', 'With', 'AsyncWith', 'Try', 'TryStar', 'ExceptHandler',
+    'Match', 'match_case') if hasattr(ast, name))
+
+
+def _matches(rel_path: str, globs: Sequence[str]) -> bool:
+    """Check a '/'-separated relative path against a set of globs"""
+    name = rel_path.rsplit('/', 1)[-1]
+    return any(fnmatch.fnmatchcase(rel_path if '/' in glob else name, glob)
+               for glob in globs)
+
+
+def iter_source_files(project_dir: str,
+                      include: Sequence[str] = GLOSSARY_INCLUDE,
+                      exclude: Sequence[str] = GLOSSARY_EXCLUDE,
+                      skip_names: FrozenSet[str] = SKIP_NAMES,
+                      use_gitignore: bool = True) -> Iterator[str]:
+    """Yield the project files to scan, in sorted order.
+
+    Skipped, excluded and git-ignored directories are pruned from the walk
+    before it descends into them, so virtual environments and dependency
+    trees cost nothing.
+    """
+    ignores: Dict[str, Optional[IgnoreMatcher]] = {
+        "": IgnoreMatcher.for_project(project_dir) if use_gitignore else None}
+    for root_dir, dirnames, filenames in os.walk(project_dir):
+        rel_dir = os.path.relpath(root_dir, project_dir).replace(os.sep, '/')
+        rel_dir = "" if rel_dir == '.' else rel_dir
+        ignore = ignores.pop(rel_dir)
+        if ignore is not None and rel_dir and '.gitignore' in filenames:
+            ignore = ignore.for_directory(root_dir, rel_dir)
+        prefix = rel_dir + '/' if rel_dir else ""
+
+        kept = []
+        for name in sorted(dirnames):
+            rel_path = prefix + name
+            if is_skipped_name(name, skip_names) or _matches(rel_path, exclude) \
+                    or (ignore is not None and ignore.is_ignored(rel_path, True)):
+                continue
+            kept.append(name)
+            ignores[rel_path] = ignore
+        dirnames[:] = kept  # Prune in place so os.walk skips the rest
+
+        for name in sorted(filenames):
+            rel_path = prefix + name
+            if _matches(rel_path, include) and not _matches(rel_path, exclude) \
+                    and not (ignore is not None
+                             and ignore.is_ignored(rel_path, False)):
+                yield os.path.join(root_dir, name)
+
+
+def iter_definitions(tree: ast.AST, nested_functions: bool = True
+                     ) -> Iterator[ast.AST]:
+    """Yield function and class definitions in ast.walk() order.
+
+    Only statement blocks are descended into, so the expressions that make
+    up most of a tree are never visited. Dropping subtrees that cannot hold
+    definitions keeps the remaining nodes in the same breadth-first order.
+    With nested_functions False, definitions inside functions are skipped.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        if isinstance(node, _DEFINITIONS):
+            yield node
+            if not nested_functions and isinstance(node, _FUNCTIONS):
+                continue
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                todo.extend(child for child in value
+                            if isinstance(child, _BLOCKS))
+
+
+def terms_from_tree(tree: ast.AST, nested_functions: bool = True
+                    ) -> List[Tuple[str, str]]:
+    """Return (name, first docstring line) for each function and class"""
+    terms = []
+    for node in iter_definitions(tree, nested_functions):
+        doc = (ast.get_docstring(node) or "").strip()
+        terms.append((node.name, doc.splitlines()[0] if doc else NO_DEFINITION))
+    return terms
+
+
+def extract_terms(source: str, filename: str = "<unknown>",
+                  nested_functions: bool = True) -> List[Tuple[str, str]]:
+    """Parse source and return its terms.
+
+    Raises SyntaxError (or ValueError) if the source does not parse.
+    """
+    return terms_from_tree(ast.parse(source, filename=filename),
+                           nested_functions)
+
+
+def may_define(data: bytes) -> bool:
+    """Cheap check that source bytes could hold a function or class"""
+    return b'def' in data or b'class' in data
+
+
+def read_source_file(path: str) -> Optional[FileSymbols]:
+    """Read one file's terms along with its mtime, size and hash.
+
+    A file that does not decode or parse has no terms; None is returned
+    only if the file cannot be read.
+    """
+    try:
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            data = file.read()
+    except OSError:
+        return None
+    # Without def or class there is nothing to find, so skip parsing
+    terms = _parse_terms(data, path) if may_define(data) else []
+    return FileSymbols(stat.st_mtime_ns, stat.st_size,
+                       hashlib.sha1(data).hexdigest(), terms)
+
+
+def _parse_terms(data: bytes, path: str) -> List[Tuple[str, str]]:
+    """Decode and parse source bytes (no terms if either fails)"""
+    try:
+        # Newlines translated as a text-mode read would
+        source = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        return extract_terms(source, path)
+    except Exception:
+        return []
+
+
+def parse_source_file(path: str) -> List[Tuple[str, str]]:
+    """Return the terms of one file (none if it cannot be read or parsed)"""
+    record = read_source_file(path)
+    return record.terms if record is not None else []
+
+
+def _parse_chunk(paths: List[str]) -> List[Optional[FileSymbols]]:
+    """Parse a chunk of files (run in a worker process)"""
+    return [read_source_file(path) for path in paths]
+
+
+def merge_terms(results: Iterable[List[Tuple[str, str]]]) -> Dict[str, str]:
+    """Merge per-file terms in file order; the first definition wins"""
+    terms: Dict[str, str] = {}
+    for found in results:
+        for name, definition in found:
+            terms.setdefault(name, definition)
+    return terms
+
+
+def scan_glossary_terms(project_dir: str,
+                        include: Sequence[str] = GLOSSARY_INCLUDE,
+                        exclude: Sequence[str] = GLOSSARY_EXCLUDE,
+                        use_gitignore: bool = True) -> Dict[str, str]:
+    """Map term names to definitions, parsing on the calling thread"""
+    return merge_terms(parse_source_file(path) for path in iter_source_files(
+        project_dir, include, exclude, use_gitignore=use_gitignore))
+
+
+class GlossaryScanner:
+    """Collect glossary terms on a worker thread.
+
+    Python parsing is CPU-bound, so files are parsed in chunks on a process
+    pool; chunk results are merged in file order, so the first definition
+    wins exactly as in scan_glossary_terms(). With a symbol index, only
+    files changed since they were indexed are parsed. Callbacks are passed
+    through post like FileLoader's:
+        on_progress(files_parsed, total_files)
+        on_done(terms)
+        on_error(exception)
+    Nothing is reported after cancel() has been called.
+    """
+
+    def __init__(self, project_dir: str,
+                 on_done: Callable[[Dict[str, str]], None],
+                 on_error: Callable[[Exception], None],
+                 on_progress: Optional[Callable[[int, int], None]] = None,
+                 post: Callable[..., None] = call_now,
+                 include: Sequence[str] = GLOSSARY_INCLUDE,
+                 exclude: Sequence[str] = GLOSSARY_EXCLUDE,
+                 use_gitignore: bool = True,
+                 workers: Optional[int] = None,
+                 chunk_size: int = PARSE_CHUNK_SIZE,
+                 index_path: Optional[str] = None):
+        # Absolute, so indexed paths do not depend on the working directory
+        self.project_dir = os.path.abspath(project_dir)
+        self.include = include
+        self.exclude = exclude
+        self.use_gitignore = use_gitignore
+        self.workers = workers  # None uses one process per CPU
+        self.chunk_size = chunk_size
+        self.index_path = index_path  # SymbolIndex database, if any
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_progress = on_progress
+        self._post = post
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start scanning in the background"""
+        self._thread.start()
+
+    def cancel(self):
+        """Stop scanning; the scanner's callbacks will not be called again"""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """Check if the scan was cancelled"""
+        return self._cancelled.is_set()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the worker thread to finish"""
+        self._thread.join(timeout)
+
+    def is_running(self) -> bool:
+        """Check if the worker thread is still scanning"""
+        return self._thread.is_alive()
+
+    def _report(self, callback, *args):
+        """Forward a result to the UI thread unless cancelled"""
+        if callback is not None and not self._cancelled.is_set():
+            self._post(self._deliver, callback, *args)
+
+    def _deliver(self, callback, *args):
+        """Run a callback on the UI thread, re-checking for cancellation"""
+        if not self._cancelled.is_set():
+            callback(*args)
+
+    def _parse_serial(self, chunks, results, done, total):
+        """Parse the chunks not yet parsed on this thread"""
+        done += sum(len(chunks[i]) for i in results)
+        for index, chunk in enumerate(chunks):
+            if index in results:
+                continue
+            if self._cancelled.is_set():
+                return
+            results[index] = _parse_chunk(chunk)
+            done += len(chunk)
+            self._report(self._on_progress, done, total)
+
+    def _parse_parallel(self, chunks, results, done, total):
+        """Parse chunks on a process pool, polling for cancellation"""
+        # Forking from this worker thread of a multithreaded GUI process
+        # can deadlock the children, so start them fresh
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"))
+        try:
+            pending = {executor.submit(_parse_chunk, chunk): index
+                       for index, chunk in enumerate(chunks)}
+            while pending:
+                if self._cancelled.is_set():
+                    for future in pending:
+                        future.cancel()
+                    return
+                finished, _ = wait(pending, timeout=0.1,
+                                   return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    results[index] = future.result()
+                    done += len(chunks[index])
+                if finished:
+                    self._report(self._on_progress, done, total)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _open_index(self) -> Optional[SymbolIndex]:
+        """Open the symbol index (a broken index only costs a full parse)"""
+        if self.index_path is None:
+            return None
+        try:
+            return SymbolIndex(self.index_path)
+        except (OSError, sqlite3.Error):
+            return None
+
+    def _run(self):
+        """Worker thread body"""
+        index = None
+        try:
+            paths = list(iter_source_files(
+                self.project_dir, self.include, self.exclude,
+                use_gitignore=self.use_gitignore))
+            total = len(paths)
+            found: List[Optional[List[Tuple[str, str]]]] = [None] * total
+            index = self._open_index()
+            if index is not None:
+                try:
+                    cached = index.fresh_symbols(self.project_dir, paths)
+                except sqlite3.Error:
+                    index.close()
+                    index, cached = None, {}
+                for i, path in enumerate(paths):
+                    found[i] = cached.get(path)
+
+            stale = [path for path, terms in zip(paths, found) if terms is None]
+            done = total - len(stale)
+            self._report(self._on_progress, done, total)
+            chunks = [stale[i:i + self.chunk_size]
+                      for i in range(0, len(stale), self.chunk_size)]
+            results: Dict[int, List] = {}
+            if len(stale) >= MIN_PARALLEL_FILES and self.workers != 1:
+                try:
+                    self._parse_parallel(chunks, results, done, total)
+                except (OSError, BrokenProcessPool):
+                    pass  # No worker processes here; finish on this thread
+            self._parse_serial(chunks, results, done, total)
+
+            # Keep what was parsed even if the scan was cancelled
+            records = {path: record
+                       for chunk_index, parsed in results.items()
+                       for path, record in zip(chunks[chunk_index], parsed)
+                       if record is not None}
+            if index is not None:
+                try:
+                    index.update(records)
+                    if not self._cancelled.is_set():
+                        index.prune(self.project_dir, paths)
+                except sqlite3.Error:
+                    pass
+        except OSError as error:
+            self._report(self._on_error, error)
+            return
+        finally:
+            if index is not None:
+                index.close()
+        if self._cancelled.is_set():
+            return
+        for i, path in enumerate(paths):
+            if found[i] is None:
+                record = records.get(path)
+                found[i] = record.terms if record is not None else []
+        self._report(self._on_done, merge_terms(found))
+
+
+def collect_glossary_terms(project_dir: str,
+                           cancelled: Optional[threading.Event] = None,
+                           **options) -> Optional[Dict[str, str]]:
+    """Run a GlossaryScanner and wait for its terms, for callers already
+    off the UI thread. Returns None if cancelled is set before the terms
+    are returned; options are passed on to GlossaryScanner."""
+    def is_cancelled():
+        return cancelled is not None and cancelled.is_set()
+
+    if is_cancelled():
+        return None
+    outcome: Dict[str, object] = {}
+    scanner = GlossaryScanner(
+        project_dir, lambda terms: outcome.setdefault('terms', terms),
+        lambda error: outcome.setdefault('error', error), **options)
+    scanner.start()
+    while scanner.is_running():
+        if is_cancelled():
+            scanner.cancel()
+            return None
+        scanner.join(0.1)
+    if is_cancelled():
+        return None
+    if 'error' in outcome:
+        raise outcome['error']  # type: ignore[misc]
+    if 'terms' not in outcome:
+        raise RuntimeError("Glossary scan stopped unexpectedly")
+    return outcome['terms']  # type: ignore[return-value]
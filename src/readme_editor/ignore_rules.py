@@ -0,0 +1,139 @@
+"""
+Ignore Rules
+Compiled .gitignore matching for project scans
+"""
+
+import os
+import re
+from typing import Iterable, List, NamedTuple, Pattern, Tuple
+
+
+class IgnorePattern(NamedTuple):
+    """One compiled line of an ignore file"""
+    regex: Pattern   # Matches paths relative to the ignore file's directory
+    negate: bool     # "!pattern" re-includes what earlier patterns ignored
+    dir_only: bool   # "pattern/" only matches directories
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression"""
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+    parts = [] if anchored else ['(?:.*/)?']
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i) and (i == 0 or pattern[i - 1] == '/'):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i) and i + 2 == len(pattern) \
+                and (i == 0 or pattern[i - 1] == '/'):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        elif pattern[i] == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                parts.append(re.escape('['))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body[0] in '!^':
+                body = '^' + body[1:]
+            parts.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end + 1
+        elif pattern[i] == '\\' and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return ''.join(parts) + '$'
+
+
+def parse_ignore_lines(lines: Iterable[str]) -> List[IgnorePattern]:
+    """Compile the lines of an ignore file"""
+    patterns = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        # Trailing spaces are ignored unless escaped
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        line = stripped
+        if not line or line.startswith('#'):
+            continue
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith('\\!') or line.startswith('\\#'):
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        try:
+            regex = re.compile(_translate(line))
+        except re.error:
+            continue  # Git skips patterns it cannot parse as well
+        patterns.append(IgnorePattern(regex, negate, dir_only))
+    return patterns
+
+
+def load_ignore_file(path: str) -> List[IgnorePattern]:
+    """Compile an ignore file (an unreadable file has no patterns)"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            return parse_ignore_lines(file)
+    except OSError:
+        return []
+
+
+class IgnoreMatcher:
+    """The ignore rules in effect for one directory of a project.
+
+    Rules are (base directory, patterns) pairs with paths relative to the
+    project root; later rules (deeper ignore files) take precedence, and
+    within a file the last matching pattern wins, as in git.
+    """
+
+    def __init__(self, rules: Tuple[Tuple[str, List[IgnorePattern]], ...] = ()):
+        self.rules = rules
+
+    @classmethod
+    def for_project(cls, root: str) -> 'IgnoreMatcher':
+        """Rules from .git/info/exclude and the root .gitignore"""
+        rules = []
+        for path in (os.path.join(root, '.git', 'info', 'exclude'),
+                     os.path.join(root, '.gitignore')):
+            patterns = load_ignore_file(path)
+            if patterns:
+                rules.append(("", patterns))
+        return cls(tuple(rules))
+
+    def for_directory(self, directory: str, rel_dir: str) -> 'IgnoreMatcher':
+        """Add the rules of a nested directory's .gitignore"""
+        patterns = load_ignore_file(os.path.join(directory, '.gitignore'))
+        if not patterns:
+            return self
+        return IgnoreMatcher(self.rules + ((rel_dir, patterns),))
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check a '/'-separated path relative to the project root"""
+        for base, patterns in reversed(self.rules):
+            if base:
+                if not rel_path.startswith(base + '/'):
+                    continue
+                path = rel_path[len(base) + 1:]
+            else:
+                path = rel_path
+            for pattern in reversed(patterns):
+                if pattern.dir_only and not is_dir:
+                    continue
+                if pattern.regex.match(path):
+                    return not pattern.negate
+        return False
@@ -0,0 +1,130 @@
+"""
+Installed Distributions
+Looks up what is installed in the active environment, for annotating the
+dependency sections with installed versions, licenses and summaries
+"""
+
+import os
+import sys
+import threading
+from importlib import metadata
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    from .dependencies import canonical_name  # type: ignore
+except ImportError:
+    from dependencies import canonical_name  # type: ignore
+
+# Longest License field shown as is; longer ones are usually the whole
+# license text, so the license classifier is shown instead
+MAX_LICENSE_LENGTH = 40
+
+# Core metadata fields read from each distribution
+_FIELDS = frozenset({'name', 'version', 'summary', 'license',
+                     'license-expression', 'classifier'})
+
+
+class InstalledDistribution(NamedTuple):
+    """What the environment has installed under a project name"""
+    name: str
+    version: str
+    license: str
+    summary: str
+
+
+def _read_headers(text: str) -> Dict[str, List[str]]:
+    """Return the wanted header fields of a METADATA or PKG-INFO file.
+
+    Only the header block is read; the description after the first blank
+    line can be long and is not needed.
+    """
+    fields: Dict[str, List[str]] = {}
+    values: Optional[List[str]] = None
+    for line in text.splitlines():
+        if not line:
+            break
+        if line[0] in ' \t':
+            # Continuation of the previous field
+            if values:
+                values[-1] += "\n" + line.strip()
+            continue
+        key, _, value = line.partition(':')
+        key = key.strip().lower()
+        values = fields.setdefault(key, []) if key in _FIELDS else None
+        if values is not None:
+            values.append(value.strip())
+    return fields
+
+
+def _license(fields: Dict[str, List[str]]) -> str:
+    """Return a short license name from the metadata fields"""
+    for key in ('license-expression', 'license'):
+        for value in fields.get(key, ()):
+            if value and value != "UNKNOWN" and '\n' not in value \
+                    and len(value) <= MAX_LICENSE_LENGTH:
+                return value
+    for classifier in fields.get('classifier', ()):
+        if classifier.startswith("License ::"):
+            return classifier.rsplit("::", 1)[-1].strip()
+    return ""
+
+
+def _first(fields: Dict[str, List[str]], key: str) -> str:
+    values = fields.get(key)
+    return values[0] if values else ""
+
+
+def scan_distributions(path: Sequence[str]) -> Dict[str, InstalledDistribution]:
+    """Map canonical project names to the distributions installed on path.
+
+    All distributions are found in one importlib.metadata pass; as on
+    import, the first one on the path wins.
+    """
+    installed: Dict[str, InstalledDistribution] = {}
+    for distribution in metadata.distributions(path=list(path)):
+        text = distribution.read_text('METADATA') \
+            or distribution.read_text('PKG-INFO') or ""
+        fields = _read_headers(text)
+        name = _first(fields, 'name')
+        if not name:
+            continue
+        installed.setdefault(canonical_name(name), InstalledDistribution(
+            name, _first(fields, 'version'), _license(fields),
+            _first(fields, 'summary')))
+    return installed
+
+
+def _path_stamp(path: Sequence[str]) -> Tuple[Optional[int], ...]:
+    """Modification times of the path directories, which change when
+    packages are installed or removed"""
+    stamps = []
+    for entry in path:
+        try:
+            stamps.append(os.stat(entry or os.curdir).st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+# Scans by environment (prefix and path), reused until a path directory changes
+_environment_cache: Dict[Tuple[str, Tuple[str, ...]],
+                         Tuple[Tuple[Optional[int], ...],
+                               Dict[str, InstalledDistribution]]] = {}
+_cache_lock = threading.Lock()
+
+
+def installed_distributions(path: Optional[Sequence[str]] = None
+                            ) -> Dict[str, InstalledDistribution]:
+    """Return the installed distributions of the active environment
+    (or of path), scanning only when the environment has changed"""
+    path = tuple(sys.path if path is None else path)
+    key = (sys.prefix, path)
+    stamp = _path_stamp(path)
+    with _cache_lock:
+        entry = _environment_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    installed = scan_distributions(path)
+    with _cache_lock:
+        _environment_cache[key] = (stamp, installed)
+    return installed
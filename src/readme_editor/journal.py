@@ -0,0 +1,195 @@
+"""
+README Edit Journal
+Append-only log of unsaved edits, replayed to recover after a crash
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+try:
+    from .file_io import write_atomic  # type: ignore
+except ImportError:
+    from file_io import write_atomic  # type: ignore
+
+# Version of the journal record format
+JOURNAL_FORMAT = 1
+
+# How often buffered records are written out, in milliseconds
+FLUSH_INTERVAL_MS = 2000
+
+# Once this many bytes of edits follow the snapshot, a new snapshot is taken
+COMPACT_BYTES = 1024 * 1024
+
+JOURNAL_NAME_PATTERN = re.compile(r'recovery-(\d+)\.jsonl$')
+
+
+class RecoveredSession(NamedTuple):
+    """Unsaved state rebuilt from a journal"""
+    journal_path: str
+    source_file: Optional[str]  # File the edits belong to (None if unsaved)
+    text: str                   # Document text after replaying edits
+    section_ops: List[Dict]     # Structured edits made after the last text edit
+    edit_count: int
+
+
+def replay_journal(path: str) -> Optional[RecoveredSession]:
+    """Rebuild the document from a journal file.
+
+    Returns None if the journal is unreadable or holds no edits after its
+    snapshot. A partially written last record (the crash) is ignored.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            lines = file.read().split('\n')
+    except OSError:
+        return None
+
+    text = None
+    source_file = None
+    section_ops: List[Dict] = []
+    edit_count = 0
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break
+        op = record.get('op')
+        if op == 'snapshot':
+            if record.get('format') != JOURNAL_FORMAT:
+                return None
+            text, source_file = record['text'], record.get('file')
+            section_ops, edit_count = [], 0
+        elif text is None:
+            return None
+        elif op == 'replace':
+            text = text[:record['start']] + record['text'] + text[record['end']:]
+            # Structured edits are part of the text once committed
+            section_ops = []
+            edit_count += 1
+        elif op in ('section', 'tree'):
+            section_ops.append(record)
+            edit_count += 1
+
+    if text is None or edit_count == 0:
+        return None
+    return RecoveredSession(path, source_file, text, section_ops, edit_count)
+
+
+def _process_alive(pid: int) -> bool:
+    """Check if another process with this id is running"""
+    if pid == os.getpid():
+        return True
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # Query limited info
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def find_orphaned_journals(directory: str) -> List[str]:
+    """Return journals left behind by editors that are no longer running"""
+    orphaned = []
+    for path in glob.glob(os.path.join(directory, "recovery-*.jsonl")):
+        match = JOURNAL_NAME_PATTERN.search(path)
+        if match and not _process_alive(int(match.group(1))):
+            orphaned.append(path)
+    return sorted(orphaned, key=os.path.getmtime, reverse=True)
+
+
+class EditJournal:
+    """Append-only journal of the edits made since the last save.
+
+    The journal starts with a snapshot of the document and then records
+    text replacements and structured section edits. Records are buffered
+    in memory (consecutive edits to the same section are merged) and
+    written in one append by flush(), so a keystroke costs a list append.
+    Each editor process writes its own journal file.
+    """
+
+    def __init__(self, directory: str, compact_bytes: int = COMPACT_BYTES):
+        self.directory = directory
+        self.path = os.path.join(directory, f"recovery-{os.getpid()}.jsonl")
+        self.compact_bytes = compact_bytes
+        self._buffer: List[Dict] = []
+        self._file = None
+        self._edit_bytes = 0
+
+    def start(self, text: str, source_file: Optional[str] = None):
+        """Begin a new journal from a snapshot of the document"""
+        self._close_file()
+        self._buffer = []
+        self._edit_bytes = 0
+        record = {'op': 'snapshot', 'format': JOURNAL_FORMAT,
+                  'file': source_file, 'text': text}
+        os.makedirs(self.directory, exist_ok=True)
+        write_atomic(self.path, self._encode(record).encode('utf-8'))
+        self._file = open(self.path, 'a', encoding='utf-8', newline='')
+
+    def record_change(self, start: int, end: int, text: str):
+        """Record that text[start:end] was replaced"""
+        self._buffer.append({'op': 'replace', 'start': start, 'end': end,
+                             'text': text})
+
+    def record_section(self, path: List[str], **fields):
+        """Record new field values (content, name) of a structured section"""
+        last = self._buffer[-1] if self._buffer else None
+        if last is not None and last['op'] == 'section' and last['path'] == path:
+            last.update(fields)
+        else:
+            self._buffer.append(dict(op='section', path=path, **fields))
+
+    def record_tree(self, sections: List[Dict]):
+        """Record the enabled flag of every structured section"""
+        if self._buffer and self._buffer[-1]['op'] == 'tree':
+            self._buffer.pop()
+        self._buffer.append({'op': 'tree', 'sections': sections})
+
+    def flush(self):
+        """Write buffered records to disk"""
+        if not self._buffer or self._file is None:
+            return
+        data = "".join(self._encode(record) for record in self._buffer)
+        self._buffer = []
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._edit_bytes += len(data)
+
+    def needs_compaction(self) -> bool:
+        """Check if enough edits piled up to warrant a new snapshot"""
+        return self._edit_bytes > self.compact_bytes
+
+    def close(self, remove: bool = True):
+        """Stop journaling, deleting the journal (e.g. on a clean exit)"""
+        self._close_file()
+        self._buffer = []
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _encode(record: Dict) -> str:
+        return json.dumps(record, ensure_ascii=False) + "\n"
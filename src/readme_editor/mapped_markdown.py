@@ -0,0 +1,99 @@
+"""
+Memory-Mapped Markdown
+Read-only access to huge markdown files through a heading offset index
+"""
+
+import mmap
+import re
+from typing import List, NamedTuple
+
+# Heading or fence line, matched directly on the mapped bytes so body lines
+# are skipped by the regex engine rather than visited one by one
+MAPPED_LINE_PATTERN = re.compile(
+    rb'^ {0,3}(?:(?P<fence>`{3,}|~{3,})'
+    rb'|(?P<hashes>#{1,6})[ \t]+(?P<title>[^\r\n]+?)[ \t]*\r?$)',
+    re.M)
+
+# Sections larger than this are shown truncated in viewer mode
+MAX_VIEW_BYTES = 2 * 1024 * 1024
+
+
+class MappedSection(NamedTuple):
+    """Byte range of one heading-delimited block of a mapped file"""
+    level: int   # Heading level (0 for the preamble)
+    title: str   # Heading text without the leading hashes
+    start: int   # Offset of the heading line
+    end: int     # Offset of the next heading (or the end of the file)
+
+
+def index_headings(data) -> List[MappedSection]:
+    """Build the heading offset index of markdown bytes in one scan.
+
+    data may be bytes or an mmap. Like split_markdown_sections(), the
+    first entry is always the preamble and headings inside fenced code
+    blocks are ignored.
+    """
+    starts = [(0, "", 0)]
+    fence = None
+    for match in MAPPED_LINE_PATTERN.finditer(data):
+        marker = match.group('fence')
+        if fence is not None:
+            # Inside a fence: only a matching closing fence ends it
+            if marker and marker[:1] == fence[:1] and len(marker) >= len(fence):
+                fence = None
+        elif marker:
+            fence = marker
+        else:
+            title = match.group('title').decode('utf-8', errors='replace')
+            starts.append((len(match.group('hashes')), title.strip(),
+                           match.start()))
+
+    sections = []
+    for i, (level, title, start) in enumerate(starts):
+        end = starts[i + 1][2] if i + 1 < len(starts) else len(data)
+        sections.append(MappedSection(level, title, start, end))
+    return sections
+
+
+class MappedMarkdown:
+    """A markdown file mapped into memory with its heading index.
+
+    Only the byte range of a requested section is ever decoded, so files
+    far larger than what fits comfortably in a text control can be browsed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as file:
+            try:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                self._data = b""  # Empty files cannot be mapped
+        self.sections = index_headings(self._data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """Size of the mapped file in bytes"""
+        return len(self._data)
+
+    def section_text(self, index: int, limit: int = MAX_VIEW_BYTES) -> str:
+        """Decode one section, truncated to about limit bytes"""
+        section = self.sections[index]
+        end = min(section.end, section.start + limit)
+        text = self._data[section.start:end].decode('utf-8', errors='replace')
+        if end < section.end:
+            text += (f"\n\n[Section truncated: showing {limit // 1024} KB "
+                     f"of {(section.end - section.start) // 1024} KB]\n")
+        return text
+
+    def close(self):
+        """Release the mapping"""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
@@ -0,0 +1,195 @@
+"""
+Markdown Section Scanner
+Splits markdown text into heading-delimited blocks without losing any text
+"""
+
+import re
+from typing import List, NamedTuple, Tuple
+
+# ATX heading ("## Title"), allowing up to three spaces of indentation
+HEADING_PATTERN = re.compile(r'^ {0,3}(#{1,6})[ \t]+(.+?)[ \t]*$')
+
+# Opening/closing line of a fenced code block
+FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+
+# A single line including its line ending (only \n, \r\n and \r end lines)
+LINE_PATTERN = re.compile(r'[^\r\n]*(?:\r\n|\n|\r)|[^\r\n]+$')
+
+
+class MarkdownBlock(NamedTuple):
+    """A heading line and the body text that follows it"""
+    heading: str  # Heading line including its line ending ("" for the preamble)
+    level: int    # Heading level (0 for the preamble)
+    title: str    # Heading text without the leading hashes
+    body: str     # Everything up to the next heading
+    start: int    # Offset of the heading line in the source text
+
+
+def split_line_ending(line: str) -> Tuple[str, str]:
+    """Split a line into its text and its line ending"""
+    if line.endswith('\r\n'):
+        return line[:-2], '\r\n'
+    if line.endswith('\n') or line.endswith('\r'):
+        return line[:-1], line[-1]
+    return line, ''
+
+
+def parse_heading(line: str):
+    """Return (level, title) for a heading line, or None"""
+    match = HEADING_PATTERN.match(split_line_ending(line)[0])
+    if not match:
+        return None
+    return len(match.group(1)), match.group(2).strip()
+
+
+def split_markdown_sections(text: str) -> List[MarkdownBlock]:
+    """Split markdown into blocks, one per heading.
+
+    The first block is always the preamble (text before the first heading,
+    possibly empty). Headings inside fenced code blocks are ignored, and
+    joining every block's heading and body reproduces the input exactly.
+    """
+    blocks = []
+    heading, level, title, start = "", 0, "", 0
+    body_lines = []
+    fence = None
+    offset = 0
+
+    for line_match in LINE_PATTERN.finditer(text):
+        line = line_match.group()
+        parsed = None
+        fence_match = FENCE_PATTERN.match(line)
+        if fence is not None:
+            # Inside a fence: only a matching closing fence ends it
+            if fence_match and fence_match.group(1)[0] == fence[0] \
+                    and len(fence_match.group(1)) >= len(fence):
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+        else:
+            parsed = parse_heading(line)
+
+        if parsed:
+            blocks.append(MarkdownBlock(heading, level, title,
+                                        "".join(body_lines), start))
+            heading, (level, title), start = line, parsed, offset
+            body_lines = []
+        else:
+            body_lines.append(line)
+        offset += len(line)
+
+    blocks.append(MarkdownBlock(heading, level, title, "".join(body_lines),
+                                start))
+    return blocks
+
+
+def split_padding(body: str) -> Tuple[str, str, str]:
+    """Split a section body into (leading blank lines, content, trailing whitespace)"""
+    match = re.match(r'((?:[ \t]*(?:\r\n|\n|\r))*)(.*?)(\s*)$', body, re.S)
+    return match.group(1), match.group(2), match.group(3)
+
+
+def changed_range(old: str, new: str) -> Tuple[int, int, int]:
+    """Return (start, old_end, new_end) bounding the text that differs.
+
+    old[start:old_end] is the replaced text and new[start:new_end] its
+    replacement. Prefix and suffix are found by bisection so the
+    comparisons run as slice compares rather than a per-character loop.
+    """
+    if old == new:
+        return len(old), len(old), len(new)
+    limit = min(len(old), len(new))
+
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = low
+
+    low, high = 0, limit - prefix
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[len(old) - middle:] == new[len(new) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    return prefix, len(old) - low, len(new) - low
+
+
+def _keyed_blocks(text: str) -> List[Tuple[Tuple[str, int], str]]:
+    """Key each block by its heading title and occurrence number"""
+    seen = {}
+    keyed = []
+    for block in split_markdown_sections(text):
+        occurrence = seen.get(block.title, 0)
+        seen[block.title] = occurrence + 1
+        keyed.append(((block.title, occurrence), block.heading + block.body))
+    return keyed
+
+
+def merge_sections(base: str, ours: str, theirs: str) -> Tuple[str, List[str]]:
+    """Three-way merge of markdown, one heading-delimited section at a time.
+
+    base is the text both sides started from. Sections changed on only one
+    side take that side's version; sections changed differently on both
+    sides are conflicts, which keep our version and are returned by title.
+    The merged text follows their section order, with sections we added
+    placed after the section that precedes them in ours.
+    """
+    if ours == base or ours == theirs:
+        return theirs, []
+    if theirs == base:
+        return ours, []
+
+    base_blocks = dict(_keyed_blocks(base))
+    our_list = _keyed_blocks(ours)
+    our_blocks = dict(our_list)
+    their_list = _keyed_blocks(theirs)
+    their_keys = {key for key, _ in their_list}
+    conflicts = []
+
+    def conflict(key):
+        conflicts.append(key[0] or "(text before the first heading)")
+
+    merged = []  # (key, text)
+    for key, their_text in their_list:
+        base_text = base_blocks.get(key)
+        our_text = our_blocks.get(key)
+        if our_text is None:
+            if base_text is None:
+                merged.append((key, their_text))  # Added by them
+            elif their_text != base_text:
+                conflict(key)  # We deleted it, they changed it
+                merged.append((key, their_text))
+            continue  # Otherwise deleted by us
+        if our_text == base_text or our_text == their_text:
+            merged.append((key, their_text))
+        elif their_text == base_text:
+            merged.append((key, our_text))
+        else:
+            conflict(key)
+            merged.append((key, our_text))
+
+    # Sections only we have: our additions, or ones they deleted
+    previous = None
+    for key, our_text in our_list:
+        if key not in their_keys:
+            base_text = base_blocks.get(key)
+            if our_text == base_text:
+                continue  # Deleted by them
+            if base_text is not None:
+                conflict(key)  # They deleted it, we changed it
+            keys = [merged_key for merged_key, _ in merged]
+            position = keys.index(previous) + 1 if previous in keys else len(merged)
+            merged.insert(position, (key, our_text))
+        previous = key
+
+    parts = []
+    for i, (_, text) in enumerate(merged):
+        if i < len(merged) - 1 and text and not text.endswith(('\n', '\r')):
+            text += '\n'  # Keep the next heading on its own line
+        parts.append(text)
+    return "".join(parts), conflicts
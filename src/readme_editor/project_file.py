@@ -0,0 +1,132 @@
+"""
+README Project Files
+Saves the structured section tree itself, including disabled sections
+"""
+
+import json
+from typing import Iterator, List
+
+try:
+    from .file_io import write_atomic  # type: ignore
+    from .structured_template import ReadmeSection, iter_sections  # type: ignore
+except ImportError:
+    from file_io import write_atomic  # type: ignore
+    from structured_template import ReadmeSection, iter_sections  # type: ignore
+
+PROJECT_EXTENSION = ".readmeproj"
+PROJECT_FORMAT = 1
+
+# Each section is one JSON array of these fields; trailing fields equal to
+# their defaults are left out
+FIELDS = ('depth', 'level', 'name', 'flags', 'content', 'heading',
+          'lead', 'trail', 'preamble')
+_DEFAULTS = (None, None, None, 0, "", None, "", "", "")
+
+# Bits of the flags field
+FLAG_OPTIONAL = 1
+FLAG_DISABLED = 2
+FLAG_DYNAMIC = 4
+
+# A heading in the standard "## Name" form is stored as the index of its
+# line ending instead of repeating the name
+LINE_ENDINGS = ("\n", "\r\n", "\r", "")
+
+
+def _encode_heading(section: ReadmeSection):
+    """Store the source heading, as a line ending index when standard"""
+    heading = section.source_heading
+    if heading:
+        prefix = "#" * section.level + " " + section.name
+        if heading.startswith(prefix) and heading[len(prefix):] in LINE_ENDINGS:
+            return LINE_ENDINGS.index(heading[len(prefix):])
+    return heading
+
+
+def _decode_heading(heading, level: int, name: str):
+    """Reverse _encode_heading()"""
+    if isinstance(heading, int):
+        return "#" * level + " " + name + LINE_ENDINGS[heading]
+    return heading
+
+
+def _section_record(section: ReadmeSection, depth: int) -> List:
+    """The JSON record of one section"""
+    flags = (FLAG_OPTIONAL if section.optional else 0) \
+        | (0 if section.enabled else FLAG_DISABLED) \
+        | (FLAG_DYNAMIC if section.dynamic else 0)
+    lead, trail = section.source_padding
+    record = [depth, section.level, section.name, flags, section.content,
+              _encode_heading(section), lead, trail, section.source_preamble]
+    while len(record) > 3 and record[-1] == _DEFAULTS[len(record) - 1]:
+        record.pop()
+    return record
+
+
+def iter_project_lines(root: ReadmeSection) -> Iterator[str]:
+    """Serialize a section tree as JSON lines.
+
+    The first line is a header; each following line is one section in
+    document order with its depth, so a reader can rebuild the tree while
+    streaming without holding more than the current branch.
+    """
+    header = {'format': 'readmeproj', 'version': PROJECT_FORMAT,
+              'fields': list(FIELDS)}
+    yield json.dumps(header) + "\n"
+    depths = {id(root): 0}
+    for section in iter_sections(root):
+        depth = depths[id(section)]
+        for child in section.children:
+            depths[id(child)] = depth + 1
+        yield json.dumps(_section_record(section, depth),
+                         ensure_ascii=False, separators=(',', ':')) + "\n"
+
+
+def save_project(path: str, root: ReadmeSection):
+    """Write a section tree to a project file (atomically)"""
+    write_atomic(path, "".join(iter_project_lines(root)).encode('utf-8'))
+
+
+def load_project(path: str) -> ReadmeSection:
+    """Read a section tree from a project file.
+
+    Raises ValueError if the file is not a project file this version can
+    read.
+    """
+    stack = []
+    root = None
+    with open(path, 'r', encoding='utf-8') as file:
+        header = json.loads(file.readline() or "null")
+        if not isinstance(header, dict) or header.get('format') != 'readmeproj':
+            raise ValueError(f"{path} is not a README project file")
+        if header.get('version') != PROJECT_FORMAT:
+            raise ValueError(
+                f"Unsupported project file version: {header.get('version')}")
+
+        for line in file:
+            record = json.loads(line)
+            if not isinstance(record, list) or len(record) < 3:
+                raise ValueError(f"{path} has a malformed section record")
+            (depth, level, name, flags, content, heading, lead, trail,
+             preamble) = record + list(_DEFAULTS[len(record):])
+
+            section = ReadmeSection(name, content,
+                                    bool(flags & FLAG_OPTIONAL), level,
+                                    bool(flags & FLAG_DYNAMIC))
+            section.enabled = not flags & FLAG_DISABLED
+            section.source_heading = _decode_heading(heading, level, name)
+            section.source_padding = (lead, trail)
+            section.source_preamble = preamble
+
+            if depth > len(stack) or (depth == 0 and root is not None):
+                raise ValueError(f"{path} has a malformed section tree")
+            del stack[depth:]
+            if stack:
+                stack[-1].add_child(section)
+                section.level = level  # add_child re-levels
+            else:
+                root = section
+            stack.append(section)
+
+    if root is None:
+        raise ValueError(f"{path} has no sections")
+    return root
@@ -7,8 +7,9 @@ Supports both general editing and structured project README templates
 import wx
 import wx.html
 import os
-import re
 import sys
+import threading
+import time
 import webbrowser
 from typing import Optional
 try:
@@ -30,10 +31,44 @@ except ImportError:
     PYMDOWN_AVAILABLE = False
 try:
     # Running package-import style
-    from .structured_template import create_readme_template, populate_tree_ctrl, ReadmeSection  # type: ignore
+    from .structured_template import create_readme_template, populate_tree_ctrl, ReadmeSection, import_markdown, export_markdown, patch_imported_markdown, iter_sections, snapshot_sections, restore_sections  # type: ignore
+    from .document_model import ReadmeDocument, content_hash  # type: ignore
+    from .session import file_stamp, load_session, save_session  # type: ignore
+    from .project_file import PROJECT_EXTENSION, load_project, save_project  # type: ignore
+    from .file_tree import generate_file_tree  # type: ignore
+    from .directory_cache import DirectoryCache  # type: ignore
+    from .glossary import GlossaryScanner, collect_glossary_terms, scan_glossary_terms  # type: ignore
+    from .automation import AutomationPipeline, PipelineStage  # type: ignore
+    from .update_batch import MODIFIED, TITLE, TREE, UpdateBatch  # type: ignore
+    from .examples import collect_examples  # type: ignore
+    from .dependencies import collect_dependencies, format_dependencies  # type: ignore
+    from .installed import installed_distributions  # type: ignore
+    from .file_io import FileLoader, FileSaver, iter_text_chunks  # type: ignore
+    from .styled_text import STC_AVAILABLE, StyledTextEditor  # type: ignore
+    from .file_watcher import FileWatcher, POLL_INTERVAL_MS  # type: ignore
+    from .markdown_sections import merge_sections  # type: ignore
+    from .mapped_markdown import MappedMarkdown  # type: ignore
+    from .journal import EditJournal, FLUSH_INTERVAL_MS, find_orphaned_journals, replay_journal  # type: ignore
 except Exception:
     # Fallback when running this file directly
-    from structured_template import create_readme_template, populate_tree_ctrl, ReadmeSection  # type: ignore
+    from structured_template import create_readme_template, populate_tree_ctrl, ReadmeSection, import_markdown, export_markdown, patch_imported_markdown, iter_sections, snapshot_sections, restore_sections  # type: ignore
+    from document_model import ReadmeDocument, content_hash  # type: ignore
+    from session import file_stamp, load_session, save_session  # type: ignore
+    from project_file import PROJECT_EXTENSION, load_project, save_project  # type: ignore
+    from file_tree import generate_file_tree  # type: ignore
+    from directory_cache import DirectoryCache  # type: ignore
+    from glossary import GlossaryScanner, collect_glossary_terms, scan_glossary_terms  # type: ignore
+    from automation import AutomationPipeline, PipelineStage  # type: ignore
+    from update_batch import MODIFIED, TITLE, TREE, UpdateBatch  # type: ignore
+    from examples import collect_examples  # type: ignore
+    from dependencies import collect_dependencies, format_dependencies  # type: ignore
+    from installed import installed_distributions  # type: ignore
+    from file_io import FileLoader, FileSaver, iter_text_chunks  # type: ignore
+    from styled_text import STC_AVAILABLE, StyledTextEditor  # type: ignore
+    from file_watcher import FileWatcher, POLL_INTERVAL_MS  # type: ignore
+    from markdown_sections import merge_sections  # type: ignore
+    from mapped_markdown import MappedMarkdown  # type: ignore
+    from journal import EditJournal, FLUSH_INTERVAL_MS, find_orphaned_journals, replay_journal  # type: ignore
 
 
 class CustomColorDialog(wx.Dialog):
@@ -168,6 +203,9 @@ class ReadmeEditorApp(wx.App):
 class MainFrame(wx.Frame):
     """Main application window"""
 
+    # Files above this size (in bytes) are offered the read-only viewer
+    LARGE_FILE_SIZE = 64 * 1024 * 1024
+
     def __init__(self):
         super().__init__(None, title="README Editor", size=(1200, 800))
 
@@ -176,6 +214,30 @@ class MainFrame(wx.Frame):
         self.is_modified = False
         self.preview_visible = False
 
+        # The one authoritative copy of the document; both editors observe it
+        self.document = ReadmeDocument()
+        self.file_loader = None  # FileLoader while a file is being opened
+        self.file_saver = None   # FileSaver while a save is running
+        self.current_project = None  # Last opened/saved project file
+
+        # Changes made to current_file by other programs are merged in;
+        # disk_text is what the file held when last loaded or saved
+        self.file_watcher = FileWatcher()
+        self.disk_text = ""
+        self._handling_external_change = False
+
+        # Unsaved edits are journaled so they can be recovered after a crash,
+        # and the open file and view state are restored on the next launch
+        data_dir = wx.StandardPaths.Get().GetUserDataDir()
+        self.journal = EditJournal(data_dir)
+        self.session_path = os.path.join(data_dir, "session.json")
+        # Directory listings are remembered between file structure scans
+        self.directory_cache = DirectoryCache(
+            os.path.join(data_dir, "directory_cache.json"))
+        # Functions and classes found by glossary generation, per file
+        self.symbol_index_path = os.path.join(data_dir, "symbols.sqlite3")
+        self.document.add_observer(self.on_document_journal)
+
         # Create UI components
         self.create_menu_bar()
         self.create_toolbar()
@@ -191,6 +253,15 @@ class MainFrame(wx.Frame):
         # Set up accelerator table for keyboard shortcuts
         self.setup_accelerators()
 
+        # Write journaled edits in batches
+        self.journal_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_journal_timer, self.journal_timer)
+        self.journal_timer.Start(FLUSH_INTERVAL_MS)
+        self.watch_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_watch_timer, self.watch_timer)
+        self.watch_timer.Start(POLL_INTERVAL_MS)
+        wx.CallAfter(self.recover_unsaved_edits)
+
     def create_menu_bar(self):
         """Create the menu bar"""
         menubar = wx.MenuBar()
@@ -200,11 +271,21 @@ class MainFrame(wx.Frame):
         file_menu.Append(wx.ID_NEW, "&New\tCtrl+N", "Create a new README file")
         file_menu.Append(wx.ID_OPEN, "&Open\tCtrl+O",
                          "Open an existing README file")
+        self.open_viewer_item = file_menu.Append(
+            wx.ID_ANY, "Open in &Viewer...",
+            "Browse a large markdown file read-only, one section at a time")
         file_menu.AppendSeparator()
         file_menu.Append(wx.ID_SAVE, "&Save\tCtrl+S", "Save the current file")
         file_menu.Append(wx.ID_SAVEAS, "Save &As\tCtrl+Shift+S",
                          "Save with a new name")
         file_menu.AppendSeparator()
+        self.open_project_item = file_menu.Append(
+            wx.ID_ANY, "Open &Project...",
+            "Open a README project with its full section structure")
+        self.save_project_item = file_menu.Append(
+            wx.ID_ANY, "Save P&roject...",
+            "Save the section structure, including disabled sections")
+        file_menu.AppendSeparator()
         file_menu.Append(wx.ID_EXIT, "E&xit\tCtrl+Q", "Exit the application")
         menubar.Append(file_menu, "&File")
 
@@ -234,6 +315,10 @@ class MainFrame(wx.Frame):
             wx.ID_ANY, "&Preview Panel\tF12", "Toggle markdown preview panel")
         self.toc_link_toggle_item = view_menu.AppendCheckItem(
             wx.ID_ANY, "&Link headers to TOC", "Append [Table of Contents] link to each header")
+        self.scintilla_toggle_item = view_menu.AppendCheckItem(
+            wx.ID_ANY, "S&cintilla General Editor",
+            "Edit in a Scintilla control, which stays fast with large documents")
+        self.scintilla_toggle_item.Enable(STC_AVAILABLE)
         menubar.Append(view_menu, "&View")
 
         # Format menu
@@ -325,6 +410,9 @@ class MainFrame(wx.Frame):
         # Bind menu events
         self.Bind(wx.EVT_MENU, self.on_new, id=wx.ID_NEW)
         self.Bind(wx.EVT_MENU, self.on_open, id=wx.ID_OPEN)
+        self.Bind(wx.EVT_MENU, self.on_open_viewer, self.open_viewer_item)
+        self.Bind(wx.EVT_MENU, self.on_open_project, self.open_project_item)
+        self.Bind(wx.EVT_MENU, self.on_save_project, self.save_project_item)
         self.Bind(wx.EVT_MENU, self.on_save, id=wx.ID_SAVE)
         self.Bind(wx.EVT_MENU, self.on_save_as, id=wx.ID_SAVEAS)
         self.Bind(wx.EVT_MENU, self.on_exit, id=wx.ID_EXIT)
@@ -341,6 +429,7 @@ class MainFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_toggle_preview,
                   self.preview_toggle_item)
         self.Bind(wx.EVT_MENU, self.on_toggle_toc_links, self.toc_link_toggle_item)
+        self.Bind(wx.EVT_MENU, self.on_toggle_scintilla, self.scintilla_toggle_item)
 
         # Format menu bindings
         self.Bind(wx.EVT_MENU, lambda evt: self.insert_header(1), self.h1_item)
@@ -545,6 +634,7 @@ class MainFrame(wx.Frame):
         if hasattr(
                 self,
                 'structured_editor') and self.structured_editor.template_root:
+            self.structured_editor.ensure_current()
             target_section = self.find_section_by_anchor(
                 self.structured_editor.template_root, target_anchor)
             if target_section:
@@ -664,24 +754,13 @@ class MainFrame(wx.Frame):
         old_page = event.GetOldSelection()
         new_page = event.GetSelection()
 
-        # Only synchronize if switching between different editors (not on initial load)
+        # Commit the editor being left; the other editor observes the
+        # shared document and picks up the change from there
         if old_page != -1:
-            # Synchronize content when switching between editors
-            if old_page == 1 and new_page == 0:
-                # Switching from structured to general editor
-                # Get the generated markdown from structured editor
-                structured_content = self.structured_editor.get_content()
-                self.general_editor.load_content(structured_content)
-                self.status_bar.SetStatusText(
-                    "Synchronized structured content to general editor")
-
-            elif old_page == 0 and new_page == 1:
-                # Switching from general to structured editor
-                # Get content from general editor and try to parse it
-                general_content = self.general_editor.get_content()
-                self.structured_editor.load_content(general_content)
-                self.status_bar.SetStatusText(
-                    "Synchronized general content to structured editor")
+            self.notebook.GetPage(old_page).commit_to_document()
+        if new_page == 1:
+            # The structure is only parsed once it is actually shown
+            self.structured_editor.ensure_current()
 
         # Update preview if visible
         if self.preview_visible:
@@ -825,6 +904,19 @@ class MainFrame(wx.Frame):
         if self.preview_visible:
             wx.CallAfter(self.update_preview)
 
+    def on_toggle_scintilla(self, event):
+        """Switch the General Editor between wx.TextCtrl and Scintilla"""
+        backend = GeneralEditor.SCINTILLA_BACKEND \
+            if self.scintilla_toggle_item.IsChecked() else GeneralEditor.TEXT_BACKEND
+        self.general_editor.set_backend(backend)
+        self.scintilla_toggle_item.Check(
+            self.general_editor.backend == GeneralEditor.SCINTILLA_BACKEND)
+        # The new control starts with the default look
+        self.general_editor.apply_appearance(
+            getattr(self, 'editor_font', None),
+            getattr(self, 'editor_text_colour', None),
+            getattr(self, 'editor_background_colour', None))
+
     def update_preview(self):
         """Update the preview content"""
         editor = self.get_current_editor()
@@ -1139,11 +1231,12 @@ class MainFrame(wx.Frame):
     def on_new(self, event):
         """Create a new file"""
         if self.check_save_before_action():
-            # Reset both editors to ensure consistency
-            self.general_editor.new_file()
-            self.structured_editor.new_file()
+            # Both editors reset themselves from the emptied document
+            self.document.load("")
             self.current_file = None
             self.is_modified = False
+            self.watch_current_file("")
+            self.restart_journal()
             self.update_title()
 
     def on_open(self, event):
@@ -1160,31 +1253,208 @@ class MainFrame(wx.Frame):
                     return
 
                 pathname = file_dialog.GetPath()
-                try:
-                    with open(pathname, 'r', encoding='utf-8') as file:
-                        content = file.read()
-                    
-                    # Load content into both editors to ensure consistency
-                    self.general_editor.load_content(content)
-                    self.structured_editor.load_content(content)
-                    
-                    self.current_file = pathname
-                    self.is_modified = False
-                    self.update_title()
-                    self.status_bar.SetStatusText(
-                        f"Opened: {os.path.basename(pathname)}")
-                except IOError:
-                    wx.LogError(f"Cannot open file '{pathname}'.")
-
-    def on_save(self, event):
+            self.open_file(pathname)
+
+    def open_file(self, pathname, state=None):
+        """Read a file on a worker thread and load it when done.
+
+        The file is read and decoded in chunks while a progress dialog
+        (which can cancel the load) keeps the UI responsive. state is the
+        file's view state from a session snapshot, if it is being restored.
+        """
+        if self.file_loader is not None:
+            return  # A file is already being opened
+
+        try:
+            size = os.path.getsize(pathname)
+        except OSError:
+            size = 0  # Reported by the loader
+        if size > self.LARGE_FILE_SIZE:
+            dlg = wx.MessageDialog(
+                self,
+                f"{os.path.basename(pathname)} is {size / 1048576:.0f} MB.\n\n"
+                "Open it in the read-only viewer instead? The viewer shows one "
+                "section at a time without loading the whole file.",
+                "Large File", wx.YES_NO | wx.CANCEL | wx.ICON_QUESTION)
+            result = dlg.ShowModal()
+            dlg.Destroy()
+            if result == wx.ID_YES:
+                self.open_viewer(pathname)
+                return
+            if result == wx.ID_CANCEL:
+                return
+
+        progress = wx.ProgressDialog(
+            "Opening File", f"Reading {os.path.basename(pathname)}...",
+            maximum=100, parent=self,
+            style=wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME
+            | wx.PD_REMAINING_TIME)
+
+        def finish():
+            self.file_loader = None
+            progress.Destroy()
+
+        def on_progress(done, total):
+            percent = done * 100 // total if total else 100
+            keep_going, _ = progress.Update(
+                min(percent, 99),
+                f"Reading {os.path.basename(pathname)}... "
+                f"{done / 1048576:.1f} of {total / 1048576:.1f} MB")
+            if not keep_going:
+                loader.cancel()
+                finish()
+                self.status_bar.SetStatusText("Open cancelled")
+
+        def on_done(content):
+            finish()
+            if state is not None:
+                self.structured_editor.prepare_restore(state, content)
+            # Both editors observe the document and load from it
+            self.document.load(content)
+
+            self.current_file = pathname
+            self.is_modified = False
+            self.watch_current_file(content)
+            self.restart_journal()
+            if state is not None:
+                self.notebook.SetSelection(state.get('page', 0))
+                self.general_editor.set_cursor(state.get('cursor', 0))
+            self.update_title()
+            self.status_bar.SetStatusText(
+                f"Opened: {os.path.basename(pathname)}")
+
+        def on_error(error):
+            finish()
+            wx.LogError(f"Cannot open file '{pathname}'.")
+
+        loader = FileLoader(pathname, on_done, on_error, on_progress,
+                            post=wx.CallAfter)
+        self.file_loader = loader
+        loader.start()
+
+    def on_open_viewer(self, event):
+        """Open a file in the read-only viewer"""
+        if self.check_save_before_action():
+            with wx.FileDialog(
+                    self,
+                    "Open README file in viewer",
+                    wildcard=
+                    "Markdown files (*.md)|*.md|Text files (*.txt)|*.txt|All files (*.*)|*.*",
+                    style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as file_dialog:
+
+                if file_dialog.ShowModal() == wx.ID_CANCEL:
+                    return
+
+                pathname = file_dialog.GetPath()
+            self.open_viewer(pathname)
+
+    def open_viewer(self, pathname):
+        """Memory-map a file and browse it section by section"""
+        try:
+            mapped = MappedMarkdown(pathname)
+        except OSError:
+            wx.LogError(f"Cannot open file '{pathname}'.")
+            return
+
+        # Leave the editors empty; nothing is copied out of the mapping
+        # except the selected section
+        self.document.load("")
+        self.general_editor.text_ctrl.SetEditable(False)
+        self.structured_editor.show_viewer(mapped)
+
+        self.current_file = None
+        self.is_modified = False
+        self.watch_current_file("")
+        self.restart_journal()
+        self.notebook.SetSelection(1)
+        self.update_title()
+        self.status_bar.SetStatusText(
+            f"Viewing (read-only): {os.path.basename(pathname)}, "
+            f"{len(mapped.sections) - 1} sections")
+
+    def on_open_project(self, event):
+        """Open a project file with its full section structure"""
+        if not self.check_save_before_action():
+            return
+        with wx.FileDialog(
+                self,
+                "Open README project",
+                wildcard=f"README projects (*{PROJECT_EXTENSION})|*{PROJECT_EXTENSION}",
+                style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as file_dialog:
+
+            if file_dialog.ShowModal() == wx.ID_CANCEL:
+                return
+
+            pathname = file_dialog.GetPath()
+        try:
+            root = load_project(pathname)
+        except (OSError, ValueError) as error:
+            wx.LogError(f"Cannot open project '{pathname}': {error}")
+            return
+
+        # The tree is used as-is; the document is generated from it
+        self.structured_editor.load_tree(root)
+        self.current_file = None
+        self.current_project = pathname
+        self.is_modified = False
+        self.watch_current_file("")
+        self.restart_journal()
+        self.notebook.SetSelection(1)
+        self.update_title()
+        self.status_bar.SetStatusText(
+            f"Opened project: {os.path.basename(pathname)}")
+
+    def on_save_project(self, event):
+        """Save the section structure to a project file"""
+        if self.check_viewer_read_only():
+            return
+        with wx.FileDialog(
+                self,
+                "Save README project",
+                defaultFile=os.path.basename(self.current_project or ""),
+                wildcard=f"README projects (*{PROJECT_EXTENSION})|*{PROJECT_EXTENSION}",
+                style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as file_dialog:
+
+            if file_dialog.ShowModal() == wx.ID_CANCEL:
+                return
+
+            pathname = file_dialog.GetPath()
+        if not pathname.endswith(PROJECT_EXTENSION):
+            pathname += PROJECT_EXTENSION
+
+        # Save the structure behind what the active editor shows
+        self.get_current_editor().commit_to_document()
+        try:
+            save_project(pathname, self.structured_editor.current_tree())
+        except OSError:
+            wx.LogError(f"Cannot save project '{pathname}'.")
+            return
+        self.current_project = pathname
+        self.status_bar.SetStatusText(
+            f"Saved project: {os.path.basename(pathname)}")
+
+    def check_viewer_read_only(self):
+        """Tell the user the viewer cannot save; True if in viewer mode"""
+        if self.structured_editor.viewer is None:
+            return False
+        wx.MessageBox("The viewer is read-only. Open the file normally to "
+                      "edit and save it.", "Read-only Viewer",
+                      wx.OK | wx.ICON_INFORMATION)
+        return True
+
+    def on_save(self, event, wait=False):
         """Save the current file"""
+        if self.check_viewer_read_only():
+            return
         if self.current_file:
-            self.save_file(self.current_file)
+            self.save_file(self.current_file, wait)
         else:
-            self.on_save_as(event)
+            self.on_save_as(event, wait)
 
-    def on_save_as(self, event):
+    def on_save_as(self, event, wait=False):
         """Save the file with a new name"""
+        if self.check_viewer_read_only():
+            return
         with wx.FileDialog(
                 self,
                 "Save README file",
@@ -1196,33 +1466,294 @@ class MainFrame(wx.Frame):
                 return
 
             pathname = file_dialog.GetPath()
-            self.save_file(pathname)
+            self.save_file(pathname, wait)
 
-    def save_file(self, pathname):
-        """Save content to file"""
-        try:
-            content = self.get_current_editor().get_content()
-            with open(pathname, 'w', encoding='utf-8') as file:
-                file.write(content)
+    def save_file(self, pathname, wait=False):
+        """Save content to file.
+
+        The file is replaced atomically on a worker thread; with wait=True
+        the save runs to completion before returning (e.g. before closing).
+        Returns False if another save is still running.
+        """
+        if self.file_saver is not None:
+            if not wait:
+                self.status_bar.SetStatusText(
+                    "A save is already in progress")
+                return False
+            self.file_saver.join()
+            self.file_saver.report_now()
+            self.file_saver = None
+
+        # Save what the active editor shows
+        self.get_current_editor().commit_to_document()
+        content = self.document.text
+        version = self.document.version
+
+        def on_done(written):
+            if not wait and self.file_saver is not saver:
+                return  # Superseded by a blocking save
+            self.file_saver = None
             self.current_file = pathname
-            self.is_modified = False
+            # Our own write is not an external change
+            self.watch_current_file(content)
+            # Edits made while saving still need to be saved, including
+            # typing not yet committed to the document
+            self.is_modified = self.document.version != version \
+                or self.document.has_pending()
+            if not self.is_modified:
+                self.restart_journal()
             self.update_title()
-            self.status_bar.SetStatusText(
-                f"Saved: {os.path.basename(pathname)}")
-        except IOError:
+            if written:
+                self.status_bar.SetStatusText(
+                    f"Saved: {os.path.basename(pathname)}")
+            else:
+                self.status_bar.SetStatusText(
+                    f"No changes to save: {os.path.basename(pathname)}")
+
+        def on_error(error):
+            if not wait and self.file_saver is not saver:
+                return  # Superseded by a blocking save
+            self.file_saver = None
+            self.update_title()
+            self.status_bar.SetStatusText("")
             wx.LogError(f"Cannot save file '{pathname}'.")
 
+        if wait:
+            saver = FileSaver(pathname, content, on_done, on_error)
+            saver.run()
+            return True
+
+        saver = FileSaver(pathname, content, on_done, on_error,
+                          post=wx.CallAfter)
+        self.file_saver = saver
+        self.update_title()
+        self.status_bar.SetStatusText(
+            f"Saving {os.path.basename(pathname)}...")
+        saver.start()
+        return True
+
     def on_exit(self, event):
         """Exit the application"""
         self.Close()
 
     def on_close(self, event):
         """Handle window close event"""
+        if self.file_saver is not None:
+            # Let a background save finish rather than abandon it, and
+            # apply its result now; the posted one would come too late
+            self.file_saver.join()
+            self.file_saver.report_now()
         if self.check_save_before_action():
+            self.save_session_state()
+            # Clean exit: nothing left to recover
+            self.journal_timer.Stop()
+            if self.journal is not None:
+                self.journal.close()
             event.Skip()
         else:
             event.Veto()
 
+    def save_session_state(self):
+        """Snapshot the open file and view state for the next launch"""
+        files = []
+        stamp = file_stamp(self.current_file) if self.current_file else None
+        # Unsaved edits are the journal's job; only files matching the
+        # disk are restored from the session
+        if stamp is not None and not self.is_modified \
+                and self.structured_editor.viewer is None:
+            text = self.document.text
+            state = {'path': self.current_file, 'hash': content_hash(text),
+                     'page': self.notebook.GetSelection(),
+                     'cursor': self.general_editor.text_ctrl.GetInsertionPoint()}
+            state.update(stamp)
+            state.update(self.structured_editor.capture_state(text))
+            files.append(state)
+        try:
+            save_session(self.session_path, {'files': files})
+        except OSError:
+            pass  # Only costs a slower start next time
+
+    def restore_session(self):
+        """Reopen the file from the last session if it is unchanged"""
+        if self.current_file or self.is_modified or self.file_loader:
+            return  # Recovered edits take precedence
+        session = load_session(self.session_path)
+        if session and session['files']:
+            state = session['files'][0]
+            self.open_file(state['path'], state)
+
+    def watch_current_file(self, disk_text):
+        """Watch current_file for changes, starting from disk_text"""
+        self.disk_text = disk_text
+        self.file_watcher.watch(self.current_file)
+
+    def on_watch_timer(self, event):
+        """Check the open file for changes made by other programs"""
+        if self._handling_external_change or self.file_loader is not None \
+                or self.file_saver is not None:
+            return  # Our own reads and writes are not external changes
+        state = self.file_watcher.poll()
+        if state is None:
+            return
+        self._handling_external_change = True
+        try:
+            self.on_external_change(state)
+        finally:
+            self._handling_external_change = False
+
+    def on_external_change(self, state):
+        """Reload a file changed on disk, merging in any unsaved edits"""
+        pathname = self.current_file
+        name = os.path.basename(pathname)
+        try:
+            disk_text = "".join(
+                text for text, _, _ in iter_text_chunks(pathname))
+        except (OSError, UnicodeDecodeError):
+            return  # Try again on the next change
+
+        if not self.is_modified:
+            merged, conflicts = disk_text, []
+        else:
+            dlg = wx.MessageDialog(
+                self,
+                f"{name} was changed by another program.\n\n"
+                "Merge those changes into your unsaved edits? Sections "
+                "changed on both sides keep your version.",
+                "File Changed on Disk", wx.YES_NO | wx.ICON_QUESTION)
+            result = dlg.ShowModal()
+            dlg.Destroy()
+            if result != wx.ID_YES:
+                # Keep our version; saving will overwrite theirs
+                self.file_watcher.accept(state)
+                self.disk_text = disk_text
+                return
+            merged, conflicts = merge_sections(
+                self.disk_text, self.document.text, disk_text)
+
+        # Applied as an edit, so the editors patch only what changed
+        self.document.set_text(merged, origin=self)
+        self.file_watcher.accept(state)
+        self.disk_text = disk_text
+        self.is_modified = merged != disk_text
+        if not self.is_modified:
+            # Nothing to recover; the journal must not replay disk content
+            self.restart_journal()
+        self.update_title()
+        if conflicts:
+            self.status_bar.SetStatusText(
+                f"Merged changes to {name}; kept your version of: "
+                + ", ".join(conflicts))
+        else:
+            self.status_bar.SetStatusText(f"Reloaded changes to {name}")
+
+    def on_document_journal(self, change):
+        """Journal edits; loads are journaled as snapshots instead"""
+        if self.journal is not None and change.origin is not None:
+            self.journal.record_change(change.start, change.end, change.text)
+
+    def on_journal_timer(self, event):
+        """Write the edits journaled since the last tick"""
+        if self.journal is None:
+            return
+        # Typing in the General Editor is only committed on demand; commit
+        # it here so it reaches the journal. Structured edits are journaled
+        # as section records without generating the whole document.
+        if self.document.pending_origin is self.general_editor:
+            self.document.flush()
+        try:
+            self.journal.flush()
+            if self.journal.needs_compaction():
+                self.restart_journal()
+        except OSError as error:
+            self.disable_journal(error)
+
+    def restart_journal(self):
+        """Replace the journal with a snapshot of the current document"""
+        if self.journal is None:
+            return
+        try:
+            self.journal.start(self.document.text, self.current_file)
+        except OSError as error:
+            self.disable_journal(error)
+
+    def disable_journal(self, error):
+        """Stop journaling after a write failure rather than fail every edit"""
+        self.journal.close(remove=False)
+        self.journal = None
+        self.status_bar.SetStatusText(f"Crash recovery disabled: {error}")
+
+    def journal_section(self, section, **fields):
+        """Journal an edit made to a structured section"""
+        if self.journal is not None:
+            self.journal.record_section(self.structured_editor.section_path(section),
+                                        **fields)
+
+    def journal_sections(self, root):
+        """Journal the enabled flag of every structured section.
+
+        Content is journaled by journal_section() as it changes, so a
+        tree rebuild does not write the whole document again.
+        """
+        if self.journal is not None:
+            self.journal.record_tree([
+                {'path': self.structured_editor.section_path(section),
+                 'enabled': section.enabled}
+                for section in iter_sections(root)])
+
+    def recover_unsaved_edits(self):
+        """Offer to restore edits journaled by an editor that crashed.
+
+        Otherwise the previous session is restored.
+        """
+        if self.journal is None:
+            self.restore_session()
+            return
+        try:
+            journals = find_orphaned_journals(self.journal.directory)
+        except OSError:
+            journals = []
+        session = None
+        for path in journals:
+            session = replay_journal(path)
+            if session is not None:
+                break
+
+        if session is not None:
+            name = os.path.basename(session.source_file) \
+                if session.source_file else "an unsaved document"
+            dlg = wx.MessageDialog(
+                self,
+                f"README Editor did not shut down cleanly. Recover "
+                f"{session.edit_count} unsaved edit(s) to {name}?",
+                "Recover Unsaved Changes", wx.YES_NO | wx.ICON_QUESTION)
+            result = dlg.ShowModal()
+            dlg.Destroy()
+            if result == wx.ID_YES:
+                self.document.load(session.text)
+                self.current_file = session.source_file
+                disk_text = ""
+                if self.current_file:
+                    try:
+                        disk_text = "".join(text for text, _, _ in
+                                            iter_text_chunks(self.current_file))
+                    except (OSError, UnicodeDecodeError):
+                        pass
+                self.watch_current_file(disk_text)
+                if session.section_ops:
+                    self.notebook.SetSelection(1)
+                    self.structured_editor.apply_journal_ops(session.section_ops)
+                self.set_modified()
+                self.status_bar.SetStatusText("Recovered unsaved changes")
+
+        # Journals are replaced by this editor's own
+        for path in journals:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.restart_journal()
+        self.restore_session()
+
     def on_about(self, event):
         """Show about dialog"""
         info = wx.adv.AboutDialogInfo()
@@ -1438,7 +1969,7 @@ Your code here
             dlg.Destroy()
 
             if result == wx.ID_YES:
-                self.on_save(None)
+                self.on_save(None, wait=True)
                 return not self.is_modified
             elif result == wx.ID_NO:
                 return True
@@ -1458,7 +1989,10 @@ Your code here
                 if project_name and project_name.strip() and project_name != "My Project":
                     title += f" - {project_name.strip()}"
         
-        if self.current_file:
+        viewer = getattr(getattr(self, 'structured_editor', None), 'viewer', None)
+        if viewer is not None:
+            title += f" - {os.path.basename(viewer.path)} [Read-only]"
+        elif self.current_file:
             file_name = os.path.basename(self.current_file)
             if " - " not in title:  # If no project name was added
                 title += f" - {file_name}"
@@ -1467,6 +2001,8 @@ Your code here
         
         if self.is_modified:
             title += " *"
+        if getattr(self, 'file_saver', None) is not None:
+            title += " (Saving...)"
         self.SetTitle(title)
 
     def set_modified(self, modified=True):
@@ -1478,28 +2014,89 @@ Your code here
 class GeneralEditor(wx.Panel):
     """General purpose README editor"""
 
-    def __init__(self, parent, main_frame=None):
+    # Characters added to the text control per idle step when loading
+    # large documents, so the UI keeps responding while it fills
+    LOAD_BATCH_SIZE = 256 * 1024
+
+    # Text controls the editor can use (see set_backend())
+    TEXT_BACKEND = "text"            # wx.TextCtrl
+    SCINTILLA_BACKEND = "scintilla"  # StyledTextEditor, for large documents
+
+    def __init__(self, parent, main_frame=None, backend=TEXT_BACKEND):
         super().__init__(parent)
         self.main_frame = main_frame
+        self.backend = backend if STC_AVAILABLE else self.TEXT_BACKEND
+        self.document = getattr(main_frame, 'document', None)
+        self._applying_change = False
+        # (content, offset) while a large document is being filled in
+        self._pending_fill = None
+        self._fill_cursor = 0  # Cursor position once filling completes
         self.create_ui()
+        if self.document is not None:
+            self.document.add_observer(self.on_document_changed)
 
     def create_ui(self):
         """Create the UI for general editor"""
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         # Text editor
-        self.text_ctrl = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_RICH2)
-        self.text_ctrl.SetFont(
-            wx.Font(11, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL,
-                    wx.FONTWEIGHT_NORMAL))
+        self.text_ctrl = self._create_text_ctrl()
 
         sizer.Add(self.text_ctrl, 1, wx.EXPAND | wx.ALL, 5)
         self.SetSizer(sizer)
 
-        # Bind events
-        self.text_ctrl.Bind(wx.EVT_TEXT, self.on_text_changed)
+    def _create_text_ctrl(self):
+        """Create the text control for the current backend"""
+        font = wx.Font(11, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL,
+                       wx.FONTWEIGHT_NORMAL)
+        if self.backend == self.SCINTILLA_BACKEND:
+            text_ctrl = StyledTextEditor(self)
+            text_ctrl.set_appearance(font)
+            text_ctrl.Bind(wx.stc.EVT_STC_CHANGE, self.on_text_changed)
+        else:
+            text_ctrl = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_RICH2)
+            text_ctrl.SetFont(font)
+            text_ctrl.Bind(wx.EVT_TEXT, self.on_text_changed)
+        return text_ctrl
+
+    def set_backend(self, backend):
+        """Switch between wx.TextCtrl and Scintilla, keeping the text,
+        cursor and read-only state (but not the undo history)"""
+        if backend == self.backend or (backend == self.SCINTILLA_BACKEND
+                                       and not STC_AVAILABLE):
+            return
+        self._finish_fill()
+        old_ctrl = self.text_ctrl
+        content = old_ctrl.GetValue()
+        cursor = old_ctrl.GetInsertionPoint()
+        editable = old_ctrl.IsEditable()
+
+        self.backend = backend
+        self.text_ctrl = self._create_text_ctrl()
+        self.GetSizer().Replace(old_ctrl, self.text_ctrl)
+        old_ctrl.Destroy()
+        self._set_text(content)
+        self.text_ctrl.SetEditable(editable)
+        self.set_cursor(cursor)
+        self.Layout()
+
+    def _set_text(self, content):
+        """Replace all the text without treating it as a user edit"""
+        applying = self._applying_change
+        self._applying_change = True
+        try:
+            self.text_ctrl.SetValue(content)
+            if self.backend == self.SCINTILLA_BACKEND:
+                self.text_ctrl.EmptyUndoBuffer()
+        finally:
+            self._applying_change = applying
 
     def apply_appearance(self, font=None, text_colour=None, background_colour=None):
+        if self.backend == self.SCINTILLA_BACKEND:
+            # Restyling a huge selection hangs a rich text control; Scintilla
+            # has one style for all the text
+            self.text_ctrl.set_appearance(font, text_colour, background_colour)
+            return
         self._apply_text_control_appearance(self.text_ctrl, font, text_colour, background_colour)
 
     def _apply_text_control_appearance(self, ctrl, font, text_colour, background_colour):
@@ -1552,6 +2149,12 @@ class GeneralEditor(wx.Panel):
 
     def on_text_changed(self, event):
         """Handle text change event"""
+        if self._applying_change:
+            # Echo of a change that came from the shared document
+            event.Skip()
+            return
+        if self.document is not None:
+            self.document.set_pending(self, self.commit_to_document)
         if self.main_frame:
             self.main_frame.set_modified()
             # Update preview if visible
@@ -1561,14 +2164,103 @@ class GeneralEditor(wx.Panel):
 
     def new_file(self):
         """Create a new file"""
+        self._pending_fill = None
+        self.text_ctrl.SetEditable(True)
         self.text_ctrl.SetValue("")
+        if self.backend == self.SCINTILLA_BACKEND:
+            self.text_ctrl.EmptyUndoBuffer()
 
     def load_content(self, content):
-        """Load content into the editor"""
-        self.text_ctrl.SetValue(content)
+        """Load content into the editor.
+
+        With wx.TextCtrl, large content is added in batches from idle
+        callbacks; the control stays read-only until it holds the whole
+        document. Scintilla takes any document at once.
+        """
+        self._pending_fill = None
+        if len(content) <= self.LOAD_BATCH_SIZE \
+                or self.backend == self.SCINTILLA_BACKEND:
+            self.text_ctrl.SetEditable(True)
+            self.text_ctrl.SetValue(content)
+            if self.backend == self.SCINTILLA_BACKEND:
+                self.text_ctrl.EmptyUndoBuffer()
+            return
+        self.text_ctrl.SetEditable(False)
+        self.text_ctrl.SetValue(content[:self.LOAD_BATCH_SIZE])
+        self._pending_fill = (content, self.LOAD_BATCH_SIZE)
+        wx.CallAfter(self._fill_next_batch, content)
+
+    def _fill_next_batch(self, content):
+        """Append the next batch of a large document"""
+        if self._pending_fill is None or self._pending_fill[0] is not content:
+            return  # Finished, or superseded by another load
+        offset = self._pending_fill[1]
+        end = offset + self.LOAD_BATCH_SIZE
+        self._append_fill(content[offset:end])
+        if end < len(content):
+            self._pending_fill = (content, end)
+            wx.CallAfter(self._fill_next_batch, content)
+        else:
+            self._end_fill()
+
+    def _finish_fill(self):
+        """Add whatever is left of a batched load at once"""
+        if self._pending_fill is not None:
+            content, offset = self._pending_fill
+            self._append_fill(content[offset:])
+            self._end_fill()
+
+    def _append_fill(self, text):
+        """Append loaded text without treating it as a user edit"""
+        applying = self._applying_change
+        self._applying_change = True
+        try:
+            self.text_ctrl.AppendText(text)
+        finally:
+            self._applying_change = applying
+
+    def _end_fill(self):
+        """Make the fully loaded document editable"""
+        self._pending_fill = None
+        self.text_ctrl.SetEditable(True)
+        position, self._fill_cursor = self._fill_cursor, 0
+        self.text_ctrl.SetInsertionPoint(position)
+        self.text_ctrl.ShowPosition(position)
+
+    def set_cursor(self, position):
+        """Move the cursor, once the document has finished loading"""
+        if self._pending_fill is not None:
+            self._fill_cursor = position
+            return
+        position = min(position, self.text_ctrl.GetLastPosition())
+        self.text_ctrl.SetInsertionPoint(position)
+        self.text_ctrl.ShowPosition(position)
+
+    def commit_to_document(self):
+        """Push the text control's contents into the shared document"""
+        if self._pending_fill is not None:
+            return  # Still loading; the document already has the text
+        self.document.set_text(self.text_ctrl.GetValue(), origin=self)
+
+    def on_document_changed(self, change):
+        """Apply a document change made elsewhere to the text control"""
+        if change.origin is self:
+            return
+        self._applying_change = True
+        try:
+            if change.origin is None:
+                # Whole document replaced (new/open)
+                self.load_content(change.text)
+            else:
+                self._finish_fill()
+                self.text_ctrl.Replace(change.start, change.end, change.text)
+        finally:
+            self._applying_change = False
 
     def get_content(self):
         """Get the current content"""
+        if self._pending_fill is not None:
+            return self._pending_fill[0]
         return self.text_ctrl.GetValue()
 
 
@@ -1581,8 +2273,34 @@ class StructuredEditor(wx.Panel):
         self.template_root = None
         self.item_to_section = {}
         self.current_section = None
+        self.document = getattr(main_frame, 'document', None)
+        # Last markdown exchanged with the document and the section behind
+        # each of its blocks, used to patch sections in place
+        self._sync_baseline = None
+        # Document version the tree reflects; changes made while the tab
+        # is hidden are applied lazily by ensure_current()
+        self._document_version = 0
+        self._reload_needed = False
+        # (thread, result) of the latest background import; each worker
+        # fills only its own result, so a slower older one cannot
+        # overwrite a newer import
+        self._import_request = None
+        self._prepared_import = None
+        # Tree and view state restored from a session snapshot; the view
+        # state is kept as (content hash, state) until it is shown
+        self._restored_import = None
+        self._restore_view = None
+        # MappedMarkdown being browsed in read-only viewer mode
+        self.viewer = None
+        self._viewer_items = {}
+        self.glossary_scanner = None  # GlossaryScanner while one is running
+        self.automation_pipeline = None  # Generate All pipeline while running
+        # Tree, title and preview updates, deferred inside batch()
+        self.updates = UpdateBatch(self._apply_updates)
         self.create_ui()
         self.setup_template()
+        if self.document is not None:
+            self.document.add_observer(self.on_document_changed)
 
     def create_ui(self):
         """Create the UI for structured editor"""
@@ -1666,6 +2384,12 @@ class StructuredEditor(wx.Panel):
             wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
                     wx.FONTWEIGHT_BOLD))
 
+        self.auto_generate_all_btn = wx.Button(controls_panel,
+                                              label="Generate All",
+                                              size=(100, -1))
+        self.auto_generate_all_btn.SetToolTip(
+            "Run every generator below at once and fill all of their sections")
+
         self.auto_file_structure_btn = wx.Button(controls_panel,
                                                label="File Structure",
                                                size=(100, -1))
@@ -1676,7 +2400,7 @@ class StructuredEditor(wx.Panel):
                                              label="Dependencies",
                                              size=(100, -1))
         self.auto_dependencies_btn.SetToolTip(
-            "Automatically read requirements.txt and populate dependencies section")
+            "Automatically read requirements.txt, pyproject.toml, setup.py or Pipfile and populate dependencies section")
 
         self.auto_dev_deps_btn = wx.Button(controls_panel,
                                          label="Dev Dependencies",
@@ -1689,7 +2413,11 @@ class StructuredEditor(wx.Panel):
                                           label="Generate Glossary",
                                           size=(140, -1))
         self.auto_dev_deps_btn.SetToolTip(
-            "Automatically read requirements-dev.txt and populate developer dependencies section")
+            "Automatically read requirements-dev.txt, dev extras or Pipfile dev-packages and populate developer dependencies section")
+        self.installed_versions_cb = wx.CheckBox(controls_panel,
+                                                 label="Installed versions")
+        self.installed_versions_cb.SetToolTip(
+            "Note the version, license and summary of each dependency installed in this Python environment")
 
         controls_sizer.Add(self.toggle_btn, 0, wx.ALL, 2)
         controls_sizer.Add(self.enable_all_btn, 0, wx.ALL, 2)
@@ -1699,9 +2427,11 @@ class StructuredEditor(wx.Panel):
         # Add automation section
         controls_sizer.Add(wx.StaticLine(controls_panel), 0, wx.EXPAND | wx.ALL, 2)
         controls_sizer.Add(automation_label, 0, wx.ALL, 2)
+        controls_sizer.Add(self.auto_generate_all_btn, 0, wx.ALL, 2)
         controls_sizer.Add(self.auto_file_structure_btn, 0, wx.ALL, 2)
         controls_sizer.Add(self.auto_dependencies_btn, 0, wx.ALL, 2)
         controls_sizer.Add(self.auto_dev_deps_btn, 0, wx.ALL, 2)
+        controls_sizer.Add(self.installed_versions_cb, 0, wx.ALL, 2)
         controls_sizer.Add(self.auto_examples_main_btn, 0, wx.ALL, 2)
         controls_sizer.Add(self.auto_glossary_btn, 0, wx.ALL, 2)
         
@@ -1763,6 +2493,7 @@ class StructuredEditor(wx.Panel):
         self.toggle_optional_btn.Bind(wx.EVT_BUTTON, self.on_toggle_optional_sections)
         
         # Bind automation button events
+        self.auto_generate_all_btn.Bind(wx.EVT_BUTTON, self.on_generate_all)
         self.auto_file_structure_btn.Bind(wx.EVT_BUTTON, self.on_auto_generate_file_structure)
         self.auto_dependencies_btn.Bind(wx.EVT_BUTTON, self.on_auto_generate_dependencies)
         self.auto_dev_deps_btn.Bind(wx.EVT_BUTTON, self.on_auto_generate_dev_dependencies)
@@ -1856,6 +2587,10 @@ class StructuredEditor(wx.Panel):
     def on_tree_selection(self, event):
         """Handle tree selection change"""
         item = event.GetItem()
+        if self.viewer is not None:
+            self.show_viewer_section(item)
+            event.Skip()
+            return
         if item.IsOk() and item in self.item_to_section:
             # Save current section content before switching
             if self.current_section is not None:
@@ -1884,8 +2619,12 @@ class StructuredEditor(wx.Panel):
 
     def on_section_text_changed(self, event):
         """Handle section text change"""
+        self.mark_changed()
         if self.current_section is not None:
             self.current_section.content = self.section_editor.GetValue()
+            if self.main_frame:
+                self.main_frame.journal_section(
+                    self.current_section, content=self.current_section.content)
             
             # If we're editing Overview (root content), sync to overview control
             if self.current_section == self.template_root:
@@ -1894,42 +2633,39 @@ class StructuredEditor(wx.Panel):
                 self.overview_ctrl.SetValue(self.current_section.content)
                 self.overview_ctrl.Bind(wx.EVT_TEXT, self.on_overview_changed)
 
-        if self.main_frame:
-            self.main_frame.set_modified()
-            # Update preview if visible
-            if self.main_frame.preview_visible:
-                wx.CallAfter(self.main_frame.update_preview)
+        self.sections_changed(tree=False)
         event.Skip()
 
     def on_project_name_changed(self, event):
         """Handle project name change"""
+        self.mark_changed()
+        status = None
         if self.template_root:
             # Update the root section name
             new_name = self.project_name_ctrl.GetValue() or "Project"
             self.template_root.name = new_name
+            if self.main_frame:
+                self.main_frame.journal_section(self.template_root, name=new_name)
 
             # Update the tree view to reflect the change
             self.refresh_tree_root()
 
             # Update status bar to show the change
-            if self.main_frame and hasattr(self.main_frame, 'status_bar'):
-                self.main_frame.status_bar.SetStatusText(
-                    f"Project name updated to: {new_name}")
+            status = f"Project name updated to: {new_name}"
 
-        if self.main_frame:
-            self.main_frame.set_modified()
-            # Update the window title to reflect the new project name
-            self.main_frame.update_title()
-            # Update preview if visible
-            if self.main_frame.preview_visible:
-                wx.CallAfter(self.main_frame.update_preview)
+        # Update the window title to reflect the new project name
+        self.sections_changed(status, tree=False, title=True)
         event.Skip()
 
     def on_overview_changed(self, event):
         """Handle overview/description text change"""
+        self.mark_changed()
         if self.template_root:
             # Store the overview content in the root section
             self.template_root.content = self.overview_ctrl.GetValue()
+            if self.main_frame:
+                self.main_frame.journal_section(
+                    self.template_root, content=self.template_root.content)
             
             # If we're currently editing the Overview in the section editor, sync it
             if self.current_section == self.template_root:
@@ -1938,16 +2674,12 @@ class StructuredEditor(wx.Panel):
                 self.section_editor.SetValue(self.template_root.content)
                 self.section_editor.Bind(wx.EVT_TEXT, self.on_section_text_changed)
 
-        if self.main_frame:
-            self.main_frame.set_modified()
-            # Update preview if visible
-            if self.main_frame.preview_visible:
-                wx.CallAfter(self.main_frame.update_preview)
+        self.sections_changed(tree=False)
         event.Skip()
 
     def refresh_tree_root(self):
         """Refresh the tree display to show updated project name"""
-        if self.template_root:
+        if self.template_root and self.viewer is None:
             # Store the currently selected section to restore it
             current_selection = None
             current_item = self.tree_ctrl.GetSelection()
@@ -2006,34 +2738,14 @@ class StructuredEditor(wx.Panel):
         if selection.IsOk() and selection in self.item_to_section:
             section = self.item_to_section[selection]
             section.enabled = not section.enabled
-            self.refresh_tree_display()
-
-            # Update status
             status = "enabled" if section.enabled else "disabled"
-            if self.main_frame and hasattr(self.main_frame, 'status_bar'):
-                self.main_frame.status_bar.SetStatusText(
-                    f"Section '{section.name}' {status}")
-
-            # Mark as modified
-            if self.main_frame:
-                self.main_frame.set_modified()
-                if self.main_frame.preview_visible:
-                    wx.CallAfter(self.main_frame.update_preview)
+            self.sections_changed(f"Section '{section.name}' {status}")
 
     def on_enable_all_sections(self, event):
         """Enable all sections in the template"""
         if self.template_root:
             self._set_all_sections_enabled(self.template_root, True)
-            self.refresh_tree_display()
-
-            if self.main_frame and hasattr(self.main_frame, 'status_bar'):
-                self.main_frame.status_bar.SetStatusText(
-                    "All sections enabled")
-
-            if self.main_frame:
-                self.main_frame.set_modified()
-                if self.main_frame.preview_visible:
-                    wx.CallAfter(self.main_frame.update_preview)
+            self.sections_changed("All sections enabled")
 
     def on_disable_all_sections(self, event):
         """Disable all sections in the template (except essential ones)"""
@@ -2043,16 +2755,7 @@ class StructuredEditor(wx.Panel):
             essential_sections = ["Overview", "Table of contents"]
             self._enable_essential_sections(self.template_root,
                                             essential_sections)
-            self.refresh_tree_display()
-
-            if self.main_frame and hasattr(self.main_frame, 'status_bar'):
-                self.main_frame.status_bar.SetStatusText(
-                    "All sections disabled (except essential ones)")
-
-            if self.main_frame:
-                self.main_frame.set_modified()
-                if self.main_frame.preview_visible:
-                    wx.CallAfter(self.main_frame.update_preview)
+            self.sections_changed("All sections disabled (except essential ones)")
 
     def on_toggle_optional_sections(self, event):
         """Toggle all optional sections in the template"""
@@ -2063,16 +2766,8 @@ class StructuredEditor(wx.Panel):
             # If any are enabled, disable all optional; if none are enabled, enable all optional
             new_state = not any_optional_enabled
             self._set_optional_sections_enabled(self.template_root, new_state)
-            self.refresh_tree_display()
-
-            if self.main_frame and hasattr(self.main_frame, 'status_bar'):
-                status_text = "All optional sections enabled" if new_state else "All optional sections disabled"
-                self.main_frame.status_bar.SetStatusText(status_text)
-
-            if self.main_frame:
-                self.main_frame.set_modified()
-                if self.main_frame.preview_visible:
-                    wx.CallAfter(self.main_frame.update_preview)
+            status_text = "All optional sections enabled" if new_state else "All optional sections disabled"
+            self.sections_changed(status_text)
 
     def on_tree_right_click(self, event):
         """Handle right-click on tree for context menu"""
@@ -2094,28 +2789,16 @@ class StructuredEditor(wx.Panel):
             # Bind menu events
             def on_context_toggle(evt):
                 section.enabled = not section.enabled
-                self.refresh_tree_display()
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
+                self.sections_changed()
 
             def on_enable_children(evt):
                 self._set_all_sections_enabled(section, True)
-                self.refresh_tree_display()
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
+                self.sections_changed()
 
             def on_disable_children(evt):
                 for child in section.children:
                     self._set_all_sections_enabled(child, False)
-                self.refresh_tree_display()
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
+                self.sections_changed()
 
             self.Bind(wx.EVT_MENU, on_context_toggle, id=1)
             self.Bind(wx.EVT_MENU, on_enable_children, id=2)
@@ -2154,9 +2837,53 @@ class StructuredEditor(wx.Panel):
                 return True
         return False
 
+    def batch(self):
+        """Group section changes so the views update once.
+
+        Inside ``with editor.batch():`` calls to refresh_tree_display() and
+        sections_changed() only record what needs updating; the tree, the
+        window title, the status bar and the preview are updated once when
+        the outermost batch closes.
+        """
+        return self.updates
+
+    def sections_changed(self, status=None, tree=True, title=False):
+        """Note that sections changed: rebuild the tree (unless tree is
+        False), mark the file modified and re-render the preview, now or
+        when the current batch closes"""
+        updates = [MODIFIED]
+        if tree:
+            updates.append(TREE)
+        if title:
+            updates.append(TITLE)
+        self.updates.request(*updates, status=status)
+
+    def _apply_updates(self, updates, status):
+        """Flush batched updates; each is applied once"""
+        if TREE in updates:
+            self._rebuild_tree()
+        if not self.main_frame:
+            return
+        if MODIFIED in updates:
+            self.main_frame.set_modified()
+        if TITLE in updates:
+            self.main_frame.update_title()
+        if status is not None and hasattr(self.main_frame, 'status_bar'):
+            self.main_frame.status_bar.SetStatusText(status)
+        if MODIFIED in updates and self.main_frame.preview_visible:
+            wx.CallAfter(self.main_frame.update_preview)
+
     def refresh_tree_display(self):
         """Refresh the tree display to show updated enabled/disabled states"""
-        if self.template_root and self.tree_ctrl:
+        self.updates.request(TREE)
+
+    def _rebuild_tree(self):
+        """Rebuild the tree from the sections, keeping the selection"""
+        # Every section mutation (toggles, automation) ends with this refresh
+        self.mark_changed()
+        if self.main_frame and self.template_root:
+            self.main_frame.journal_sections(self.template_root)
+        if self.template_root and self.tree_ctrl and self.viewer is None:
             # Save current selection
             current_selection = self.tree_ctrl.GetSelection()
             current_section = None
@@ -2181,96 +2908,341 @@ class StructuredEditor(wx.Panel):
 
     def new_file(self):
         """Create a new structured file"""
-        # Reset all sections to empty
-        if self.template_root:
-            self._clear_all_sections(self.template_root)
-            self.section_editor.SetValue("")
-            self.current_section_label.SetLabel("Select a section to edit")
-            self.current_section = None
+        self._reset_template()
+        self.refresh_tree_root()
 
-        # Reset project name
-        self.project_name_ctrl.SetValue("My Project")
-        if self.template_root:
-            self.template_root.name = "My Project"
-            self.refresh_tree_root()
+    def _reset_template(self, root=None):
+        """Show a fresh template, or an already imported one.
 
-    def _clear_all_sections(self, section):
-        """Recursively clear all section content and reset enabled state"""
-        section.content = ""
-        section.enabled = True  # Reset to enabled state
-        for child in section.children:
-            self._clear_all_sections(child)
+        Always starting from a new tree keeps imported sections from
+        carrying over into the next document.
+        """
+        self.template_root = root or create_readme_template()
+        self.section_editor.ChangeValue("")
+        self.current_section_label.SetLabel("Select a section to edit")
+        self.current_section = None
+        self.overview_ctrl.ChangeValue(self.template_root.content)
+
+        # The leading H1 of an imported document is the project name;
+        # otherwise replace the template's placeholder name
+        if not self.template_root.source_heading \
+                and self.template_root.name == "Project":
+            self.template_root.name = "My Project"
+        self.project_name_ctrl.ChangeValue(self.template_root.name)
+        self._sync_baseline = None
 
     def load_content(self, content):
         """Load content into the structured editor"""
-        # Reset template first
-        self.new_file()
-
-        # Try to extract project name from first H1 header
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('# '):
-                project_name = line[2:].strip()
-                if project_name:
-                    self.project_name_ctrl.SetValue(project_name)
-                    if self.template_root:
-                        self.template_root.name = project_name
-                        # Update the tree view to reflect the loaded project name
-                        self.refresh_tree_root()
-                break
+        if self._restore_view is not None \
+                and self._restore_view[0] != content_hash(content):
+            self._restore_view = None  # Another file replaced the restored one
+        root, sections = self._import_content(content)
+        self._show_imported(root, content, sections)
+
+    @staticmethod
+    def _import_content(content):
+        """Import markdown into a new template tree (no UI access)"""
+        root = create_readme_template()
+        sections = None
+        if content.strip():
+            # Import every heading; ones missing from the template become
+            # dynamic sections so nothing is lost when switching editors
+            sections = import_markdown(content, root)
+        return root, sections
+
+    def _show_imported(self, root, content, sections):
+        """Display a tree produced by _import_content()"""
+        self._reset_template(root)
+        if sections is not None:
+            self._sync_baseline = (content, sections)
+        self._document_version = self.document.version if self.document else 0
+        self._reload_needed = False
+
+        # Update the tree view to reflect the imported structure
+        self.refresh_tree_root()
+        if self._restore_view is not None:
+            view_hash, state = self._restore_view
+            self._restore_view = None
+            if view_hash == content_hash(content):
+                self._apply_view_state(state)
+
+    def _is_visible(self):
+        """Check if the Structured Editor is the active notebook page"""
+        if not self.main_frame:
+            return True
+        return self.main_frame.notebook.GetCurrentPage() is self
+
+    def _start_background_import(self):
+        """Parse the document on a worker thread while this tab is hidden"""
+        content = self.document.text
+        version = self.document.version
+        self._prepared_import = None
+        result = {}
+
+        def worker():
+            root, sections = self._import_content(content)
+            result['prepared'] = (version, content, root, sections)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        self._import_request = (thread, result)
+        thread.start()
+
+    def ensure_current(self):
+        """Apply document changes deferred while this tab was hidden"""
+        if self.viewer is not None or self.document is None \
+                or self._document_version == self.document.version:
+            return
+        content = self.document.text
+        if self._reload_needed:
+            if self._import_request is not None:
+                thread, result = self._import_request
+                self._import_request = None
+                thread.join()
+                self._prepared_import = result.get('prepared')
+            prepared = self._prepared_import
+            self._prepared_import = None
+            if prepared and prepared[0] == self.document.version:
+                _, content, root, sections = prepared
+                self._show_imported(root, content, sections)
+            else:
+                self.load_content(content)
+        else:
+            self.patch_content(content)
+        self._document_version = self.document.version
 
-        # Try to parse markdown content and populate appropriate sections
-        self._parse_markdown_content(content)
+    def patch_content(self, content):
+        """Update only the sections whose text changed.
 
-        # Refresh the current view if a section is selected
-        if self.current_section:
-            self.section_editor.SetValue(self.current_section.content)
+        Falls back to a full load_content() when there is nothing to patch
+        against or the heading structure changed.
+        """
+        changed = None
+        if self._sync_baseline is not None:
+            old_content, sections = self._sync_baseline
+            changed = patch_imported_markdown(self.template_root, sections,
+                                              old_content, content)
+        if changed is None:
+            self.load_content(content)
+            return
 
-    def _parse_markdown_content(self, content):
-        """Parse markdown content and try to match it to template sections"""
-        lines = content.split('\n')
-        current_section = None
-        current_content = []
-
-        # Create a mapping of section names to sections for quick lookup
-        section_map = {}
-        self._build_section_map(self.template_root, section_map)
-
-        for line in lines:
-            # Check if this line is a header
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-            if header_match:
-                # Save previous section content
-                if current_section and current_content:
-                    current_section.content = '\n'.join(
-                        current_content).strip()
-
-                # Find matching section
-                header_text = header_match.group(2).strip()
-                current_section = section_map.get(header_text)
-                current_content = []
-            else:
-                # Add content to current section
-                if current_section is not None:
-                    current_content.append(line)
+        self._sync_baseline = (content, sections)
+        if self.template_root in changed:
+            self.overview_ctrl.ChangeValue(self.template_root.content)
+        if self.current_section in changed:
+            self.section_editor.ChangeValue(self.current_section.content)
 
-        # Save last section
-        if current_section and current_content:
-            current_section.content = '\n'.join(current_content).strip()
+    def show_viewer(self, mapped):
+        """Browse a MappedMarkdown read-only using its heading index"""
+        self.close_viewer()
+        self.viewer = mapped
+        self.current_section = None
+        self.section_editor.SetEditable(False)
+        self.section_editor.ChangeValue("")
+        self.overview_ctrl.Enable(False)
+        self.project_name_ctrl.Enable(False)
+        self.current_section_label.SetLabel(
+            "Select a section to view (read-only)")
+
+        # Nest headings under the closest shallower heading
+        self.tree_ctrl.DeleteAllItems()
+        self._viewer_items = {}
+        root_item = self.tree_ctrl.AddRoot(os.path.basename(mapped.path))
+        stack = [(0, root_item)]
+        for index, section in enumerate(mapped.sections):
+            if section.level == 0:
+                if section.end > section.start:
+                    item = self.tree_ctrl.AppendItem(root_item, "(Preamble)")
+                    self._viewer_items[item] = index
+                continue
+            while stack[-1][0] >= section.level:
+                stack.pop()
+            item = self.tree_ctrl.AppendItem(stack[-1][1], section.title)
+            self._viewer_items[item] = index
+            stack.append((section.level, item))
+        self.tree_ctrl.Expand(root_item)
+
+    def show_viewer_section(self, item):
+        """Show the byte range of the selected heading"""
+        if not item.IsOk() or item not in self._viewer_items:
+            return
+        index = self._viewer_items[item]
+        section = self.viewer.sections[index]
+        self.current_section_label.SetLabel(
+            f"Viewing: {section.title or 'Preamble'} (read-only, bytes "
+            f"{section.start:,}-{section.end:,})")
+        self.section_editor.ChangeValue(self.viewer.section_text(index))
+        if self.main_frame and self.main_frame.preview_visible:
+            wx.CallAfter(self.main_frame.update_preview)
+
+    def close_viewer(self):
+        """Leave viewer mode and release the mapped file"""
+        if self.viewer is None:
+            return
+        self.viewer.close()
+        self.viewer = None
+        self._viewer_items = {}
+        self.section_editor.SetEditable(True)
+        self.overview_ctrl.Enable(True)
+        self.project_name_ctrl.Enable(True)
+
+    def capture_state(self, text):
+        """Describe the tree and view for a session snapshot of text"""
+        if self._document_version != self.document.version \
+                or self.viewer is not None:
+            return {}  # Tree not built for this text
+        state = {'expanded': [], 'selected': None,
+                 'section_cursor': self.section_editor.GetInsertionPoint()}
+        selection = self.tree_ctrl.GetSelection()
+        for item, section in self.item_to_section.items():
+            if self.tree_ctrl.IsExpanded(item):
+                state['expanded'].append(self.section_path(section))
+            if selection.IsOk() and item == selection:
+                state['selected'] = self.section_path(section)
+        if self._sync_baseline is not None and self._sync_baseline[0] == text:
+            state['sections'] = snapshot_sections(
+                self.template_root, self._sync_baseline[1],
+                self.document.sections)
+        return state
+
+    def load_tree(self, root):
+        """Show a section tree (e.g. from a project file) as the document"""
+        self._show_imported(root, "", None)
+        sections = []
+        content = self.get_content(sections)
+        # Adopted by on_document_changed() instead of parsing content
+        self._restored_import = (content, root, sections or None)
+        self.document.load(content)
+
+    def current_tree(self):
+        """The section tree, up to date with the document"""
+        self.ensure_current()
+        if self.current_section is not None and self.viewer is None:
+            self.current_section.content = self.section_editor.GetValue()
+        return self.template_root
 
-    def _build_section_map(self, section, section_map):
-        """Build a mapping of section names to section objects"""
-        section_map[section.name] = section
-        for child in section.children:
-            self._build_section_map(child, section_map)
+    def prepare_restore(self, state, content):
+        """Use a session snapshot for the document about to be loaded"""
+        # Applied only to this content, not to a file opened before it shows
+        self._restore_view = (content_hash(content), state)
+        if 'sections' in state and state.get('hash') == content_hash(content):
+            try:
+                root, sections = restore_sections(state['sections'], content)
+            except (KeyError, IndexError, TypeError):
+                return  # Malformed snapshot; parse normally
+            self._restored_import = (content, root, sections)
+
+    def _apply_view_state(self, state):
+        """Restore tree expansion, selection and cursor from a snapshot"""
+        expanded = {tuple(path) for path in state.get('expanded', [])}
+        selected = state.get('selected')
+        selected = tuple(selected) if selected is not None else None
+        selected_item = None
+        for item, section in self.item_to_section.items():
+            path = tuple(self.section_path(section))
+            if path in expanded:
+                self.tree_ctrl.Expand(item)
+            if path == selected and selected_item is None:
+                selected_item = item
+        if selected_item is not None:
+            self.tree_ctrl.SelectItem(selected_item)
+            position = min(state.get('section_cursor', 0),
+                           self.section_editor.GetLastPosition())
+            self.section_editor.SetInsertionPoint(position)
+            self.section_editor.ShowPosition(position)
+
+    @staticmethod
+    def section_path(section):
+        """Names leading from the root to a section (the root is [])"""
+        path = []
+        while section.parent is not None:
+            path.append(section.name)
+            section = section.parent
+        return path[::-1]
+
+    def apply_journal_ops(self, ops):
+        """Re-apply structured edits recovered from the journal"""
+        self.ensure_current()
+        sections = {}
+        for section in iter_sections(self.template_root):
+            sections.setdefault(tuple(self.section_path(section)), section)
+
+        for op in ops:
+            entries = op['sections'] if op['op'] == 'tree' else [op]
+            for entry in entries:
+                section = sections.get(tuple(entry['path']))
+                if section is None:
+                    continue
+                if 'enabled' in entry:
+                    section.enabled = entry['enabled']
+                if 'content' in entry:
+                    section.content = entry['content']
+                if 'name' in entry:
+                    section.name = entry['name']
+
+        self.project_name_ctrl.ChangeValue(self.template_root.name)
+        self.overview_ctrl.ChangeValue(self.template_root.content)
+        self.refresh_tree_display()
+
+    def mark_changed(self):
+        """Queue the structured content to be committed to the document"""
+        if self.document is not None:
+            self.document.set_pending(self, self.commit_to_document)
+
+    def commit_to_document(self):
+        """Push the generated markdown into the shared document"""
+        if self.viewer is not None:
+            return  # The viewer is read-only
+        sections = []
+        content = self.get_content(sections)
+        if sections:
+            self._sync_baseline = (content, sections)
+        self.document.set_text(content, origin=self)
+
+    def on_document_changed(self, change):
+        """Bring the structure up to date with a change made elsewhere.
+
+        While the tab is hidden nothing is parsed here: a newly opened
+        document is imported on a worker thread and adopted when the tab
+        is first shown (see ensure_current()), so opening a file only
+        waits for the General Editor.
+        """
+        if change.origin is self:
+            self._document_version = change.version
+            return
+        if change.origin is None:
+            # Whole document replaced (new/open)
+            self.close_viewer()
+            self._reload_needed = True
+            restored, self._restored_import = self._restored_import, None
+            if restored is not None and restored[0] is change.text:
+                # Tree rebuilt from the session snapshot; nothing to parse
+                self._import_request = None
+                self._prepared_import = (change.version,) + restored
+            elif not self._is_visible():
+                self._start_background_import()
+                return
+        if self._is_visible():
+            self.ensure_current()
+
+    def get_content(self, sections=None):
+        """Get the current content as markdown.
+
+        For imported documents, sections (if given) is filled with the
+        section behind each markdown block.
+        """
+        if self.viewer is not None:
+            return self.section_editor.GetValue()  # Section being viewed
 
-    def get_content(self):
-        """Get the current content as markdown"""
         # Save current editor content to current section
         if self.current_section is not None:
             self.current_section.content = self.section_editor.GetValue()
 
+        # Imported documents are exported with their original formatting
+        include_toc_links = bool(getattr(self.main_frame, "toc_links_enabled", False)) if self.main_frame else False
+        if self.template_root and self.template_root.source_heading is not None:
+            return export_markdown(self.template_root, include_toc_links,
+                                   sections)
+
         # Generate markdown with project name as H1
         if self.template_root:
             project_name = self.project_name_ctrl.GetValue() or "My Project"
@@ -2304,7 +3276,6 @@ class StructuredEditor(wx.Panel):
                     content += toc_content + "\n"
                 else:
                     # Regular section
-                    include_toc_links = bool(getattr(self.main_frame, "toc_links_enabled", False)) if self.main_frame else False
                     child_content = child.to_markdown(include_toc_links=include_toc_links)
                     if child_content.strip():
                         content += child_content + "\n"
@@ -2315,254 +3286,298 @@ class StructuredEditor(wx.Panel):
             return f"# {project_name}\n\nNo content available."
 
     # Automation methods
-    def on_auto_generate_file_structure(self, event):
-        """Auto-generate project file structure"""
-        try:
-            # Get the project directory (where the app is running from or where file is saved)
-            if self.main_frame and self.main_frame.current_file:
-                project_dir = os.path.dirname(self.main_frame.current_file)
-            else:
-                project_dir = os.getcwd()
-            
-            # Generate file structure
-            file_structure = self._scan_directory_structure(project_dir)
-            
-            # Find the "Project Structure" section and populate it
-            section = self._find_section_by_name(self.template_root, "Project Structure")
+    def _project_dir(self):
+        """Directory to scan: the README's folder, or the working directory"""
+        if self.main_frame and self.main_frame.current_file:
+            return os.path.dirname(self.main_frame.current_file)
+        return os.getcwd()
+
+    def _fill_generated_section(self, section_names, content):
+        """Put generated content in the first of section_names the template
+        has, and enable it. Returns the section, or None if there is none;
+        call it inside batch() and finish with sections_changed()."""
+        for section_name in section_names:
+            section = self._find_section_by_name(self.template_root, section_name)
             if section:
-                section.content = file_structure
+                section.content = content
                 section.enabled = True
-                
+                if self.main_frame:
+                    self.main_frame.journal_section(section, content=content)
                 # If this section is currently selected, update the editor
                 if self.current_section == section:
                     self.section_editor.SetValue(section.content)
-                
-                # Refresh tree to show enabled section
-                self.refresh_tree_display()
-                
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if hasattr(self.main_frame, 'status_bar'):
-                        self.main_frame.status_bar.SetStatusText(
-                            f"Generated file structure for {project_dir}")
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
-            else:
-                wx.MessageBox("Could not find 'Project Structure' section in template.",
-                            "Section Not Found", wx.OK | wx.ICON_WARNING)
+                return section
+        return None
+
+    def on_auto_generate_file_structure(self, event):
+        """Auto-generate project file structure"""
+        try:
+            project_dir = self._project_dir()
+            file_structure = self._scan_directory_structure(project_dir)
+            with self.batch():
+                if self._fill_generated_section(["Project Structure"], file_structure):
+                    self.sections_changed(f"Generated file structure for {project_dir}")
+                else:
+                    wx.MessageBox("Could not find 'Project Structure' section in template.",
+                                "Section Not Found", wx.OK | wx.ICON_WARNING)
                 
         except Exception as e:
             wx.MessageBox(f"Error generating file structure: {str(e)}",
                         "Error", wx.OK | wx.ICON_ERROR)
 
     def on_auto_generate_dependencies(self, event):
-        """Auto-generate project dependencies from requirements.txt"""
-        try:
-            # Get the project directory
-            if self.main_frame and self.main_frame.current_file:
-                project_dir = os.path.dirname(self.main_frame.current_file)
-            else:
-                project_dir = os.getcwd()
-            
-            requirements_file = os.path.join(project_dir, "requirements.txt")
-            
-            if not os.path.exists(requirements_file):
-                wx.MessageBox(f"requirements.txt not found in {project_dir}",
-                            "File Not Found", wx.OK | wx.ICON_WARNING)
-                return
-            
-            # Read and parse requirements.txt
-            dependencies_content = self._parse_requirements_file(requirements_file)
-            
-            # Find appropriate section(s) for dependencies
-            # Prioritize "Dependency" under Project Architecture first
-            target_sections = ["Dependency", "Dependencies", "Software Dependencies", "Python Libraries", "Install Dependencies"]
-            section = None
-            for section_name in target_sections:
-                section = self._find_section_by_name(self.template_root, section_name)
-                if section:
-                    break
-            
-            if section:
-                section.content = dependencies_content
-                section.enabled = True
-                
-                # If this section is currently selected, update the editor
-                if self.current_section == section:
-                    self.section_editor.SetValue(section.content)
-                
-                # Refresh tree to show enabled section
-                self.refresh_tree_display()
-                
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if hasattr(self.main_frame, 'status_bar'):
-                        self.main_frame.status_bar.SetStatusText(
-                            "Generated dependencies from requirements.txt")
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
-            else:
-                wx.MessageBox("Could not find a suitable dependencies section in template.",
-                            "Section Not Found", wx.OK | wx.ICON_WARNING)
-                
-        except Exception as e:
-            wx.MessageBox(f"Error generating dependencies: {str(e)}",
-                        "Error", wx.OK | wx.ICON_ERROR)
+        """Auto-generate project dependencies from the project's dependency files"""
+        self._generate_dependency_section(is_dev=False)
 
     def on_auto_generate_dev_dependencies(self, event):
-        """Auto-generate developer dependencies from requirements-dev.txt"""
+        """Auto-generate developer dependencies from the project's dependency files"""
+        self._generate_dependency_section(is_dev=True)
+
+    # Sections the dependency lists go to, in order of preference
+    DEPENDENCY_SECTIONS = ["Dependency", "Dependencies", "Software Dependencies", "Python Libraries", "Install Dependencies"]
+    DEV_DEPENDENCY_SECTIONS = ["Install Developer Tools", "Developer Dependencies", "Development Setup", "Dev Dependencies"]
+
+    def _generate_dependency_section(self, is_dev):
+        """Fill the Dependency or Install Developer Tools section.
+
+        Both sections come from the same collect_dependencies() pass, which
+        reads requirements files, pyproject.toml, setup.py, setup.cfg and
+        Pipfile (cached until they change). With Installed versions
+        checked, each requirement also shows what this Python environment
+        has installed.
+        """
+        kind = "developer dependencies" if is_dev else "dependencies"
         try:
-            # Get the project directory
-            if self.main_frame and self.main_frame.current_file:
-                project_dir = os.path.dirname(self.main_frame.current_file)
-            else:
-                project_dir = os.getcwd()
-            
-            dev_requirements_file = os.path.join(project_dir, "requirements-dev.txt")
-            
-            if not os.path.exists(dev_requirements_file):
-                wx.MessageBox(f"requirements-dev.txt not found in {project_dir}",
-                            "File Not Found", wx.OK | wx.ICON_WARNING)
+            project_dir = self._project_dir()
+            dependencies = collect_dependencies(project_dir)
+            if not dependencies.sources:
+                wx.MessageBox(f"No requirements files, pyproject.toml, setup.py or "
+                              f"Pipfile found in {project_dir}",
+                              "File Not Found", wx.OK | wx.ICON_WARNING)
                 return
-            
-            # Read and parse requirements-dev.txt
-            dev_dependencies_content = self._parse_requirements_file(dev_requirements_file, is_dev=True)
-            
-            # Find appropriate section(s) for developer dependencies
-            target_sections = ["Install Developer Tools", "Developer Dependencies", "Development Setup", "Dev Dependencies"]
-            section = None
-            for section_name in target_sections:
-                section = self._find_section_by_name(self.template_root, section_name)
-                if section:
-                    break
-            
-            if section:
-                section.content = dev_dependencies_content
-                section.enabled = True
-                
-                # If this section is currently selected, update the editor
-                if self.current_section == section:
-                    self.section_editor.SetValue(section.content)
-                
-                # Refresh tree to show enabled section
-                self.refresh_tree_display()
-                
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if hasattr(self.main_frame, 'status_bar'):
-                        self.main_frame.status_bar.SetStatusText(
-                            "Generated developer dependencies from requirements-dev.txt")
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
-            else:
-                wx.MessageBox("Could not find a suitable developer dependencies section in template.",
-                            "Section Not Found", wx.OK | wx.ICON_WARNING)
-                
+            installed = installed_distributions() \
+                if self.installed_versions_cb.GetValue() else None
+            content = format_dependencies(dependencies, is_dev=is_dev,
+                                          installed=installed)
+
+            target_sections = self.DEV_DEPENDENCY_SECTIONS if is_dev else self.DEPENDENCY_SECTIONS
+            with self.batch():
+                if self._fill_generated_section(target_sections, content):
+                    self.sections_changed(
+                        f"Generated {kind} from {', '.join(dependencies.sources)}")
+                else:
+                    wx.MessageBox(f"Could not find a suitable {kind} section in template.",
+                                "Section Not Found", wx.OK | wx.ICON_WARNING)
+
         except Exception as e:
-            wx.MessageBox(f"Error generating developer dependencies: {str(e)}",
+            wx.MessageBox(f"Error generating {kind}: {str(e)}",
                         "Error", wx.OK | wx.ICON_ERROR)
 
     def on_auto_populate_examples_main(self, event):
         """Populate Example Code > Main from examples/ directory"""
         try:
-            # Resolve project root
-            project_dir = os.path.dirname(self.main_frame.current_file) if (self.main_frame and self.main_frame.current_file) else os.getcwd()
+            project_dir = self._project_dir()
             examples_dir = os.path.join(project_dir, "examples")
             if not os.path.isdir(examples_dir):
                 wx.MessageBox(f"examples/ directory not found in {project_dir}", "Not Found", wx.OK | wx.ICON_WARNING)
                 return
-            # Concatenate example files into a markdown code block listing
-            combined = []
-            for root_dir, _, files in os.walk(examples_dir):
-                for fn in sorted(files):
-                    file_path = os.path.join(root_dir, fn)
-                    rel = os.path.relpath(file_path, project_dir)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            code = f.read()
-                    except Exception:
-                        code = ""
-                    combined.append(f"### {rel}\n\n```\n{code}\n```\n")
-            content_md = "\n".join(combined).strip() or "No examples found."
+            # List the example files as code blocks, bounded in size
+            content_md = collect_examples(examples_dir, project_dir)
             # Find Example Code > Main
-            section = self._find_section_by_name(self.template_root, "Main")
-            if section:
-                section.content = content_md
-                section.enabled = True
-                if self.current_section == section:
-                    self.section_editor.SetValue(section.content)
-                self.refresh_tree_display()
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if hasattr(self.main_frame, 'status_bar'):
-                        self.main_frame.status_bar.SetStatusText("Populated Example Code → Main from examples/")
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
-            else:
-                wx.MessageBox("Could not find 'Main' under Example Code.", "Section Not Found", wx.OK | wx.ICON_WARNING)
+            with self.batch():
+                if self._fill_generated_section(["Main"], content_md):
+                    self.sections_changed("Populated Example Code → Main from examples/")
+                else:
+                    wx.MessageBox("Could not find 'Main' under Example Code.", "Section Not Found", wx.OK | wx.ICON_WARNING)
         except Exception as e:
             wx.MessageBox(f"Error populating examples: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
 
     def on_auto_generate_glossary(self, event):
         """Generate Glossary terms by scanning codebase for docstrings and identifiers"""
-        try:
-            project_dir = os.path.dirname(self.main_frame.current_file) if (self.main_frame and self.main_frame.current_file) else os.getcwd()
-            terms = self._scan_glossary_terms(project_dir)
-            if not terms:
-                wx.MessageBox("No glossary terms found.", "Info", wx.OK | wx.ICON_INFORMATION)
-                return
-            lines = ["### Glossary\n"]
-            for term, definition in sorted(terms.items()):
-                lines.append(f"- **{term}**: {definition}")
-            glossary_md = "\n".join(lines)
-            # Find References > Glossary
-            glossary_section = self._find_section_by_name(self.template_root, "Glossary")
-            if glossary_section:
-                glossary_section.content = glossary_md
-                glossary_section.enabled = True
-                if self.current_section == glossary_section:
-                    self.section_editor.SetValue(glossary_section.content)
-                self.refresh_tree_display()
-                if self.main_frame:
-                    self.main_frame.set_modified()
-                    if hasattr(self.main_frame, 'status_bar'):
-                        self.main_frame.status_bar.SetStatusText("Generated glossary from codebase")
-                    if self.main_frame.preview_visible:
-                        wx.CallAfter(self.main_frame.update_preview)
+        if self.glossary_scanner is not None or self.automation_pipeline is not None:
+            return  # A scan is already running
+        project_dir = self._project_dir()
+
+        progress = wx.ProgressDialog(
+            "Generating Glossary", "Finding Python files...",
+            maximum=100, parent=self,
+            style=wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME
+            | wx.PD_REMAINING_TIME)
+
+        def finish():
+            self.glossary_scanner = None
+            progress.Destroy()
+
+        def on_progress(done, total):
+            percent = done * 100 // total if total else 100
+            keep_going, _ = progress.Update(
+                min(percent, 99), f"Parsing Python files... {done:,} of {total:,}")
+            if not keep_going:
+                scanner.cancel()
+                finish()
+                if self.main_frame and hasattr(self.main_frame, 'status_bar'):
+                    self.main_frame.status_bar.SetStatusText("Glossary generation cancelled")
+
+        def on_done(terms):
+            finish()
+            try:
+                self._apply_glossary_terms(terms)
+            except Exception as e:
+                wx.MessageBox(f"Error generating glossary: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+
+        def on_error(error):
+            finish()
+            wx.MessageBox(f"Error generating glossary: {str(error)}", "Error", wx.OK | wx.ICON_ERROR)
+
+        scanner = GlossaryScanner(
+            project_dir, on_done, on_error, on_progress, post=wx.CallAfter,
+            index_path=getattr(self.main_frame, 'symbol_index_path', None))
+        self.glossary_scanner = scanner
+        scanner.start()
+
+    @staticmethod
+    def _glossary_markdown(terms):
+        """Return the Glossary section content for scanned terms"""
+        lines = ["### Glossary\n"]
+        for term, definition in sorted(terms.items()):
+            lines.append(f"- **{term}**: {definition}")
+        return "\n".join(lines)
+
+    def _apply_glossary_terms(self, terms):
+        """Fill the Glossary section with scanned terms"""
+        if not terms:
+            wx.MessageBox("No glossary terms found.", "Info", wx.OK | wx.ICON_INFORMATION)
+            return
+        # Find References > Glossary
+        with self.batch():
+            if self._fill_generated_section(["Glossary"], self._glossary_markdown(terms)):
+                self.sections_changed("Generated glossary from codebase")
             else:
                 wx.MessageBox("Could not find 'Glossary' section.", "Section Not Found", wx.OK | wx.ICON_WARNING)
-        except Exception as e:
-            wx.MessageBox(f"Error generating glossary: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+
+    def _generation_stages(self, project_dir):
+        """The Generate All stages. Each runs on a worker thread, so it
+        must not touch wx; it returns (section_names, content) pairs for
+        _apply_generated_results(), or raises to report why it found
+        nothing."""
+        examples_dir = os.path.join(project_dir, "examples")
+        index_path = getattr(self.main_frame, 'symbol_index_path', None)
+        annotate = self.installed_versions_cb.GetValue()
+
+        def file_structure(cancelled):
+            return [(["Project Structure"], self._scan_directory_structure(project_dir))]
+
+        def dependencies(cancelled):
+            # One pass fills both dependency sections
+            found = collect_dependencies(project_dir)
+            if not found.sources:
+                raise FileNotFoundError(
+                    "No requirements files, pyproject.toml, setup.py or Pipfile found")
+            installed = installed_distributions() if annotate else None
+            return [(self.DEPENDENCY_SECTIONS,
+                     format_dependencies(found, is_dev=False, installed=installed)),
+                    (self.DEV_DEPENDENCY_SECTIONS,
+                     format_dependencies(found, is_dev=True, installed=installed))]
+
+        def examples(cancelled):
+            if not os.path.isdir(examples_dir):
+                raise FileNotFoundError("examples/ directory not found")
+            return [(["Main"], collect_examples(examples_dir, project_dir))]
+
+        def glossary(cancelled):
+            # Parses on the glossary's process pool and uses the symbol index
+            terms = collect_glossary_terms(project_dir, cancelled, index_path=index_path)
+            if terms is None:
+                return []  # Cancelled
+            if not terms:
+                raise LookupError("No glossary terms found")
+            return [(["Glossary"], self._glossary_markdown(terms))]
+
+        return [PipelineStage("File Structure", file_structure),
+                PipelineStage("Dependencies", dependencies),
+                PipelineStage("Examples", examples),
+                PipelineStage("Glossary", glossary)]
+
+    def on_generate_all(self, event):
+        """Run every generator concurrently and apply the results together"""
+        if self.automation_pipeline is not None or self.glossary_scanner is not None:
+            return  # A scan is already running
+        project_dir = self._project_dir()
+        stages = self._generation_stages(project_dir)
+        total = len(stages)
+        started = time.perf_counter()
+        finished = [0]  # Stages done, for redrawing the dialog
+
+        progress = wx.ProgressDialog(
+            "Generate All", f"Running {total} generators...",
+            maximum=total, parent=self,
+            style=wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME)
+
+        def finish():
+            self.automation_pipeline = None
+            progress.Destroy()
+
+        def update(done, message=""):
+            # The dialog only notices Cancel when it is updated
+            keep_going, _ = progress.Update(min(done, total - 1), message)
+            if not keep_going:
+                pipeline.cancel()
+                finish()
+                if self.main_frame and hasattr(self.main_frame, 'status_bar'):
+                    self.main_frame.status_bar.SetStatusText("Generate All cancelled")
+
+        def poll():
+            if self.automation_pipeline is pipeline:
+                update(finished[0])
+                wx.CallLater(200, poll)
+
+        def on_progress(done, total, result):
+            finished[0] = done
+            update(done, f"{result.name} finished in {result.seconds:.2f} s "
+                         f"({done} of {total})")
+
+        def on_done(results):
+            finish()
+            try:
+                self._apply_generated_results(results, time.perf_counter() - started)
+            except Exception as e:
+                wx.MessageBox(f"Error applying generated sections: {str(e)}",
+                              "Error", wx.OK | wx.ICON_ERROR)
+
+        pipeline = AutomationPipeline(stages, on_done, on_progress, post=wx.CallAfter)
+        self.automation_pipeline = pipeline
+        pipeline.start()
+        wx.CallLater(200, poll)
+
+    def _apply_generated_results(self, results, seconds):
+        """Apply every Generate All result, then refresh once"""
+        filled = []
+        problems = []
+        with self.batch():
+            for result in results:
+                if result.error is not None:
+                    problems.append(f"{result.name}: {result.error}")
+                    continue
+                for section_names, content in result.value:
+                    section = self._fill_generated_section(section_names, content)
+                    if section:
+                        filled.append(section.name)
+                    else:
+                        problems.append(f"{result.name}: could not find a "
+                                        f"'{section_names[0]}' section in template")
+
+            if filled:
+                timings = ", ".join(f"{result.name} {result.seconds:.2f} s"
+                                    for result in results)
+                self.sections_changed(f"Generated {len(filled)} sections in "
+                                      f"{seconds:.2f} s ({timings})")
+        if problems:
+            wx.MessageBox("Some sections were not generated:\n\n" + "\n".join(problems),
+                          "Generate All", wx.OK | wx.ICON_WARNING)
 
     def _scan_glossary_terms(self, project_dir: str):
         """Scan Python files for function/class names and first docstring line as definition"""
-        terms = {}
-        try:
-            import ast
-        except Exception:
-            return terms
-        for root_dir, _, files in os.walk(project_dir):
-            # Skip virtual envs and common dirs
-            base = os.path.basename(root_dir)
-            if base in {'.git', '__pycache__', 'venv', '.venv', 'env', 'node_modules', '.pytest_cache', 'dist', 'build'}:
-                continue
-            for fn in files:
-                if fn.endswith('.py'):
-                    file_path = os.path.join(root_dir, fn)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            source = f.read()
-                        tree = ast.parse(source, filename=file_path)
-                        for node in ast.walk(tree):
-                            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                                name = node.name
-                                doc = ast.get_docstring(node) or ""
-                                first = doc.strip().splitlines()[0] if doc.strip() else "Definition not available."
-                                if name not in terms:
-                                    terms[name] = first
-                    except Exception:
-                        continue
-        return terms
+        return scan_glossary_terms(project_dir)
 
     # Helper methods for automation
     def _find_section_by_name(self, section, name):
@@ -2578,41 +3593,13 @@ class StructuredEditor(wx.Panel):
     def _scan_directory_structure(self, directory):
         """Scan directory and generate markdown file structure"""
         try:
-            def generate_tree(path, prefix="", is_last=True, max_depth=3, current_depth=0):
-                if current_depth > max_depth:
-                    return ""
-                
-                items = []
+            cache = getattr(self.main_frame, 'directory_cache', None)
+            tree_content = f"```\n{generate_file_tree(directory, cache=cache)}```\n\n"
+            if cache is not None:
                 try:
-                    for item in sorted(os.listdir(path)):
-                        # Skip hidden files and common unwanted directories
-                        if item.startswith('.') or item in ['__pycache__', 'node_modules', '.git', '.venv', 'venv', 'env', '.pytest_cache']:
-                            continue
-                        items.append(item)
-                except PermissionError:
-                    return f"{prefix}├── [Permission Denied]\n"
-                
-                result = ""
-                for i, item in enumerate(items):
-                    is_last_item = i == len(items) - 1
-                    item_path = os.path.join(path, item)
-                    
-                    if is_last_item:
-                        result += f"{prefix}└── {item}\n"
-                        new_prefix = prefix + "    "
-                    else:
-                        result += f"{prefix}├── {item}\n"
-                        new_prefix = prefix + "│   "
-                    
-                    if os.path.isdir(item_path) and current_depth < max_depth:
-                        result += generate_tree(item_path, new_prefix, is_last_item, max_depth, current_depth + 1)
-                
-                return result
-            
-            project_name = os.path.basename(directory)
-            tree_content = f"```\n{project_name}/\n"
-            tree_content += generate_tree(directory, "", True)
-            tree_content += "```\n\n"
+                    cache.save()
+                except OSError:
+                    pass  # Only costs a full scan next time
             tree_content += f"Generated from: `{directory}`"
             
             return tree_content
@@ -2620,62 +3607,6 @@ class StructuredEditor(wx.Panel):
         except Exception as e:
             return f"Error generating file structure: {str(e)}"
 
-    def _parse_requirements_file(self, requirements_file, is_dev=False):
-        """Parse requirements.txt file and generate markdown content"""
-        try:
-            with open(requirements_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            content = ""
-            if is_dev:
-                content += "### Development Dependencies\n\n"
-                content += "These packages are required for development and testing:\n\n"
-            else:
-                content += "### Required Dependencies\n\n"
-                content += "This project requires the following Python packages:\n\n"
-            
-            # Parse requirements
-            packages = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#') and not line.startswith('-'):
-                    # Handle different requirement formats
-                    if '>=' in line:
-                        package, version = line.split('>=', 1)
-                        packages.append(f"- **{package.strip()}** >= {version.strip()}")
-                    elif '==' in line:
-                        package, version = line.split('==', 1)
-                        packages.append(f"- **{package.strip()}** (version {version.strip()})")
-                    elif '>' in line:
-                        package, version = line.split('>', 1)
-                        packages.append(f"- **{package.strip()}** > {version.strip()}")
-                    elif '<' in line:
-                        package, version = line.split('<', 1)
-                        packages.append(f"- **{package.strip()}** < {version.strip()}")
-                    else:
-                        packages.append(f"- **{line.strip()}**")
-            
-            if packages:
-                content += "\n".join(packages)
-                content += "\n\n"
-                if is_dev:
-                    content += "#### Install Development Dependencies\n\n"
-                    content += "```bash\n"
-                    content += "pip install -r requirements-dev.txt\n"
-                    content += "```"
-                else:
-                    content += "#### Install Dependencies\n\n"
-                    content += "```bash\n"
-                    content += "pip install -r requirements.txt\n"
-                    content += "```"
-            else:
-                content += "No dependencies found in requirements file."
-            
-            return content
-            
-        except Exception as e:
-            return f"Error reading requirements file: {str(e)}"
-
 
 if __name__ == "__main__":
     app = ReadmeEditorApp()
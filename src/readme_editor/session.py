@@ -0,0 +1,57 @@
+"""
+README Editor Session
+Versioned snapshot of the editor state, restored on the next launch
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+try:
+    from .file_io import write_atomic  # type: ignore
+except ImportError:
+    from file_io import write_atomic  # type: ignore
+
+# Version of the session format; snapshots in any other format are ignored
+SESSION_FORMAT = 1
+
+
+def file_stamp(path: str) -> Optional[Dict]:
+    """Return the modification time and size recorded for a file"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def save_session(path: str, session: Dict):
+    """Write a session snapshot.
+
+    session holds 'files', a list of per-file states, each with at least
+    'path' and the file_stamp() taken when the state was captured.
+    """
+    session = dict(session, format=SESSION_FORMAT)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = json.dumps(session, ensure_ascii=False, separators=(',', ':'))
+    write_atomic(path, data.encode('utf-8'))
+
+
+def load_session(path: str) -> Optional[Dict]:
+    """Read a session snapshot, dropping files changed since it was taken"""
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            session = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(session, dict) or session.get('format') != SESSION_FORMAT:
+        return None
+
+    files = []
+    for state in session.get('files', []):
+        stamp = file_stamp(state.get('path', ""))
+        if stamp is not None and stamp == {'mtime_ns': state.get('mtime_ns'),
+                                           'size': state.get('size')}:
+            files.append(state)
+    session['files'] = files
+    return session
@@ -4,7 +4,19 @@ Defines the hierarchical structure for the project README template
 """
 
 import wx
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .markdown_sections import (  # type: ignore
+        MarkdownBlock, parse_heading, split_line_ending,
+        split_markdown_sections, split_padding)
+except ImportError:
+    from markdown_sections import (  # type: ignore
+        MarkdownBlock, parse_heading, split_line_ending,
+        split_markdown_sections, split_padding)
+
+# Suffix appended to headers when "Link headers to TOC" is enabled
+TOC_LINK = "[Table of Contents](#table-of-contents)"
 
 
 class ReadmeSection:
@@ -14,15 +26,26 @@ class ReadmeSection:
                  name: str,
                  content: str = "",
                  optional: bool = False,
-                 level: int = 1):
+                 level: int = 1,
+                 dynamic: bool = False):
         self.name = name
         self.content = content
         self.optional = optional
         self.level = level
+        self.dynamic = dynamic  # Created from an imported heading, not the template
         self.enabled = True  # Track if section is enabled/disabled
         self.children: List['ReadmeSection'] = []
         self.parent: Optional['ReadmeSection'] = None
 
+        # Exact source formatting, set when the section was imported from
+        # markdown so that exporting reproduces the original text
+        self.source_heading: Optional[str] = None
+        self.source_padding: Tuple[str, str] = ("", "")
+        self.source_preamble = ""
+        # Imported table of contents that matched the generated one; it
+        # was cleared and is generated again on export
+        self.generated_toc = False
+
     def add_child(self, child: 'ReadmeSection'):
         """Add a child section"""
         child.parent = self
@@ -41,6 +64,23 @@ class ReadmeSection:
         header = "#" * self.level + " " + self.name
         return header
 
+    def get_source_heading(self, include_toc_links: bool = False) -> str:
+        """Get the heading line (with line ending) used when exporting"""
+        if self.source_heading == "":
+            return ""  # Imported without a heading line
+        if self.source_heading is None:
+            line, ending = self.get_markdown_header(), "\n"
+        else:
+            line, ending = split_line_ending(self.source_heading)
+            parsed = parse_heading(line)
+            if not parsed or _strip_toc_link(parsed[1]) != self.name:
+                # Renamed since import - rebuild at the original depth
+                depth = parsed[0] if parsed else max(self.level, 1)
+                line = "#" * depth + " " + self.name
+        if include_toc_links and TOC_LINK not in line:
+            line = f"{line} {TOC_LINK}"
+        return line + ending
+
     def get_anchor_id(self) -> str:
         """Get the anchor ID for linking (GitHub-style)"""
         # Convert to lowercase, replace spaces and special chars with hyphens
@@ -123,6 +163,286 @@ class ReadmeSection:
         ) if toc_lines else "No sections to display in table of contents."
 
 
+def iter_sections(section: ReadmeSection) -> Iterator[ReadmeSection]:
+    """Iterate over a section and all of its descendants in document order"""
+    yield section
+    for child in section.children:
+        yield from iter_sections(child)
+
+
+def _strip_toc_link(title: str) -> str:
+    """Remove a trailing Table of Contents link from a heading title"""
+    if title.endswith(TOC_LINK):
+        return title[:-len(TOC_LINK)].rstrip()
+    return title
+
+
+def _set_source(section: ReadmeSection, heading: str, body: str):
+    """Store a section's imported heading and body"""
+    lead, content, trail = split_padding(body)
+    section.source_heading = heading
+    section.source_padding = (lead, trail)
+    section.content = content
+
+
+def _order_imported_children(parent: ReadmeSection,
+                             imported: List[ReadmeSection]):
+    """Put imported children in document order.
+
+    Template sections that were not imported stay after the sibling they
+    originally followed, so the tree keeps its familiar shape.
+    """
+    imported_ids = {id(child) for child in imported}
+    leading = []
+    followers: Dict[int, List[ReadmeSection]] = {}
+    anchor = None
+    for child in parent.children:
+        if id(child) in imported_ids:
+            anchor = child
+        elif anchor is None:
+            leading.append(child)
+        else:
+            followers.setdefault(id(anchor), []).append(child)
+
+    parent.children = leading
+    for child in imported:
+        parent.children.append(child)
+        parent.children.extend(followers.get(id(child), []))
+
+
+def import_markdown(content: str, root: ReadmeSection) -> List[ReadmeSection]:
+    """Import markdown into a fresh template tree without losing any text.
+
+    Headings that match a template section fill that section (moving it under
+    the heading's parent if needed); any other heading becomes a dynamic
+    section at its own depth. Template sections that do not appear in the
+    document are disabled, so export_markdown() reproduces the input
+    byte-for-byte. Returns the section for each block of
+    split_markdown_sections() (the root covers the preamble and the H1).
+    """
+    blocks = split_markdown_sections(content)
+    preamble = blocks[0]
+
+    if len(blocks) > 1 and blocks[1].level == 1:
+        # Leading H1 is the project name; its body is the overview
+        root.name = _strip_toc_link(blocks[1].title)
+        root.source_preamble = preamble.body
+        _set_source(root, blocks[1].heading, blocks[1].body)
+        root_level, rest, imported = 1, blocks[2:], [root, root]
+    else:
+        root.source_preamble = ""
+        _set_source(root, "", preamble.body)
+        root_level, rest, imported = 0, blocks[1:], [root]
+
+    template_sections = list(iter_sections(root))[1:]
+    imported_ids = {id(root)}
+    children_order: Dict[int, Tuple[ReadmeSection, List[ReadmeSection]]] = {}
+    stack = [(root, root_level)]
+
+    for block in rest:
+        while len(stack) > 1 and stack[-1][1] >= block.level:
+            stack.pop()
+        parent = stack[-1][0]
+        name = _strip_toc_link(block.title)
+
+        # Prefer a template section already under this parent, then any
+        # unused template section with the same name
+        section = None
+        for candidate in parent.children + template_sections:
+            if candidate.name == name and id(candidate) not in imported_ids:
+                section = candidate
+                break
+        if section is None:
+            section = ReadmeSection(name, dynamic=True)
+        if section.parent is not parent:
+            if section.parent is not None:
+                section.parent.children.remove(section)
+            parent.add_child(section)
+
+        section.level = block.level
+        section.enabled = True
+        _set_source(section, block.heading, block.body)
+        imported.append(section)
+        imported_ids.add(id(section))
+        children_order.setdefault(id(parent), (parent, []))[1].append(section)
+        stack.append((section, block.level))
+
+    for parent, children in children_order.values():
+        _order_imported_children(parent, children)
+
+    # Template sections missing from the document stay in the tree, disabled
+    for section in iter_sections(root):
+        if id(section) not in imported_ids:
+            section.enabled = False
+            section.level = section.parent.level + 1
+
+    # An unmodified auto-generated table of contents stays auto-generated
+    for section in imported:
+        _detect_generated_toc(root, section)
+
+    return imported
+
+
+def _detect_generated_toc(root: ReadmeSection, section: ReadmeSection):
+    """Clear a table of contents that matches the generated one"""
+    if section.name != "Table of contents":
+        return
+    section.generated_toc = section.content == root.generate_table_of_contents()
+    if section.generated_toc:
+        section.content = ""
+
+
+def patch_imported_markdown(root: ReadmeSection,
+                            sections: List[ReadmeSection],
+                            old_content: str,
+                            content: str) -> Optional[List[ReadmeSection]]:
+    """Update only the sections whose text changed since old_content.
+
+    sections must line up with the blocks of old_content, as returned by
+    import_markdown() or collected by export_markdown(). Returns the changed
+    sections, or None when headings were added, removed or edited and the
+    document has to be imported again.
+    """
+    old_blocks = split_markdown_sections(old_content)
+    new_blocks = split_markdown_sections(content)
+    if not len(sections) == len(old_blocks) == len(new_blocks):
+        return None
+    if any(old.heading != new.heading
+           for old, new in zip(old_blocks, new_blocks)):
+        return None
+
+    changed = []
+    for index, (section, old, new) in enumerate(
+            zip(sections, old_blocks, new_blocks)):
+        if old.body == new.body:
+            continue
+        if index == 0 and section.source_heading:
+            # Text above the project name heading
+            section.source_preamble = new.body
+        else:
+            _set_source(section, new.heading, new.body)
+            _detect_generated_toc(root, section)
+        changed.append(section)
+    return changed
+
+
+def export_markdown(root: ReadmeSection,
+                    include_toc_links: bool = False,
+                    sections: Optional[List[ReadmeSection]] = None) -> str:
+    """Convert an imported tree back to markdown, keeping source formatting.
+
+    If a sections list is given, it is filled with the section behind each
+    block of the output (see patch_imported_markdown()).
+    """
+    parts = [root.source_preamble]
+    if sections is None:
+        sections = []
+    sections.append(root)
+
+    def export_section(section: ReadmeSection):
+        if not section.enabled:
+            return
+        content = section.content
+        # An imported TOC that was empty is kept empty
+        if section.name == "Table of contents" and not content.strip() \
+                and (section.source_heading is None or section.generated_toc):
+            content = root.generate_table_of_contents()
+
+        if section.source_heading is None:
+            # Added after import - use the standard layout
+            if parts[-1] and not "".join(parts[-2:]).endswith("\n\n"):
+                parts.append("\n" if parts[-1].endswith("\n") else "\n\n")
+            parts.append(section.get_source_heading(include_toc_links))
+            parts.append("\n" + content.strip() + "\n\n"
+                         if content.strip() else "\n")
+        else:
+            lead, trail = section.source_padding
+            parts.append(section.get_source_heading(include_toc_links))
+            if content and not trail.startswith(("\n", "\r")):
+                content += "\n"  # Never run into the next heading
+            parts.append(lead + content + trail)
+        if section is not root or section.source_heading:
+            sections.append(section)
+
+        for child in section.children:
+            export_section(child)
+
+    export_section(root)
+    return "".join(parts)
+
+
+def snapshot_sections(root: ReadmeSection,
+                      sections: List[ReadmeSection],
+                      blocks: List[MarkdownBlock]) -> List[Dict]:
+    """Describe an imported tree compactly, for restoring without parsing.
+
+    sections must line up with blocks (as import_markdown() returns them).
+    Imported sections are stored as character offsets into the text
+    instead of their content; see restore_sections().
+    """
+    block_index = {}
+    for index, section in enumerate(sections):
+        block_index[id(section)] = index  # The root's heading block wins
+
+    entries = []
+
+    def add(section: ReadmeSection, depth: int):
+        entry = {'depth': depth, 'name': section.name, 'level': section.level,
+                 'optional': section.optional, 'dynamic': section.dynamic,
+                 'enabled': section.enabled}
+        index = block_index.get(id(section))
+        if index is not None:
+            block = blocks[index]
+            entry['start'] = block.start
+            entry['body'] = block.start + len(block.heading)
+            entry['end'] = blocks[index + 1].start \
+                if index + 1 < len(blocks) else None
+        else:
+            entry['content'] = section.content
+        entries.append(entry)
+        for child in section.children:
+            add(child, depth + 1)
+
+    add(root, 0)
+    return entries
+
+
+def restore_sections(entries: List[Dict],
+                     content: str) -> Tuple[ReadmeSection, List[ReadmeSection]]:
+    """Rebuild a tree stored by snapshot_sections() for the same content.
+
+    Returns the root and the section behind each block, exactly as
+    import_markdown() would for content.
+    """
+    stack: List[ReadmeSection] = []
+    imported = []
+    for entry in entries:
+        section = ReadmeSection(entry['name'], optional=entry['optional'],
+                                dynamic=entry['dynamic'])
+        del stack[entry['depth']:]
+        if stack:
+            stack[-1].add_child(section)
+        stack.append(section)
+        section.level = entry['level']
+        section.enabled = entry['enabled']
+        if 'start' in entry:
+            _set_source(section, content[entry['start']:entry['body']],
+                        content[entry['body']:entry['end']])
+            imported.append((entry['start'], section))
+        else:
+            section.content = entry['content']
+
+    root = stack[0]
+    if root.source_heading:
+        root.source_preamble = content[:entries[0]['start']]
+    sections = [root] * (2 if root.source_heading else 1)
+    sections.extend(section for _, section in sorted(
+        imported, key=lambda item: item[0]) if section is not root)
+    for section in sections:
+        _detect_generated_toc(root, section)
+    return root, sections
+
+
 def create_readme_template() -> ReadmeSection:
     """Create the complete structured README template"""
 
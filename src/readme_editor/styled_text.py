@@ -0,0 +1,108 @@
+"""
+Scintilla Text Control
+A wx.stc.StyledTextCtrl that speaks the character-offset wx.TextCtrl
+interface the General Editor and the Format menu use, for documents too
+large for a native rich text control
+"""
+
+import wx
+
+try:
+    import wx.stc as stc
+    STC_AVAILABLE = True
+except ImportError:  # Some wxPython builds leave out Scintilla
+    stc = None
+    STC_AVAILABLE = False
+
+try:
+    from .char_index import CharacterIndex  # type: ignore
+except ImportError:
+    from char_index import CharacterIndex  # type: ignore
+
+
+class StyledTextEditor(stc.StyledTextCtrl if STC_AVAILABLE else wx.Control):
+    """Plain text editor on Scintilla.
+
+    Scintilla keeps the text in a gap buffer, caches line layouts and has
+    its own undo, so multi-megabyte documents stay responsive. It
+    addresses text by UTF-8 byte position; the wx.TextCtrl methods below
+    take and return character offsets, mapped through a CharacterIndex.
+    There is one text style, so formatting applies to the whole text.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.index = CharacterIndex(self)
+        self.SetCodePage(stc.STC_CP_UTF8)
+        self.SetEOLMode(stc.STC_EOL_LF)
+        self.SetWrapMode(stc.STC_WRAP_WORD)
+        self.SetLayoutCache(stc.STC_CACHE_PAGE)
+        self.SetMarginWidth(1, 0)
+        # Only text changes matter to the index
+        self.SetModEventMask(stc.STC_MOD_INSERTTEXT | stc.STC_MOD_DELETETEXT)
+        self.Bind(stc.EVT_STC_MODIFIED, self.on_modified)
+
+    def on_modified(self, event):
+        """Drop cached line starts after the line an edit began on"""
+        self.index.invalidate(self.LineFromPosition(event.GetPosition()))
+        event.Skip()
+
+    def set_appearance(self, font=None, text_colour=None, background_colour=None):
+        """Set the font and colours of all the text"""
+        if font is not None:
+            self.StyleSetFont(stc.STC_STYLE_DEFAULT, font)
+        if text_colour is not None:
+            self.StyleSetForeground(stc.STC_STYLE_DEFAULT, text_colour)
+            self.SetCaretForeground(text_colour)
+        if background_colour is not None:
+            self.StyleSetBackground(stc.STC_STYLE_DEFAULT, background_colour)
+        self.StyleClearAll()
+
+    # wx.TextCtrl interface, in character offsets
+    def GetInsertionPoint(self):
+        return self.index.to_chars(self.GetCurrentPos())
+
+    def SetInsertionPoint(self, pos):
+        self.GotoPos(self.index.to_bytes(pos))
+
+    def GetLastPosition(self):
+        return self.index.to_chars(self.GetLength())
+
+    def GetSelection(self):
+        start, end = super().GetSelection()
+        return self.index.to_chars(start), self.index.to_chars(end)
+
+    def SetSelection(self, start, end):
+        if start == -1 and end == -1:
+            self.SelectAll()
+        else:
+            super().SetSelection(self.index.to_bytes(start),
+                                 self.index.to_bytes(end))
+
+    def Replace(self, start, end, value):
+        super().Replace(self.index.to_bytes(start), self.index.to_bytes(end), value)
+
+    def Remove(self, start, end):
+        super().Remove(self.index.to_bytes(start), self.index.to_bytes(end))
+
+    def GetRange(self, start, end):
+        return super().GetRange(self.index.to_bytes(start), self.index.to_bytes(end))
+
+    def ShowPosition(self, pos):
+        super().ShowPosition(self.index.to_bytes(pos))
+
+    def PositionToXY(self, pos):
+        position = self.index.to_bytes(pos)
+        line = self.LineFromPosition(position)
+        return True, self.CountCharacters(self.PositionFromLine(line), position), line
+
+    def SetStyle(self, start, end, style):
+        """Apply a text style; with one Scintilla style it covers all the text"""
+        return self.SetDefaultStyle(style)
+
+    def SetDefaultStyle(self, style):
+        self.set_appearance(
+            style.GetFont() if style.HasFont() else None,
+            style.GetTextColour() if style.HasTextColour() else None,
+            style.GetBackgroundColour() if style.HasBackgroundColour() else None)
+        return True
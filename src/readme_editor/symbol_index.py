@@ -0,0 +1,141 @@
+"""
+Glossary Symbol Index
+On-disk index of each source file's functions and classes, so glossary
+generation only parses files changed since the last run
+"""
+
+import os
+import sqlite3
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+try:
+    from .file_watcher import hash_file  # type: ignore
+except ImportError:
+    from file_watcher import hash_file  # type: ignore
+
+# Version of the index schema; an index in any other version is rebuilt
+INDEX_FORMAT = 1
+
+
+class FileSymbols(NamedTuple):
+    """A source file's terms and the state of the file they were read from"""
+    mtime_ns: int
+    size: int
+    digest: str                   # sha1 of the file's contents
+    terms: List[Tuple[str, str]]  # (name, definition) in source order
+
+
+def _prefix_range(directory: str) -> Tuple[str, str]:
+    """Half-open string range holding every path below directory"""
+    prefix = os.path.join(os.path.abspath(directory), "")
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SymbolIndex:
+    """sqlite3 index of source file symbols keyed by path, mtime, size and
+    content hash.
+
+    A file whose mtime and size match its entry is trusted without being
+    read; one whose mtime moved but whose size and hash still match (a
+    checkout or touch) keeps its symbols too. Like any sqlite3 connection,
+    an index is used from the thread that opened it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10)
+        self._setup()
+
+    def _setup(self):
+        """Create the schema, discarding an index in another format"""
+        db = self._db
+        if db.execute("PRAGMA user_version").fetchone()[0] != INDEX_FORMAT:
+            db.executescript("""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS symbols;
+                CREATE TABLE files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    digest TEXT NOT NULL
+                );
+                CREATE TABLE symbols (
+                    path TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    definition TEXT NOT NULL,
+                    PRIMARY KEY (path, seq)
+                ) WITHOUT ROWID;
+            """)
+            db.execute(f"PRAGMA user_version = {INDEX_FORMAT}")
+            db.commit()
+
+    def fresh_symbols(self, directory: str,
+                      paths: Iterable[str]) -> Dict[str, List[Tuple[str, str]]]:
+        """Return the indexed terms of the paths unchanged since indexing"""
+        low, high = _prefix_range(directory)
+        entries = {row[0]: row[1:] for row in self._db.execute(
+            "SELECT path, mtime_ns, size, digest FROM files"
+            " WHERE path >= ? AND path < ?", (low, high))}
+
+        fresh = set()
+        touched = []
+        for path in paths:
+            entry = entries.get(path)
+            if entry is None:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_mtime_ns == entry[0] and stat.st_size == entry[1]:
+                fresh.add(path)
+            elif stat.st_size == entry[1] and hash_file(path) == entry[2]:
+                fresh.add(path)
+                touched.append((stat.st_mtime_ns, path))
+        if touched:
+            self._db.executemany(
+                "UPDATE files SET mtime_ns = ? WHERE path = ?", touched)
+            self._db.commit()
+
+        symbols: Dict[str, List[Tuple[str, str]]] = {path: [] for path in fresh}
+        for path, name, definition in self._db.execute(
+                "SELECT path, name, definition FROM symbols"
+                " WHERE path >= ? AND path < ? ORDER BY path, seq", (low, high)):
+            if path in symbols:
+                symbols[path].append((name, definition))
+        return symbols
+
+    def update(self, records: Dict[str, FileSymbols]):
+        """Store freshly parsed files"""
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM symbols WHERE path = ?",
+                [(path,) for path in records])
+            self._db.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                [(path, record.mtime_ns, record.size, record.digest)
+                 for path, record in records.items()])
+            self._db.executemany(
+                "INSERT INTO symbols VALUES (?, ?, ?, ?)",
+                [(path, seq, name, definition)
+                 for path, record in records.items()
+                 for seq, (name, definition) in enumerate(record.terms)])
+
+    def prune(self, directory: str, keep: Iterable[str]):
+        """Forget files below directory other than keep (deleted or now
+        excluded files)"""
+        low, high = _prefix_range(directory)
+        keep = set(keep)
+        gone = [row for row in self._db.execute(
+            "SELECT path FROM files WHERE path >= ? AND path < ?", (low, high))
+            if row[0] not in keep]
+        if gone:
+            with self._db:
+                self._db.executemany("DELETE FROM files WHERE path = ?", gone)
+                self._db.executemany("DELETE FROM symbols WHERE path = ?", gone)
+
+    def close(self):
+        """Close the database connection"""
+        self._db.close()
@@ -0,0 +1,67 @@
+"""
+Batched View Updates
+Collects the view updates that section changes need, so that any number
+of changes redraw the tree, title and preview once
+"""
+
+from typing import Callable, FrozenSet, Optional, Set
+
+# Updates a change can need
+TREE = "tree"          # Rebuild the section tree
+MODIFIED = "modified"  # Mark the file modified and re-render the preview
+TITLE = "title"        # Update the window title
+
+
+class UpdateBatch:
+    """Defer view updates while a batch is open.
+
+    Used as a context manager; batches nest and the outermost one flushes
+    when it exits, even if it exits with an exception, since the changes
+    made before it are not undone. Outside a batch, requests flush at
+    once. flush(updates, status) is called with the set of updates needed
+    and the last status text requested.
+    """
+
+    def __init__(self, flush: Callable[[FrozenSet[str], Optional[str]], None]):
+        self._flush = flush
+        self._depth = 0
+        self._updates: Set[str] = set()
+        self._status: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        """True while updates are being deferred"""
+        return self._depth > 0
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            self.flush()
+        return False
+
+    def request(self, *updates: str, status: Optional[str] = None):
+        """Ask for updates, now or when the batch closes"""
+        self._updates.update(updates)
+        if status is not None:
+            self._status = status
+        if self._depth == 0:
+            self.flush()
+
+    def flush(self):
+        """Apply the pending updates.
+
+        Requests made by the flush itself (e.g. from events a tree rebuild
+        raises) are collected and applied after it, not in the middle.
+        """
+        self._depth += 1
+        try:
+            while self._updates or self._status is not None:
+                updates, self._updates = frozenset(self._updates), set()
+                status, self._status = self._status, None
+                self._flush(updates, status)
+        finally:
+            self._depth -= 1
@@ -15,13 +15,25 @@ if _SRC not in sys.path:
 from readme_editor.structured_template import (  # type: ignore
     ReadmeSection,
     create_readme_template,
+    export_markdown,
+    import_markdown,
+    iter_sections,
+    patch_imported_markdown,
     populate_tree_ctrl,
+    restore_sections,
+    snapshot_sections,
 )
 
 __all__ = [
     "ReadmeSection",
     "create_readme_template",
+    "export_markdown",
+    "import_markdown",
+    "iter_sections",
+    "patch_imported_markdown",
     "populate_tree_ctrl",
+    "restore_sections",
+    "snapshot_sections",
 ]
 
 
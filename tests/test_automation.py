@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the Generate All automation pipeline
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.automation import AutomationPipeline, PipelineStage
+
+
+def run_pipeline(stages):
+    outcome = {}
+    progress = []
+    pipeline = AutomationPipeline(
+        stages, lambda results: outcome.setdefault('results', results),
+        lambda done, total, result: progress.append((done, total, result.name)))
+    pipeline.start()
+    pipeline.join(10)
+    return outcome.get('results'), progress
+
+
+def test_stages_run_concurrently():
+    """Stages overlap, and results keep the order the stages were given"""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def stage(value, delay):
+        def run(cancelled):
+            barrier.wait()  # Only passes if all three run at once
+            time.sleep(delay)
+            return value
+        return run
+
+    results, progress = run_pipeline([
+        PipelineStage("slow", stage("a", 0.2)),
+        PipelineStage("medium", stage("b", 0.1)),
+        PipelineStage("fast", stage("c", 0.0)),
+    ])
+    assert [result.name for result in results] == ["slow", "medium", "fast"]
+    assert [result.value for result in results] == ["a", "b", "c"]
+    assert results[0].seconds >= 0.2
+    assert [name for _, _, name in progress] == ["fast", "medium", "slow"]
+    assert [done for done, _, _ in progress] == [1, 2, 3]
+    print("✅ PASS: Stages run concurrently and are timed")
+
+
+def test_failed_stage_is_reported():
+    """A stage that raises does not stop the others"""
+    def fail(cancelled):
+        raise FileNotFoundError("nothing here")
+
+    results, _ = run_pipeline([PipelineStage("broken", fail),
+                               PipelineStage("working", lambda cancelled: 42)])
+    assert isinstance(results[0].error, FileNotFoundError)
+    assert results[0].value is None
+    assert results[1].value == 42 and results[1].error is None
+    print("✅ PASS: Failed stages reported with the others' results")
+
+
+def test_cancel():
+    """Cancelled stages see the event and nothing more is reported"""
+    reported = []
+    stopped = threading.Event()
+
+    def wait_for_cancel(cancelled):
+        cancelled.wait(5)
+        stopped.set()
+
+    pipeline = AutomationPipeline([PipelineStage("waits", wait_for_cancel)],
+                                  reported.append,
+                                  lambda *args: reported.append(args))
+    pipeline.start()
+    pipeline.cancel()
+    pipeline.join(5)
+    assert stopped.is_set()
+    assert pipeline.is_cancelled()
+    assert reported == []
+    print("✅ PASS: Cancelling stops the stages quietly")
+
+
+if __name__ == "__main__":
+    test_stages_run_concurrently()
+    test_failed_stage_is_reported()
+    test_cancel()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script to verify character/byte position mapping for the Scintilla editor
+"""
+
+import os
+import random
+import sys
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.char_index import CharacterIndex
+
+
+class Utf8Document:
+    """The StyledTextCtrl position methods over a Python string"""
+
+    def __init__(self, text):
+        self.text = text
+        self.lookups = 0
+
+    @property
+    def data(self):
+        return self.text.encode('utf-8')
+
+    def GetLength(self):
+        return len(self.data)
+
+    def GetLineCount(self):
+        return self.text.count('\n') + 1
+
+    def PositionFromLine(self, line):
+        starts = [0] + [i + 1 for i, byte in enumerate(self.data) if byte == 10]
+        return starts[line] if line < len(starts) else -1
+
+    def LineFromPosition(self, position):
+        return self.data[:position].count(b'\n')
+
+    def CountCharacters(self, start, end):
+        self.lookups += 1
+        return len(self.data[start:end].decode('utf-8'))
+
+    def PositionRelative(self, position, relative):
+        chars = len(self.data[:position].decode('utf-8')) + relative
+        if chars > len(self.text):
+            return 0
+        return len(self.text[:chars].encode('utf-8'))
+
+    def replace(self, index, start, end, text):
+        line = self.LineFromPosition(len(self.text[:start].encode('utf-8')))
+        self.text = self.text[:start] + text + self.text[end:]
+        index.invalidate(line)
+
+
+def check(document, index):
+    text = document.text
+    for offset in range(len(text) + 1):
+        position = len(text[:offset].encode('utf-8'))
+        assert index.to_bytes(offset) == position, (offset, text)
+        assert index.to_chars(position) == offset, (position, text)
+    assert index.to_bytes(len(text) + 5) == document.GetLength()
+
+
+def test_mapping_with_multibyte_text():
+    """Offsets map both ways across ASCII, accents, CJK and emoji"""
+    document = Utf8Document("# Título\n\n日本語のテキスト\nplain ascii\n😀 emoji 😀\n")
+    check(document, CharacterIndex(document))
+    empty = Utf8Document("")
+    check(empty, CharacterIndex(empty))
+    print("✅ PASS: Character offsets map to UTF-8 positions and back")
+
+
+def test_edits_invalidate_following_lines():
+    """After edits the cache answers as if freshly built"""
+    rng = random.Random(7)
+    pieces = ["a", "é", "中", "😀", "\n", "line\n", "ü\n"]
+    document = Utf8Document("".join(rng.choice(pieces) for _ in range(200)))
+    index = CharacterIndex(document)
+    check(document, index)
+    for _ in range(40):
+        start = rng.randrange(len(document.text) + 1)
+        end = min(len(document.text), start + rng.randrange(5))
+        document.replace(index, start, end,
+                         "".join(rng.choice(pieces) for _ in range(rng.randrange(4))))
+        check(document, index)
+    print("✅ PASS: Edits invalidate cached line starts")
+
+
+def test_lookups_count_within_a_line():
+    """Once lines are indexed, a lookup counts characters in one line only"""
+    document = Utf8Document("ä" * 50 + "\n" + ("line ü\n" * 500))
+    index = CharacterIndex(document)
+    index.to_chars(document.GetLength())
+    document.lookups = 0
+    index.to_bytes(len(document.text) - 3)
+    index.to_chars(document.GetLength() - 3)
+    assert document.lookups <= 1
+    print("✅ PASS: Indexed lookups stay within a line")
+
+
+if __name__ == "__main__":
+    test_mapping_with_multibyte_text()
+    test_edits_invalidate_following_lines()
+    test_lookups_count_within_a_line()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script to verify dependency extraction for the dependency sections
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor import dependencies
+from readme_editor.dependencies import (
+    collect_dependencies,
+    format_requirement,
+    parse_requirement,
+)
+
+
+def make_project(files):
+    project = tempfile.mkdtemp()
+    for path, text in files.items():
+        with open(os.path.join(project, path), 'w') as file:
+            file.write(text)
+    return project
+
+
+def names(requirements):
+    return [requirement.name for requirement in requirements]
+
+
+def test_pep508_parsing():
+    """Extras, version clauses, markers and URLs are parsed"""
+    requirement = parse_requirement(
+        'requests[security, socks] >= 2.8.1, < 3 ; python_version < "3.8"')
+    assert requirement.name == "requests"
+    assert requirement.extras == ("security", "socks")
+    assert requirement.specifier == ">=2.8.1,<3"
+    assert requirement.marker == 'python_version < "3.8"'
+    assert parse_requirement("pkg @ https://example.com/pkg.zip").url \
+        == "https://example.com/pkg.zip"
+    assert parse_requirement("not a requirement") is None
+    assert format_requirement(parse_requirement("numpy==1.26")) \
+        == "- **numpy** (version 1.26)"
+    assert format_requirement(requirement) == (
+        '- **requests[security,socks]** >= 2.8.1, < 3 (when `python_version < "3.8"`)')
+    print("✅ PASS: PEP 508 requirements parsed")
+
+
+def test_all_sources_in_one_pass():
+    """Requirements files with includes, setup.py, pyproject and Pipfile"""
+    project = make_project({
+        "requirements.txt": "-r base.txt\nrequests>=2.0  # HTTP\n--index-url https://x\n",
+        "base.txt": "Click==8.1 \\\n    --hash=sha256:abc\n",
+        "requirements-dev.txt": "-r requirements.txt\npytest>=7\n",
+        "setup.py": ("from setuptools import setup\n"
+                     "setup(install_requires=read('requirements.txt'),\n"
+                     "      extras_require={'test': ['coverage'], 'gui': ['wxPython']})\n"),
+        "pyproject.toml": ('[project]\ndependencies = ["rich>=13", "click"]\n'
+                           '[project.optional-dependencies]\ndev = ["black"]\n'),
+        "Pipfile": ('[packages]\nattrs = "*"\n'
+                    '[dev-packages]\nmypy = ">=1.0"\npytest = "*"\n'),
+    })
+    try:
+        found = collect_dependencies(project)
+    finally:
+        shutil.rmtree(project)
+    assert names(found.runtime) == ["Click", "requests", "rich", "attrs"]
+    assert names(found.dev) == ["pytest", "black", "coverage", "mypy"]
+    assert found.install == "pip install -r requirements.txt"
+    assert found.dev_install == "pip install -r requirements-dev.txt"
+    print("✅ PASS: All dependency sources read in one pass")
+
+
+def test_parsed_files_are_cached():
+    """Unchanged files are not parsed again"""
+    project = make_project({"requirements.txt": "six\n"})
+    calls = []
+    original = dependencies._parse_requirements_txt
+
+    def counting_parse(path):
+        calls.append(path)
+        return original(path)
+
+    counting_parse.__name__ = original.__name__
+    dependencies._parse_requirements_txt = counting_parse
+    try:
+        collect_dependencies(project)
+        collect_dependencies(project)
+        assert len(calls) == 1
+        with open(os.path.join(project, "requirements.txt"), 'w') as file:
+            file.write("six\nattrs\n")
+        assert names(collect_dependencies(project).runtime) == ["six", "attrs"]
+        assert len(calls) == 2
+    finally:
+        dependencies._parse_requirements_txt = original
+        shutil.rmtree(project)
+    print("✅ PASS: Parsed files cached until they change")
+
+
+if __name__ == "__main__":
+    test_pep508_parsing()
+    test_all_sources_in_one_pass()
+    test_parsed_files_are_cached()
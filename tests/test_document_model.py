@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the shared document model used by both editors
+"""
+
+import os
+import sys
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.document_model import ReadmeDocument
+
+
+class MockEditor:
+    """Editor that mirrors the document the way the real editors do"""
+
+    def __init__(self, document):
+        self.document = document
+        self.buffer = document.text
+        self.changes = []
+        document.add_observer(self.on_document_changed)
+
+    def type_text(self, text):
+        self.buffer += text
+        self.document.set_pending(self, self.commit_to_document)
+
+    def commit_to_document(self):
+        self.document.set_text(self.buffer, origin=self)
+
+    def on_document_changed(self, change):
+        self.changes.append(change)
+        if change.origin is not self:
+            self.buffer = (self.buffer[:change.start] + change.text
+                           + self.buffer[change.end:])
+
+
+def test_changes_are_reported_as_ranges():
+    """Observers receive only the replaced range"""
+    document = ReadmeDocument("# Title\n\nBody\n")
+    general = MockEditor(document)
+    structured = MockEditor(document)
+
+    document.set_text("# Title\n\nNew Body\n", origin=general)
+    change = structured.changes[-1]
+    assert (change.start, change.end, change.text) == (9, 9, "New ")
+    assert change.origin is general
+    assert structured.buffer == document.text
+    print("✅ PASS: Minimal change ranges reported")
+
+
+def test_pending_edits_commit_on_read():
+    """Keystrokes are committed lazily, once, when the text is needed"""
+    document = ReadmeDocument("# Title\n")
+    general = MockEditor(document)
+    structured = MockEditor(document)
+
+    general.type_text("a")
+    general.type_text("b")
+    assert document.has_pending()
+    assert structured.changes == []
+
+    assert document.text == "# Title\nab"
+    assert len(structured.changes) == 1
+    assert structured.buffer == "# Title\nab"
+    assert not document.has_pending()
+    print("✅ PASS: Pending edits committed on read")
+
+
+def test_other_editor_pending_edits_commit_first():
+    """An edit from one editor never overwrites another's pending edits"""
+    document = ReadmeDocument("")
+    general = MockEditor(document)
+    structured = MockEditor(document)
+
+    general.type_text("one")
+    structured.buffer = document.text + " two"  # Flushes general first
+    structured.commit_to_document()
+    assert document.text == "one two"
+    assert general.buffer == "one two"
+    print("✅ PASS: Pending edits committed before other edits")
+
+
+def test_load_replaces_document_and_drops_pending():
+    """Opening a file replaces everything, including uncommitted edits"""
+    document = ReadmeDocument("old")
+    general = MockEditor(document)
+    general.type_text(" edit")
+
+    document.load("# Opened\n")
+    assert document.text == "# Opened\n"
+    assert general.changes[-1].origin is None
+    assert not document.has_pending()
+    print("✅ PASS: Load replaces the document")
+
+
+def test_section_index_and_hash_follow_versions():
+    """The section index and hash are rebuilt only after edits"""
+    document = ReadmeDocument("# A\n\ntext\n## B\n")
+    sections = document.sections
+    assert [block.title for block in sections] == ["", "A", "B"]
+    assert document.sections is sections
+    assert document.section_range(1) == (0, 10)
+
+    digest = document.content_hash
+    document.replace(5, 9, "more")
+    assert document.content_hash != digest
+    assert document.sections is not sections
+    print("✅ PASS: Section index and hash cached per version")
+
+
+if __name__ == "__main__":
+    test_changes_are_reported_as_ranges()
+    test_pending_edits_commit_on_read()
+    test_other_editor_pending_edits_commit_first()
+    test_load_replaces_document_and_drops_pending()
+    test_section_index_and_hash_follow_versions()
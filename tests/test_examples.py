@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the Example Code section generator
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.examples import collect_examples, fence_language
+
+
+def make_examples(files):
+    project = tempfile.mkdtemp()
+    for path, data in files.items():
+        full = os.path.join(project, "examples", path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, 'wb') as file:
+            file.write(data)
+    return project
+
+
+def test_fences_and_binary_files():
+    """Text files get language fences; binary files are only named"""
+    project = make_examples({
+        "demo.py": b"print('hi')\n",
+        "run.sh": b"echo ```\n",
+        "image.png": b"\x89PNG\r\n\x1a\n\x00\x00" + bytes(range(256)),
+        "__pycache__/demo.cpython-311.pyc": b"\x00" * 10,
+    })
+    try:
+        markdown = collect_examples(os.path.join(project, "examples"), project)
+    finally:
+        shutil.rmtree(project)
+    assert markdown == (
+        "### examples/demo.py\n\n```python\nprint('hi')\n```\n\n"
+        "### examples/image.png\n\n*Binary file (0.3 KB) not shown.*\n\n"
+        "### examples/run.sh\n\n````bash\necho ```\n````"), markdown
+    assert fence_language("Makefile") == "makefile"
+    assert fence_language("notes.unknown") == ""
+    print("✅ PASS: Language fences and binary detection")
+
+
+def test_size_caps():
+    """Files are cut at whole lines and the total is bounded"""
+    line = b"x = 1  # padding padding padding padding\n"
+    project = make_examples({f"ex{i:02}.py": line * 100 for i in range(20)})
+    try:
+        markdown = collect_examples(os.path.join(project, "examples"), project,
+                                    max_file_bytes=1000, max_total_bytes=5000,
+                                    workers=3)
+        again = collect_examples(os.path.join(project, "examples"), project,
+                                 max_file_bytes=1000, max_total_bytes=5000,
+                                 workers=3)
+    finally:
+        shutil.rmtree(project)
+    assert markdown == again
+    assert len(markdown.encode('utf-8')) <= 5000 + 200
+    assert "*Truncated: showing the first" in markdown
+    assert markdown.endswith("more example files not shown.*")
+    for block in markdown.split("```python\n")[1:]:
+        assert block.split("\n```")[0].endswith("padding")
+    print("✅ PASS: Per-file and total size caps")
+
+
+if __name__ == "__main__":
+    test_fences_and_binary_files()
+    test_size_caps()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script to verify chunked background file reading and atomic saving
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.file_io import FileLoader, FileSaver, iter_text_chunks
+
+
+def write_temp(data):
+    handle, path = tempfile.mkstemp(suffix=".md")
+    with os.fdopen(handle, 'wb') as file:
+        file.write(data)
+    return path
+
+
+def test_chunks_match_text_mode_read():
+    """Chunked decoding equals open(path, 'r').read() at any chunk size"""
+    text = "# Título\r\n\r\nÜnïcödé — ✅ text\r\nline\rend\n" * 5
+    path = write_temp(text.encode('utf-8'))
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            expected = file.read()
+        for chunk_size in (1, 2, 3, 7, 1024):
+            chunks = list(iter_text_chunks(path, chunk_size=chunk_size))
+            assert "".join(text for text, _, _ in chunks) == expected
+            assert chunks[-1][1] == chunks[-1][2] == os.path.getsize(path)
+    finally:
+        os.remove(path)
+    print("✅ PASS: Chunked reads decoded correctly")
+
+
+def test_loader_reports_progress_and_content():
+    """The loader reports progress and then the whole content"""
+    path = write_temp(b"# Title\n" * 100)
+    results, progress = [], []
+    try:
+        loader = FileLoader(path, results.append, results.append,
+                            on_progress=lambda done, total: progress.append(done),
+                            chunk_size=64)
+        loader.start()
+        loader.join(5)
+    finally:
+        os.remove(path)
+    assert results == ["# Title\n" * 100]
+    assert progress == sorted(progress) and progress[-1] == 800
+    print("✅ PASS: Loader reported progress and content")
+
+
+def test_loader_errors_and_cancel():
+    """Errors are reported, and a cancelled load reports nothing"""
+    errors = []
+    loader = FileLoader(os.path.join(tempfile.gettempdir(), "missing-readme.md"),
+                        errors.append, errors.append)
+    loader.start()
+    loader.join(5)
+    assert len(errors) == 1 and isinstance(errors[0], OSError)
+
+    path = write_temp(b"text\n" * 100)
+    results = []
+    try:
+        loader = FileLoader(path, results.append, results.append,
+                            on_progress=lambda done, total: loader.cancel(),
+                            chunk_size=16)
+        loader.start()
+        loader.join(5)
+    finally:
+        os.remove(path)
+    assert loader.is_cancelled() and results == []
+    print("✅ PASS: Errors reported and cancellation honoured")
+
+
+def test_saver_replaces_file_and_skips_unchanged():
+    """Saves replace the file atomically and skip identical content"""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "README.md")
+    results = []
+    try:
+        FileSaver(path, "# New\n", results.append, results.append).run()
+        with open(path, 'r', encoding='utf-8') as file:
+            assert file.read() == "# New\n"
+
+        saver = FileSaver(path, "# New\n", results.append, results.append)
+        saver.start()
+        saver.join(5)
+        FileSaver(path, "# Changed\n", results.append, results.append).run()
+        assert results == [True, False, True]
+        assert os.listdir(directory) == ["README.md"]  # No temp files left
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+    print("✅ PASS: Atomic save written and unchanged save skipped")
+
+
+def test_failed_save_is_reported():
+    """A save that cannot be written reports an error"""
+    errors = []
+    path = os.path.join(tempfile.gettempdir(), "missing-dir", "README.md")
+    FileSaver(path, "text", errors.append, errors.append).run()
+    assert len(errors) == 1 and isinstance(errors[0], OSError)
+    print("✅ PASS: Save errors reported")
+
+
+def test_saver_result_can_be_reported_now():
+    """A joined save reports at once, and the posted callback is ignored"""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "README.md")
+    posted = []
+    results = []
+    try:
+        saver = FileSaver(path, "# New\n", results.append, results.append,
+                          post=lambda *call: posted.append(call))
+        saver.start()
+        saver.join(5)
+        assert results == [] and len(posted) == 1
+        saver.report_now()
+        assert results == [True]
+        callback, *args = posted[0]
+        callback(*args)
+        saver.report_now()
+        assert results == [True]
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+    print("✅ PASS: Finished save reported once")
+
+
+def test_save_keeps_symlink_and_mode():
+    """Saving through a symlink replaces its target, keeping its mode"""
+    directory = tempfile.mkdtemp()
+    target = os.path.join(directory, "README.target.md")
+    link = os.path.join(directory, "README.md")
+    results = []
+    try:
+        with open(target, 'w', encoding='utf-8') as file:
+            file.write("# Old\n")
+        os.chmod(target, 0o640)
+        os.symlink(target, link)
+        FileSaver(link, "# New\n", results.append, results.append).run()
+        assert results == [True]
+        assert os.path.islink(link)
+        with open(target, 'r', encoding='utf-8') as file:
+            assert file.read() == "# New\n"
+        assert os.stat(target).st_mode & 0o777 == 0o640
+        assert sorted(os.listdir(directory)) == ["README.md", "README.target.md"]
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+    print("✅ PASS: Symlink and file mode kept")
+
+
+if __name__ == "__main__":
+    test_chunks_match_text_mode_read()
+    test_loader_reports_progress_and_content()
+    test_loader_errors_and_cancel()
+    test_saver_replaces_file_and_skips_unchanged()
+    test_failed_save_is_reported()
+    test_saver_result_can_be_reported_now()
+    test_save_keeps_symlink_and_mode()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the project file tree generator
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.directory_cache import DirectoryCache
+from readme_editor.file_tree import generate_file_tree
+
+
+def make_tree(paths):
+    root = os.path.join(tempfile.mkdtemp(), "project")
+    for path in paths:
+        full = os.path.join(root, path)
+        if path.endswith("/"):
+            os.makedirs(full, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(full), exist_ok=True)
+            open(full, 'w').close()
+    return root
+
+
+def test_tree_layout_and_skips():
+    """Entries are drawn in order and build outputs are skipped"""
+    root = make_tree(["src/app.py", "src/util/helpers.py", "README.md",
+                      "dist/app.whl", "build/lib/", "target/", ".hidden",
+                      "pkg.egg-info/PKG-INFO", "node_modules/x.js"])
+    try:
+        assert generate_file_tree(root) == (
+            "project/\n"
+            "├── README.md\n"
+            "└── src\n"
+            "    ├── app.py\n"
+            "    └── util\n"
+            "        └── helpers.py\n")
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Tree drawn with build outputs skipped")
+
+
+def test_large_directories_are_elided():
+    """Only the first entries of a large directory are listed"""
+    root = make_tree([f"data/file{i:03}.txt" for i in range(120)])
+    try:
+        tree = generate_file_tree(root, max_entries=3)
+        assert tree == (
+            "project/\n"
+            "└── data\n"
+            "    ├── file000.txt\n"
+            "    ├── file001.txt\n"
+            "    ├── file002.txt\n"
+            "    └── … 117 more\n")
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Large directories elided")
+
+
+def test_depth_limit():
+    """Directories deeper than max_depth are listed but not expanded"""
+    root = make_tree(["a/b/c/d.txt"])
+    try:
+        assert generate_file_tree(root, max_depth=1) == (
+            "project/\n└── a\n    └── b\n")
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Depth limit honoured")
+
+
+def test_parallel_scan_matches_serial():
+    """Concurrent subtree scans merge back in sorted order"""
+    root = make_tree([f"pkg{i}/mod{j}/file{k}.py"
+                      for i in range(12) for j in range(3) for k in range(2)]
+                     + ["README.md", "zeta.txt"])
+    try:
+        serial = generate_file_tree(root, workers=1)
+        for _ in range(3):
+            assert generate_file_tree(root, workers=4) == serial
+        assert serial.index("pkg10") < serial.index("pkg2")
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Parallel scan matches serial scan")
+
+
+def test_scan_timeout():
+    """Subtrees not scanned before the timeout are marked"""
+    root = make_tree(["a/one.txt", "b/two.txt"])
+    try:
+        for workers in (1, 4):
+            assert generate_file_tree(root, workers=workers, timeout=0) == (
+                "project/\n"
+                "├── a\n"
+                "│   └── [Scan timed out]\n"
+                "└── b\n"
+                "    └── [Scan timed out]\n")
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Scan timeout marks unfinished subtrees")
+
+
+def age_tree(root, past):
+    """Backdate directory mtimes so cached listings are trusted"""
+    for path, _, _ in os.walk(root):
+        os.utime(path, (past, past))
+
+
+def test_directory_cache_reuses_unchanged_listings():
+    """Only directories whose mtime changed are scanned again"""
+    root = make_tree(["src/app.py", "src/util/helpers.py", "docs/index.md"])
+    cache_file = os.path.join(os.path.dirname(root), "cache.json")
+    try:
+        past = time.time() - 3600
+        age_tree(root, past)
+        cache = DirectoryCache(cache_file)
+        first = generate_file_tree(root, cache=cache)
+        assert cache.misses == 4 and cache.hits == 0
+        cache.save()
+
+        cache = DirectoryCache(cache_file)
+        assert generate_file_tree(root, cache=cache) == first
+        assert cache.misses == 0 and cache.hits == 4
+
+        open(os.path.join(root, "src", "new.py"), 'w').close()
+        os.utime(os.path.join(root, "src"), (past + 1, past + 1))
+        cache = DirectoryCache(cache_file)
+        tree = generate_file_tree(root, cache=cache)
+        assert "new.py" in tree and cache.misses == 1 and cache.hits == 3
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Directory cache reuses unchanged listings")
+
+
+if __name__ == "__main__":
+    test_tree_layout_and_skips()
+    test_large_directories_are_elided()
+    test_depth_limit()
+    test_parallel_scan_matches_serial()
+    test_scan_timeout()
+    test_directory_cache_reuses_unchanged_listings()
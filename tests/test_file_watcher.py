@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script to verify external change detection and section merging
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.file_watcher import FileWatcher
+from readme_editor.markdown_sections import merge_sections
+
+BASE = "# Title\n\nIntro\n## Usage\nRun it.\n## License\nMIT\n"
+
+
+def write(path, text, mtime_ns):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_changes_are_debounced_and_reported_once():
+    """A burst of writes is reported once, after it settles"""
+    handle, path = tempfile.mkstemp(suffix=".md")
+    os.close(handle)
+    try:
+        write(path, BASE, 1_000_000_000)
+        watcher = FileWatcher(debounce=1.0)
+        watcher.watch(path)
+        assert watcher.poll(now=10) is None
+
+        write(path, BASE + "x", 2_000_000_000)
+        assert watcher.poll(now=11) is None        # Change seen
+        write(path, BASE + "xy", 3_000_000_000)
+        assert watcher.poll(now=11.5) is None      # Still changing
+        assert watcher.poll(now=12) is None        # Debouncing
+        state = watcher.poll(now=12.6)
+        assert state is not None and state.size == len(BASE) + 2
+        assert watcher.poll(now=13) is None        # Reported once
+
+        watcher.accept(state)
+        write(path, BASE + "xy", 4_000_000_000)    # Touched, same contents
+        watcher.poll(now=20)
+        assert watcher.poll(now=22) is None
+    finally:
+        os.remove(path)
+    print("✅ PASS: External changes debounced")
+
+
+def test_merge_keeps_both_sides():
+    """Sections changed on one side merge; both-sided changes keep ours"""
+    ours = BASE.replace("Run it.", "Run it carefully.") + "## Notes\nMine\n"
+    theirs = BASE.replace("MIT", "Apache-2.0").replace("Intro", "Generated")
+    merged, conflicts = merge_sections(BASE, ours, theirs)
+    assert merged == ("# Title\n\nGenerated\n## Usage\nRun it carefully.\n"
+                      "## License\nApache-2.0\n## Notes\nMine\n")
+    assert conflicts == []
+
+    theirs = BASE.replace("Run it.", "Run the tool.")
+    merged, conflicts = merge_sections(BASE, ours, theirs)
+    assert "Run it carefully." in merged and conflicts == ["Usage"]
+    print("✅ PASS: Sections merged three ways")
+
+
+def test_merge_deletions():
+    """Sections deleted on one side stay deleted unless changed on the other"""
+    ours = BASE.replace("Run it.", "Run it now.")
+    theirs = BASE.replace("## License\nMIT\n", "")
+    assert merge_sections(BASE, ours, theirs) == (
+        theirs.replace("Run it.", "Run it now."), [])
+
+    ours = BASE.replace("## Usage\nRun it.\n", "")
+    merged, conflicts = merge_sections(BASE, ours, BASE.replace("MIT", "BSD"))
+    assert merged == "# Title\n\nIntro\n## License\nBSD\n" and conflicts == []
+
+    ours = BASE.replace("MIT", "GPL")
+    merged, conflicts = merge_sections(BASE, ours, theirs)
+    assert merged.endswith("## License\nGPL\n") and conflicts == ["License"]
+    print("✅ PASS: Deletions merged")
+
+
+if __name__ == "__main__":
+    test_changes_are_debounced_and_reported_once()
+    test_merge_keeps_both_sides()
+    test_merge_deletions()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Test script to verify glossary generation from Python sources
+"""
+
+import ast
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor import glossary
+from readme_editor.glossary import (
+    MIN_PARALLEL_FILES,
+    GlossaryScanner,
+    collect_glossary_terms,
+    extract_terms,
+    iter_source_files,
+    may_define,
+    scan_glossary_terms,
+)
+
+
+def make_tree(files):
+    root = os.path.join(tempfile.mkdtemp(), "project")
+    for path, text in files.items():
+        full = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, 'w') as file:
+            file.write(text)
+    return root
+
+
+def test_skipped_directories_are_pruned():
+    """Nothing below a skipped or ignored directory is visited"""
+    root = make_tree({
+        ".gitignore": "generated/\n",
+        "app.py": "",
+        "pkg/core.py": "",
+        ".venv/lib/site-packages/dep.py": "",
+        "node_modules/x/y.py": "",
+        "generated/out.py": "",
+        "pkg/tests/test_core.py": "",
+        "notes.txt": "",
+    })
+    visited = []
+    original = os.walk
+
+    def tracking_walk(top, *args, **kwargs):
+        for entry in original(top, *args, **kwargs):
+            visited.append(os.path.relpath(entry[0], root))
+            yield entry
+
+    os.walk = tracking_walk
+    try:
+        files = [os.path.relpath(path, root).replace(os.sep, '/')
+                 for path in iter_source_files(root, exclude=('tests',))]
+    finally:
+        os.walk = original
+        shutil.rmtree(os.path.dirname(root))
+    assert files == ["app.py", "pkg/core.py"], files
+    assert sorted(visited) == [".", "pkg"], visited
+    print("✅ PASS: Skipped, excluded and ignored directories pruned")
+
+
+def test_first_definition_wins():
+    """Terms keep the first docstring found in sorted file order"""
+    root = make_tree({
+        "a.py": 'def run():\n    """Run from a."""\n\nclass Thing:\n    pass\n',
+        "b/b.py": 'def run():\n    """Run from b."""\n\ndef other():\n    """Other."""\n',
+        "broken.py": "def (:\n",
+    })
+    try:
+        terms = scan_glossary_terms(root)
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    assert terms == {"run": "Run from a.", "Thing": "Definition not available.",
+                     "other": "Other."}, terms
+    print("✅ PASS: First definition wins")
+
+
+NESTED_SOURCE = '''
+import sys
+
+def top():
+    """Top level."""
+    def inner():
+        """Inside top."""
+    lambda: [x for x in range(3)]
+
+class Outer:
+    """Outer class."""
+    class Inner:
+        pass
+    async def method(self):
+        """A method."""
+
+if sys.version_info >= (3, 8):
+    def compat():
+        """Conditional."""
+else:
+    def compat():
+        """Fallback."""
+
+try:
+    import fast
+except ImportError:
+    def fast():
+        """Handler body."""
+finally:
+    pass
+
+with open(__file__) as f:
+    def in_with():
+        pass
+
+for i in range(1):
+    while False:
+        def looped():
+            """Loop body."""
+'''
+
+
+def test_shallow_extractor_matches_ast_walk():
+    """Definitions come out in the same order as a full ast.walk"""
+    expected = []
+    for node in ast.walk(ast.parse(NESTED_SOURCE)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            expected.append(node.name)
+    terms = extract_terms(NESTED_SOURCE)
+    assert [name for name, _ in terms] == expected, terms
+    assert ("compat", "Conditional.") in terms and ("fast", "Handler body.") in terms
+
+    shallow = [name for name, _ in extract_terms(NESTED_SOURCE, nested_functions=False)]
+    assert "inner" not in shallow and "method" in shallow and "Inner" in shallow
+    assert not may_define(b"import os\nVALUE = 1\n")
+    assert may_define(b"class A: pass\n")
+    print("✅ PASS: Shallow extractor matches ast.walk")
+
+
+def run_scanner(root, **kwargs):
+    results = {'progress': []}
+    scanner = GlossaryScanner(
+        root, lambda terms: results.setdefault('terms', terms),
+        lambda error: results.setdefault('error', error),
+        lambda done, total: results['progress'].append((done, total)),
+        **kwargs)
+    scanner.start()
+    scanner.join(60)
+    return results
+
+
+def test_parallel_scan_matches_serial():
+    """Process pool results merge so the first definition still wins"""
+    files = {f"pkg{i // 50}/mod{i:04}.py":
+             f'def shared():\n    """Defined in {i}."""\n\n'
+             f'def only_{i}():\n    """Only {i}."""\n'
+             for i in range(MIN_PARALLEL_FILES + 44)}
+    root = make_tree(files)
+    try:
+        expected = scan_glossary_terms(root)
+        results = run_scanner(root, workers=2, chunk_size=16)
+        serial = run_scanner(root, workers=1, chunk_size=16)
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    assert expected["shared"] == "Defined in 0."
+    assert results['terms'] == expected and serial['terms'] == expected
+    total = len(files)
+    assert results['progress'][0] == (0, total)
+    assert results['progress'][-1] == (total, total)
+    print("✅ PASS: Parallel glossary scan matches serial scan")
+
+
+def test_cancelled_scan_reports_nothing():
+    """A cancelled scan calls none of its callbacks"""
+    root = make_tree({"a.py": "def a():\n    pass\n"})
+    calls = []
+    try:
+        scanner = GlossaryScanner(root, calls.append, calls.append,
+                                  lambda *args: calls.append(args))
+        scanner.cancel()
+        scanner.start()
+        scanner.join(10)
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    assert calls == []
+    print("✅ PASS: Cancelled scan reports nothing")
+
+
+def test_collect_glossary_terms_waits_for_scanner():
+    """The blocking helper returns the scanner's terms, or None if cancelled"""
+    root = make_tree({"a.py": 'def a():\n    """First."""\n'})
+    cancelled = threading.Event()
+    try:
+        terms = collect_glossary_terms(root, cancelled)
+        cancelled.set()
+        stopped = collect_glossary_terms(root, cancelled)
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    assert terms == {"a": "First."}
+    assert stopped is None
+    print("✅ PASS: Blocking glossary helper")
+
+
+def test_symbol_index_parses_only_changed_files():
+    """Unchanged files come from the index; edits and deletions are seen"""
+    root = make_tree({"a.py": 'def a():\n    """From a."""\n',
+                      "b.py": 'def b():\n    """From b."""\n',
+                      "c.py": 'class C:\n    pass\n'})
+    index_path = os.path.join(os.path.dirname(root), "symbols.sqlite3")
+    parsed = []
+    original = glossary._parse_chunk
+
+    def tracking_parse(paths):
+        parsed.extend(os.path.basename(path) for path in paths)
+        return original(paths)
+
+    glossary._parse_chunk = tracking_parse
+    try:
+        first = run_scanner(root, index_path=index_path)
+        assert sorted(parsed) == ["a.py", "b.py", "c.py"]
+
+        del parsed[:]
+        assert run_scanner(root, index_path=index_path)['terms'] == first['terms']
+        assert parsed == []
+
+        # A touched file with the same contents is not parsed again
+        os.utime(os.path.join(root, "a.py"), (1, 1))
+        with open(os.path.join(root, "b.py"), 'w') as file:
+            file.write('def b():\n    """Edited b."""\n')
+        os.remove(os.path.join(root, "c.py"))
+        results = run_scanner(root, index_path=index_path)
+        assert parsed == ["b.py"]
+        assert results['terms'] == {"a": "From a.", "b": "Edited b."}
+    finally:
+        glossary._parse_chunk = original
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Symbol index parses only changed files")
+
+
+if __name__ == "__main__":
+    test_skipped_directories_are_pruned()
+    test_first_definition_wins()
+    test_shallow_extractor_matches_ast_walk()
+    test_parallel_scan_matches_serial()
+    test_cancelled_scan_reports_nothing()
+    test_collect_glossary_terms_waits_for_scanner()
+    test_symbol_index_parses_only_changed_files()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script to verify .gitignore matching in the project file tree
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.file_tree import generate_file_tree
+from readme_editor.ignore_rules import IgnoreMatcher, parse_ignore_lines
+
+
+def make_tree(files):
+    root = os.path.join(tempfile.mkdtemp(), "project")
+    for path, text in files.items():
+        full = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, 'w') as file:
+            file.write(text)
+    return root
+
+
+def test_pattern_semantics():
+    """Globs, anchoring, directory-only patterns and negation"""
+    matcher = IgnoreMatcher((("", parse_ignore_lines([
+        "# comment", "", "*.log", "!keep.log", "/root_only.txt",
+        "out/", "docs/**/draft.md", "\\#literal", "cache?",
+    ])),))
+    assert matcher.is_ignored("app.log", False)
+    assert matcher.is_ignored("src/deep/app.log", False)
+    assert not matcher.is_ignored("src/keep.log", False)
+    assert matcher.is_ignored("root_only.txt", False)
+    assert not matcher.is_ignored("src/root_only.txt", False)
+    assert matcher.is_ignored("src/out", True)
+    assert not matcher.is_ignored("src/out", False)
+    assert matcher.is_ignored("docs/draft.md", False)
+    assert matcher.is_ignored("docs/a/b/draft.md", False)
+    assert matcher.is_ignored("#literal", False)
+    assert matcher.is_ignored("cache1", True)
+    assert not matcher.is_ignored("cache12", True)
+    print("✅ PASS: Ignore patterns follow gitignore semantics")
+
+
+def test_tree_honours_ignore_files():
+    """Root, nested and info/exclude rules prune the tree"""
+    root = make_tree({
+        ".gitignore": "generated/\n*.tmp\n",
+        ".git/info/exclude": "local.txt\n",
+        "README.md": "",
+        "local.txt": "",
+        "scratch.tmp": "",
+        "generated/big/file.py": "",
+        "src/app.py": "",
+        "src/.gitignore": "fixtures/\n!important.tmp\n",
+        "src/important.tmp": "",
+        "src/fixtures/data.json": "",
+        "lib/fixtures/data.json": "",
+    })
+    try:
+        assert generate_file_tree(root) == (
+            "project/\n"
+            "├── README.md\n"
+            "├── lib\n"
+            "│   └── fixtures\n"
+            "│       └── data.json\n"
+            "└── src\n"
+            "    ├── app.py\n"
+            "    └── important.tmp\n")
+        assert "generated" in generate_file_tree(root, use_gitignore=False)
+    finally:
+        shutil.rmtree(os.path.dirname(root))
+    print("✅ PASS: Tree honours .gitignore, nested ignores and info/exclude")
+
+
+def test_ignored_directories_are_not_scanned():
+    """Ignored directories are pruned before they are listed"""
+    root = make_tree({".gitignore": "vendor/\n", "vendor/pkg/mod.py": "",
+                      "main.py": ""})
+    scanned = []
+    original = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(os.path.basename(path))
+        return original(path)
+
+    os.scandir = tracking_scandir
+    try:
+        generate_file_tree(root)
+    finally:
+        os.scandir = original
+        shutil.rmtree(os.path.dirname(root))
+    assert scanned == ["project"], scanned
+    print("✅ PASS: Ignored directories pruned")
+
+
+if __name__ == "__main__":
+    test_pattern_semantics()
+    test_tree_honours_ignore_files()
+    test_ignored_directories_are_not_scanned()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script to verify installed-version annotations of dependency sections
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor import installed as installed_module
+from readme_editor.dependencies import ProjectDependencies, format_dependencies, parse_requirement
+from readme_editor.installed import installed_distributions
+
+
+def add_distribution(site, name, version, headers=""):
+    info = os.path.join(site, f"{name.replace('-', '_')}-{version}.dist-info")
+    os.makedirs(info)
+    with open(os.path.join(info, "METADATA"), 'w') as file:
+        file.write(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+                   f"{headers}\nLong description\nLicense: not a header\n")
+
+
+def test_annotations():
+    """Versions, short licenses and summaries are added to requirements"""
+    site = tempfile.mkdtemp()
+    try:
+        add_distribution(site, "Requests", "2.31.0",
+                         "Summary: Python HTTP for Humans.\nLicense: Apache 2.0\n")
+        add_distribution(site, "click", "8.1.7",
+                         "License: Copyright (c) 2014\n        Long license text\n"
+                         "Classifier: License :: OSI Approved :: BSD License\n")
+        installed = installed_distributions([site])
+        dependencies = ProjectDependencies(
+            [parse_requirement("requests>=2"), parse_requirement("Click"),
+             parse_requirement("missing")], [], "pip install -r requirements.txt",
+            "", ["requirements.txt"])
+        content = format_dependencies(dependencies, installed=installed)
+    finally:
+        shutil.rmtree(site)
+    assert "- **requests** >= 2 — installed 2.31.0, Apache 2.0: Python HTTP for Humans." \
+        in content, content
+    assert "- **Click** — installed 8.1.7, BSD License\n" in content, content
+    assert "- **missing** — *not installed*" in content
+    print("✅ PASS: Requirements annotated from installed metadata")
+
+
+def test_scan_cached_per_environment():
+    """The environment is scanned once, and again after an install"""
+    site = tempfile.mkdtemp()
+    scans = []
+    original = installed_module.scan_distributions
+
+    def counting_scan(path):
+        scans.append(path)
+        return original(path)
+
+    installed_module.scan_distributions = counting_scan
+    try:
+        for i in range(2000):
+            add_distribution(site, f"package-{i}", "1.0", "Summary: Filler\n")
+        start = time.perf_counter()
+        first = installed_distributions([site])
+        dependencies = ProjectDependencies(
+            [parse_requirement(f"package-{i}") for i in range(2000)], [],
+            "", "", ["requirements.txt"])
+        format_dependencies(dependencies, installed=first)
+        seconds = time.perf_counter() - start
+        assert installed_distributions([site]) is first
+        assert len(scans) == 1
+        add_distribution(site, "late", "0.1")
+        os.utime(site, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        assert "late" in installed_distributions([site])
+        assert len(scans) == 2
+    finally:
+        installed_module.scan_distributions = original
+        shutil.rmtree(site)
+    assert len(first) == 2000
+    assert seconds < 1.0, seconds
+    print(f"✅ PASS: 2000 installed packages scanned once ({seconds:.2f} s)")
+
+
+if __name__ == "__main__":
+    test_annotations()
+    test_scan_cached_per_environment()
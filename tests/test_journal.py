@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the crash-recovery edit journal
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.journal import EditJournal, find_orphaned_journals, replay_journal
+
+
+def make_journal():
+    directory = tempfile.mkdtemp()
+    return directory, EditJournal(directory)
+
+
+def test_replay_rebuilds_text():
+    """Replaying the snapshot and edits reproduces the document"""
+    directory, journal = make_journal()
+    try:
+        journal.start("# Title\n\nBody\n", "/tmp/README.md")
+        journal.record_change(9, 13, "Text")
+        journal.record_change(0, 0, "<!-- x -->\n")
+        journal.flush()
+
+        session = replay_journal(journal.path)
+        assert session.text == "<!-- x -->\n# Title\n\nText\n"
+        assert session.source_file == "/tmp/README.md"
+        assert session.edit_count == 2 and session.section_ops == []
+    finally:
+        journal.close()
+        shutil.rmtree(directory)
+    print("✅ PASS: Journal replayed")
+
+
+def test_section_edits_are_merged_and_superseded():
+    """Section edits are merged in the buffer and dropped once committed"""
+    directory, journal = make_journal()
+    try:
+        journal.start("")
+        journal.record_section(["Usage"], content="a")
+        journal.record_section(["Usage"], content="ab")
+        journal.record_section([], name="Project")
+        journal.flush()
+        session = replay_journal(journal.path)
+        assert session.section_ops == [
+            {'op': 'section', 'path': ['Usage'], 'content': 'ab'},
+            {'op': 'section', 'path': [], 'name': 'Project'}]
+
+        journal.record_change(0, 0, "# Project\n")  # Structured commit
+        journal.flush()
+        assert replay_journal(journal.path).section_ops == []
+    finally:
+        journal.close()
+        shutil.rmtree(directory)
+    print("✅ PASS: Section edits merged and superseded")
+
+
+def test_snapshot_only_and_torn_records():
+    """Nothing is recovered without edits; a torn last record is ignored"""
+    directory, journal = make_journal()
+    try:
+        journal.start("saved")
+        assert replay_journal(journal.path) is None
+
+        journal.record_change(5, 5, "!")
+        journal.flush()
+        with open(journal.path, 'a', encoding='utf-8') as file:
+            file.write('{"op": "replace", "sta')
+        assert replay_journal(journal.path).text == "saved!"
+
+        journal.close()
+        assert not os.path.exists(journal.path)
+    finally:
+        journal.close()
+        shutil.rmtree(directory)
+    print("✅ PASS: Snapshot-only and torn journals handled")
+
+
+def test_orphaned_journals_exclude_live_editors():
+    """Only journals of editors that are no longer running are recovered"""
+    directory, journal = make_journal()
+    try:
+        journal.start("mine")
+        orphan = os.path.join(directory, "recovery-999999999.jsonl")
+        shutil.copy(journal.path, orphan)
+        assert find_orphaned_journals(directory) == [orphan]
+    finally:
+        journal.close()
+        shutil.rmtree(directory)
+    print("✅ PASS: Orphaned journals found")
+
+
+if __name__ == "__main__":
+    test_replay_rebuilds_text()
+    test_section_edits_are_merged_and_superseded()
+    test_snapshot_only_and_torn_records()
+    test_orphaned_journals_exclude_live_editors()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the memory-mapped heading index used by viewer mode
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.mapped_markdown import MappedMarkdown, index_headings
+from readme_editor.markdown_sections import split_markdown_sections
+
+SAMPLE = """Intro before any heading
+# Título
+Text.
+```
+# not a heading
+```
+## Section\r
+Body.
+#### Deep
+"""
+
+
+def test_index_matches_text_scanner():
+    """Byte offsets line up with the blocks of the text scanner"""
+    data = SAMPLE.encode('utf-8')
+    index = index_headings(data)
+    blocks = split_markdown_sections(SAMPLE)
+    assert [(s.level, s.title) for s in index] == \
+        [(b.level, b.title) for b in blocks]
+    for section, block in zip(index, blocks):
+        assert section.start == len(SAMPLE[:block.start].encode('utf-8'))
+    assert index[-1].end == len(data)
+    print("✅ PASS: Heading index matches text scanner")
+
+
+def test_mapped_sections_decode_ranges():
+    """Only the requested section is decoded, truncated when too large"""
+    handle, path = tempfile.mkstemp(suffix=".md")
+    with os.fdopen(handle, 'wb') as file:
+        file.write(SAMPLE.encode('utf-8'))
+    try:
+        with MappedMarkdown(path) as mapped:
+            assert mapped.size == len(SAMPLE.encode('utf-8'))
+            assert mapped.section_text(1).startswith("# Título\nText.")
+            assert mapped.section_text(2) == "## Section\r\nBody.\n"
+            assert "[Section truncated" in mapped.section_text(1, limit=4)
+    finally:
+        os.remove(path)
+    print("✅ PASS: Section ranges decoded from the mapping")
+
+
+def test_empty_file():
+    """Empty files can be viewed"""
+    handle, path = tempfile.mkstemp(suffix=".md")
+    os.close(handle)
+    try:
+        with MappedMarkdown(path) as mapped:
+            assert len(mapped.sections) == 1
+            assert mapped.section_text(0) == ""
+    finally:
+        os.remove(path)
+    print("✅ PASS: Empty file viewed")
+
+
+if __name__ == "__main__":
+    test_index_matches_text_scanner()
+    test_mapped_sections_decode_ranges()
+    test_empty_file()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that importing markdown into the structured template
+keeps unknown headings and round-trips byte-for-byte
+"""
+
+import os
+import sys
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.markdown_sections import changed_range
+from readme_editor.structured_template import (
+    create_readme_template,
+    export_markdown,
+    import_markdown,
+    iter_sections,
+    patch_imported_markdown,
+)
+
+SAMPLE = """<!-- badges -->
+# Sample Project
+
+A short description.
+
+## Installation
+
+Run the installer:
+
+```bash
+# this is a comment, not a heading
+pip install sample
+```
+
+### Troubleshooting
+
+Unknown subsection.
+
+## Custom Section
+Text right under the heading.
+#### Deep heading
+Skipped a level.
+"""
+
+
+def round_trip(text):
+    root = create_readme_template()
+    import_markdown(text, root)
+    return export_markdown(root), root
+
+
+def find(root, name):
+    return next(s for s in iter_sections(root) if s.name == name and s.enabled)
+
+
+def test_round_trip_is_byte_for_byte():
+    """Markdown -> structure -> markdown reproduces the input exactly"""
+    for text in [SAMPLE, "", "No headings at all\n", "# Title",
+                 "## Starts at H2\r\n\r\nWindows line endings\r\n",
+                 SAMPLE.replace("\n", "\r\n")]:
+        output, _ = round_trip(text)
+        assert output == text, f"Round trip changed {text!r}"
+    print("✅ PASS: Round trip preserved every byte")
+
+
+def test_unknown_headings_become_dynamic_sections():
+    """Headings missing from the template are kept at the right depth"""
+    _, root = round_trip(SAMPLE)
+
+    assert root.name == "Sample Project"
+    assert root.content == "A short description."
+
+    installation = find(root, "Installation")
+    assert not installation.dynamic
+
+    troubleshooting = find(root, "Troubleshooting")
+    assert troubleshooting.dynamic
+    assert troubleshooting.parent is installation
+    assert troubleshooting.level == 3
+    assert "pip install sample" in installation.content
+
+    custom = find(root, "Custom Section")
+    assert custom.dynamic and custom.parent is root
+    deep = find(root, "Deep heading")
+    assert deep.parent is custom and deep.level == 4
+    print("✅ PASS: Unknown headings imported as dynamic sections")
+
+
+def test_missing_template_sections_are_disabled():
+    """Template sections that are not in the document do not get exported"""
+    _, root = round_trip(SAMPLE)
+    enabled = [s.name for s in iter_sections(root) if s.enabled]
+    assert "License" not in enabled
+    assert "Usage" not in enabled
+    print("✅ PASS: Missing template sections disabled")
+
+
+def test_generated_table_of_contents_stays_automatic():
+    """An auto-generated table of contents is regenerated, not frozen"""
+    root = create_readme_template()
+    import_markdown("# P\n\n## Table of contents\n\n## Usage\n\n### Setup\n", root)
+    toc = root.generate_table_of_contents()
+    text = f"# P\n\n## Table of contents\n\n{toc}\n\n## Usage\n\n### Setup\n"
+
+    output, root = round_trip(text)
+    assert output == text
+    assert find(root, "Table of contents").content == ""
+    print("✅ PASS: Generated table of contents detected")
+
+
+def test_empty_table_of_contents_stays_empty():
+    """An imported empty table of contents is not filled in on export"""
+    text = "## Table of contents\n\n## Installation\n\nRun it.\n"
+    output, root = round_trip(text)
+    assert output == text, f"Round trip changed {text!r} to {output!r}"
+    assert find(root, "Table of contents").content == ""
+    print("✅ PASS: Empty table of contents kept")
+
+
+def test_edits_after_import_are_exported():
+    """Edited content and renamed headings are reflected in the export"""
+    _, root = round_trip(SAMPLE)
+    find(root, "Custom Section").content = "Replaced."
+    find(root, "Troubleshooting").name = "Problems"
+
+    output = export_markdown(root)
+    assert "## Custom Section\nReplaced.\n#### Deep heading" in output
+    assert "### Problems\n" in output
+    print("✅ PASS: Edits exported")
+
+
+def test_patch_updates_only_changed_sections():
+    """Body-only edits are patched in place without a re-import"""
+    root = create_readme_template()
+    sections = import_markdown(SAMPLE, root)
+    edited = SAMPLE.replace("Unknown subsection.", "Now documented.")
+
+    changed = patch_imported_markdown(root, sections, SAMPLE, edited)
+    assert changed == [find(root, "Troubleshooting")]
+    assert find(root, "Troubleshooting").content == "Now documented."
+    assert export_markdown(root) == edited
+
+    # Adding a heading changes the structure, so a full import is needed
+    assert patch_imported_markdown(root, sections, edited,
+                                   edited + "## New\n") is None
+    print("✅ PASS: Changed sections patched in place")
+
+
+def test_export_sections_line_up_with_blocks():
+    """Sections collected during export can be used to patch the output"""
+    _, root = round_trip(SAMPLE)
+    license_section = next(s for s in iter_sections(root) if s.name == "License")
+    license_section.enabled = True  # Exported with the standard layout
+    sections = []
+    exported = export_markdown(root, sections=sections)
+
+    edited = exported.replace("Skipped a level.", "Changed.")
+    changed = patch_imported_markdown(root, sections, exported, edited)
+    assert changed == [find(root, "Deep heading")]
+    print("✅ PASS: Export blocks line up with sections")
+
+
+def test_changed_range():
+    """Only the differing middle of two texts is reported"""
+    assert changed_range("abcdef", "abXYef") == (2, 4, 4)
+    assert changed_range("abc", "abc") == (3, 3, 3)
+    assert changed_range("aaa", "aaaa") == (3, 3, 4)
+    assert changed_range("", "new") == (0, 0, 3)
+    print("✅ PASS: Changed range computed")
+
+
+if __name__ == "__main__":
+    test_round_trip_is_byte_for_byte()
+    test_unknown_headings_become_dynamic_sections()
+    test_missing_template_sections_are_disabled()
+    test_generated_table_of_contents_stays_automatic()
+    test_empty_table_of_contents_stays_empty()
+    test_edits_after_import_are_exported()
+    test_patch_updates_only_changed_sections()
+    test_export_sections_line_up_with_blocks()
+    test_changed_range()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script to verify .readmeproj project files keep the full structure
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.project_file import load_project, save_project
+from readme_editor.structured_template import (
+    create_readme_template,
+    export_markdown,
+    import_markdown,
+    iter_sections,
+)
+
+
+def describe(root):
+    return [(s.name, s.level, s.optional, s.enabled, s.dynamic, s.content,
+             s.source_heading, s.source_padding, s.source_preamble,
+             s.parent and s.parent.name) for s in iter_sections(root)]
+
+
+def round_trip(root):
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "project.readmeproj")
+        save_project(path, root)
+        return load_project(path)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_template_state_is_preserved():
+    """Enabled flags, optional flags and disabled content survive a save"""
+    root = create_readme_template()
+    root.name = "Tool"
+    sections = list(iter_sections(root))
+    sections[3].enabled = False
+    sections[3].content = "Kept while disabled"
+    sections[5].content = "Ünïcode\nand lines"
+
+    loaded = round_trip(root)
+    assert describe(loaded) == describe(root)
+    print("✅ PASS: Template state preserved")
+
+
+def test_imported_tree_exports_identically():
+    """Imported formatting is kept, so the markdown export is unchanged"""
+    text = "<!-- top -->\n# Name\n\nIntro\n\n## Custom\r\nBody\n####   Deep  #\n## Last"
+    root = create_readme_template()
+    import_markdown(text, root)
+
+    loaded = round_trip(root)
+    assert describe(loaded) == describe(root)
+    assert export_markdown(loaded) == text
+    print("✅ PASS: Imported tree exported identically")
+
+
+def test_invalid_files_are_rejected():
+    """Files that are not project files raise ValueError"""
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "bad.readmeproj")
+        for data in ["", "# Markdown\n", '{"format": "readmeproj", "version": 99}\n',
+                     '{"format": "readmeproj", "version": 1}\n[2, 1, "x"]\n']:
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(data)
+            try:
+                load_project(path)
+            except ValueError:
+                continue
+            raise AssertionError(f"Accepted {data!r}")
+    finally:
+        shutil.rmtree(directory)
+    print("✅ PASS: Invalid project files rejected")
+
+
+if __name__ == "__main__":
+    test_template_state_is_preserved()
+    test_imported_tree_exports_identically()
+    test_invalid_files_are_rejected()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script to verify session snapshots and section tree restoring
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.markdown_sections import split_markdown_sections
+from readme_editor.session import file_stamp, load_session, save_session
+from readme_editor.structured_template import (
+    create_readme_template,
+    export_markdown,
+    import_markdown,
+    iter_sections,
+    restore_sections,
+    snapshot_sections,
+)
+
+SAMPLE = """<!-- badges -->
+# Sample Project
+
+A short description.
+
+## Installation
+
+```bash
+# not a heading
+pip install sample
+```
+
+### Troubleshooting
+
+Unknown subsection.
+
+## License
+MIT
+"""
+
+
+def describe(root):
+    return [(s.name, s.level, s.enabled, s.dynamic, s.content, s.source_heading,
+             s.source_padding, s.source_preamble, s.parent and s.parent.name)
+            for s in iter_sections(root)]
+
+
+def test_restored_tree_matches_import():
+    """A tree restored from offsets is identical to a fresh import"""
+    for text in [SAMPLE, "", "No headings\n", "## Starts at H2\r\n\r\nText\r\n"]:
+        root = create_readme_template()
+        sections = import_markdown(text, root)
+        entries = snapshot_sections(root, sections, split_markdown_sections(text))
+        entries = json.loads(json.dumps(entries))
+
+        restored, restored_sections = restore_sections(entries, text)
+        assert describe(restored) == describe(root)
+        assert [s.name for s in restored_sections] == [s.name for s in sections]
+        assert export_markdown(restored) == text
+    print("✅ PASS: Restored tree matches import")
+
+
+def test_stale_files_are_dropped():
+    """Files changed since the snapshot are not restored"""
+    directory = tempfile.mkdtemp()
+    try:
+        readme = os.path.join(directory, "README.md")
+        with open(readme, 'w', encoding='utf-8') as file:
+            file.write(SAMPLE)
+        session_path = os.path.join(directory, "session.json")
+        save_session(session_path, {'files': [dict(file_stamp(readme), path=readme)]})
+
+        assert load_session(session_path)['files'][0]['path'] == readme
+
+        with open(readme, 'a', encoding='utf-8') as file:
+            file.write("More\n")
+        assert load_session(session_path)['files'] == []
+
+        with open(session_path, 'w', encoding='utf-8') as file:
+            json.dump({'format': 0, 'files': []}, file)
+        assert load_session(session_path) is None
+    finally:
+        shutil.rmtree(directory)
+    print("✅ PASS: Stale and old-format sessions ignored")
+
+
+if __name__ == "__main__":
+    test_restored_tree_matches_import()
+    test_stale_files_are_dropped()
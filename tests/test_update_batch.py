@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batched tree, title and preview updates
+"""
+
+import os
+import sys
+
+# Add the source directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from readme_editor.update_batch import MODIFIED, TITLE, TREE, UpdateBatch
+
+
+def make_batch():
+    flushes = []
+    batch = UpdateBatch(lambda updates, status: flushes.append((updates, status)))
+    return batch, flushes
+
+
+def test_unbatched_requests_flush_at_once():
+    """Outside a batch every request is applied immediately"""
+    batch, flushes = make_batch()
+    batch.request(TREE, MODIFIED, status="Section enabled")
+    batch.request(MODIFIED)
+    assert flushes == [({TREE, MODIFIED}, "Section enabled"), ({MODIFIED}, None)]
+    print("✅ PASS: Unbatched requests flush at once")
+
+
+def test_nested_batches_flush_once():
+    """Any number of changes in nested batches flush together at the end"""
+    batch, flushes = make_batch()
+    with batch:
+        for _ in range(100):
+            batch.request(TREE, MODIFIED)
+        with batch:
+            batch.request(MODIFIED, TITLE, status="first")
+        assert batch.active and flushes == []
+        batch.request(MODIFIED, status="last")
+    assert not batch.active
+    assert flushes == [({TREE, MODIFIED, TITLE}, "last")]
+    with batch:
+        pass
+    assert len(flushes) == 1
+    print("✅ PASS: Nested batches flush once")
+
+
+def test_flush_after_error_and_during_flush():
+    """Changes before an exception are still shown; requests made while
+    flushing are applied after the flush, not inside it"""
+    calls = []
+
+    def flush(updates, status):
+        calls.append(updates)
+        if TREE in updates:
+            batch.request(MODIFIED)  # e.g. a selection event from the rebuild
+            assert len(calls) == 1
+
+    batch = UpdateBatch(flush)
+    try:
+        with batch:
+            batch.request(TREE)
+            raise ValueError
+    except ValueError:
+        pass
+    assert calls == [{TREE}, {MODIFIED}]
+    print("✅ PASS: Batches flush after errors and re-entrant requests")
+
+
+if __name__ == "__main__":
+    test_unbatched_requests_flush_at_once()
+    test_nested_batches_flush_once()
+    test_flush_after_error_and_during_flush()